@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+
+"""Hot path benchmarks for the pcards package.
+
+Library Release 1.2
+
+Copyright 2013 Paul Griffiths
+Email: mail@paulgriffiths.net
+
+Distributed under the terms of the GNU General Public License.
+http://www.gnu.org/licenses/
+
+"""
+
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections import OrderedDict
+
+from pcards import Card, Deck, Hand, PokerHand
+
+
+# Non-public constants
+
+# A representative hand for each poker hand category, best first.
+
+_CATEGORY_HANDS = OrderedDict([
+    ("RF", ["AS", "KS", "QS", "JS", "TS"]),
+    ("SF", ["9H", "8H", "7H", "6H", "5H"]),
+    ("FK", ["7C", "7D", "7H", "7S", "2C"]),
+    ("FH", ["KC", "KD", "KH", "3S", "3C"]),
+    ("FL", ["AD", "JD", "8D", "5D", "2D"]),
+    ("ST", ["9C", "8D", "7H", "6S", "5C"]),
+    ("TK", ["QC", "QD", "QH", "9S", "4C"]),
+    ("TP", ["JC", "JD", "6H", "6S", "2C"]),
+    ("PR", ["TC", "TD", "8H", "5S", "3C"]),
+    ("HI", ["KC", "JD", "8H", "5S", "3C"])
+])
+
+_DEFAULT_REPEAT = 5
+_DEFAULT_THRESHOLD = 0.10
+
+
+# Non-public functions
+
+def _card_from_name():
+
+    """Returns a function parsing a card from its name."""
+
+    return lambda: Card(name="QH")
+
+
+def _deck_init():
+
+    """Returns a function creating a single pack deck."""
+
+    return Deck
+
+
+def _deck_shuffle():
+
+    """Returns a function shuffling a single pack deck."""
+
+    deck = Deck()
+    return deck.shuffle
+
+
+def _deck_draw():
+
+    """Returns a function drawing and discarding five cards from
+    an eight pack shoe, replacing the discards when it runs low.
+
+    """
+
+    deck = Deck(8)
+
+    def draw():
+
+        """Draws and discards five cards."""
+
+        deck.discard(deck.draw(5))
+        if len(deck) < 5:
+            deck.replace_discards()
+
+    return draw
+
+
+def _hand_copy():
+
+    """Returns a function copying a five card hand."""
+
+    hand = Hand(namelist=_CATEGORY_HANDS["HI"])
+    return hand.copy
+
+
+def _pokerhand_init():
+
+    """Returns a function creating a poker hand from card names."""
+
+    names = _CATEGORY_HANDS["TP"]
+    return lambda: PokerHand(namelist=names)
+
+
+def _pokerhand_evaluate(category):
+
+    """Returns a function evaluating a poker hand of a category."""
+
+    def factory():
+
+        """Returns the evaluation method of a poker hand."""
+
+        # Disable pylint message for access to protected member
+        # PokerHand._evaluate(), the method being measured.
+        #
+        # pylint: disable=W0212
+
+        return PokerHand(namelist=_CATEGORY_HANDS[category])._evaluate
+
+    return factory
+
+
+def _pokerhand_seven():
+
+    """Returns a function evaluating a seven card poker hand."""
+
+    hand = PokerHand(namelist=["AS", "KD", "9H", "9C", "5S", "4S", "2S"])
+
+    # pylint: disable=W0212
+
+    return hand._evaluate
+
+
+def _pokerhand_compare():
+
+    """Returns a function comparing two poker hands."""
+
+    first = PokerHand(namelist=_CATEGORY_HANDS["TP"])
+    second = PokerHand(namelist=_CATEGORY_HANDS["PR"])
+    return lambda: first > second and first != second
+
+
+def _benchmarks():
+
+    """Returns an ordered dictionary mapping benchmark names to
+    functions which return the function to be timed.
+
+    """
+
+    benchmarks = OrderedDict([
+        ("card_from_name", _card_from_name),
+        ("deck_init", _deck_init),
+        ("deck_shuffle", _deck_shuffle),
+        ("deck_draw", _deck_draw),
+        ("hand_copy", _hand_copy),
+        ("pokerhand_init", _pokerhand_init)
+    ])
+    for category in _CATEGORY_HANDS:
+        benchmarks["pokerhand_evaluate_" + category] = \
+            _pokerhand_evaluate(category)
+    benchmarks["pokerhand_evaluate_seven"] = _pokerhand_seven
+    benchmarks["pokerhand_compare"] = _pokerhand_compare
+    return benchmarks
+
+
+# Public functions
+
+def run(names=None, repeat=_DEFAULT_REPEAT):
+
+    """Runs the benchmarks and returns an ordered dictionary mapping
+    each benchmark name to the best time per call, in seconds.
+
+    Arguments:
+    names -- a list of benchmark names, or None to run them all.
+    repeat -- the number of timing runs for each benchmark, of which
+    the fastest is reported.
+
+    Exceptions raised:
+    ValueError -- if a benchmark name is not recognized.
+
+    """
+
+    benchmarks = _benchmarks()
+    if names is None:
+        names = list(benchmarks)
+    for name in names:
+        if name not in benchmarks:
+            raise ValueError("Unknown benchmark '{0}'".format(name))
+
+    results = OrderedDict()
+    for name in names:
+        timer = timeit.Timer(benchmarks[name]())
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number))
+        results[name] = best / number
+    return results
+
+
+def compare(results, baseline, threshold=_DEFAULT_THRESHOLD):
+
+    """Returns a list of (name, baseline time, current time, ratio)
+    tuples for the benchmarks which are slower than the baseline by
+    more than the threshold, expressed as a fraction.
+
+    """
+
+    regressions = []
+    for name, seconds in results.items():
+        if name in baseline:
+            ratio = seconds / baseline[name]
+            if ratio > 1 + threshold:
+                regressions.append((name, baseline[name], seconds, ratio))
+    return regressions
+
+
+def main():
+
+    """Main function."""
+
+    parser = argparse.ArgumentParser(description="Run pcards benchmarks.")
+    parser.add_argument("names", nargs="*",
+                        help="benchmarks to run, default all")
+    parser.add_argument("--list", action="store_true",
+                        help="list the benchmark names and exit")
+    parser.add_argument("--repeat", type=int, default=_DEFAULT_REPEAT,
+                        help="timing runs per benchmark")
+    parser.add_argument("--save", metavar="FILE",
+                        help="save the results as a baseline file")
+    parser.add_argument("--compare", metavar="FILE",
+                        help="compare the results with a baseline file")
+    parser.add_argument("--threshold", type=float,
+                        default=_DEFAULT_THRESHOLD,
+                        help="slowdown treated as a regression, " +
+                        "as a fraction (default 0.10)")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(_benchmarks()))
+        return 0
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as infile:
+            baseline = json.load(infile)["results"]
+
+    results = run(args.names or None, args.repeat)
+    for name, seconds in results.items():
+        line = "{0:<28} {1:>10.3f} us".format(name, seconds * 1e6)
+        if baseline and name in baseline:
+            line += "  {0:>+7.1%}".format(seconds / baseline[name] - 1)
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as outfile:
+            json.dump({"python": platform.python_version(),
+                       "machine": platform.machine(),
+                       "results": results}, outfile, indent=2)
+            outfile.write("\n")
+
+    if baseline:
+        regressions = compare(results, baseline, args.threshold)
+        for name, old, new, ratio in regressions:
+            print("REGRESSION {0}: {1:.3f} us -> {2:.3f} us ({3:.2f}x)"
+                  .format(name, old * 1e6, new * 1e6, ratio))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""Import time benchmark for the pcards package.
+
+Library Release 1.2
+
+Copyright 2013 Paul Griffiths
+Email: mail@paulgriffiths.net
+
+Distributed under the terms of the GNU General Public License.
+http://www.gnu.org/licenses/
+
+"""
+
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+# Non-public constants
+
+# Modules which should not be loaded by a plain 'import pcards'.
+
+_GUI_MODULES = ["tkinter", "PIL"]
+
+# Run in a fresh interpreter to time the import and report which
+# of the GUI modules it loaded.
+
+_IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import pcards
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, [name for name in {0!r} if name in sys.modules]]))
+""".format(_GUI_MODULES)
+
+
+# Public functions
+
+def time_import(runs=10):
+
+    """Returns a tuple of a list of the times in seconds taken to
+    import pcards in each of a number of fresh interpreters, and a
+    sorted list of the GUI modules loaded by any of the imports.
+
+    """
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+
+    times = []
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c",
+                                          _IMPORT_SCRIPT], env=env)
+        elapsed, modules = json.loads(output.decode())
+        times.append(elapsed)
+        loaded.update(modules)
+    return (times, sorted(loaded))
+
+
+def main():
+
+    """Main function."""
+
+    parser = argparse.ArgumentParser(description="Time 'import pcards'.")
+    parser.add_argument("--runs", type=int, default=10,
+                        help="number of fresh interpreters to time")
+    args = parser.parse_args()
+
+    times, loaded = time_import(args.runs)
+    print("import pcards: min {0:.1f} ms, median {1:.1f} ms ({2} runs)"
+          .format(min(times) * 1000, statistics.median(times) * 1000,
+                  len(times)))
+    if loaded:
+        print("GUI modules loaded: {0}".format(", ".join(loaded)))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,13 +8,54 @@ http://www.gnu.org/licenses/
 
 """
 
+import importlib
+
 from .base.card import Card, CardArgumentError, rank_string, suit_string
-from .base.card import get_rank_integer, get_suit_integer
+from .base.card import cards_string
+from .base.card import get_rank_integer, get_suit_integer, parse_cards
 from .base.card import CLUBS, HEARTS, SPADES, DIAMONDS
 from .base.card import ACE, TWO, THREE, FOUR, FIVE, SIX, SEVEN
 from .base.card import EIGHT, NINE, TEN, JACK, QUEEN, KING
-from .base.deck import Deck, EmptyDeckError
+from .base.deck import Deck, EmptyDeckError, spawn_seeds
 from .base.hand import Hand, NoAssociatedDeckError
 from .base.pokerhand import PokerHand
-from .cardimages.cardimages import CardImagesSmall, CardImagesLarge
-from .widgets.cardhandwidget import CardHandWidget
+from .base.cardmask import CardMask, FULL_MASK
+from .base.cardmask import indices_to_mask, mask_to_indices
+from .base.evaluator import evaluate, best_five, rank_category, WORST_RANK
+from .base.equity import equity, exact_equity, EquityResult
+from .base.combinatorics import canonical_id, canonical_indices
+from .base.combinatorics import canonical_count, canonical_from_id
+from .base.combinatorics import colex_combinations
+from .base.combinatorics import combination_rank, combination_from_rank
+
+
+# The card image and widget classes require tkinter, so they are
+# only imported when first used, and importing the package for
+# evaluation alone does not load tkinter.
+
+_LAZY_ATTRIBUTES = {
+    "CardImagesSmall": ".cardimages.cardimages",
+    "CardImagesLarge": ".cardimages.cardimages",
+    "CardHandWidget": ".widgets.cardhandwidget"
+}
+
+
+def __getattr__(name):
+
+    """Imports and returns a tkinter dependent class on first access."""
+
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError("module '{0}' has no attribute '{1}'"
+                             .format(__name__, name))
+
+    module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+
+    """Returns the package attributes, including lazy ones."""
+
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -60,6 +60,11 @@ _RANK_LONG_STRINGS = {
 }
 _SUIT_LONG_STRINGS = ["clubs", "hearts", "spades", "diamonds"]
 
+# Flags combined by _string_form() to select a string table.
+
+_CAPITALIZE = 1
+_SHORT = 2
+
 
 # Public functions
 
@@ -67,21 +72,16 @@ def get_rank_integer(rank):
 
     """Returns a valid integer rank from an input of unspecified type."""
 
-    if rank in range(1, 15):
+    if isinstance(rank, str):
+        value = _RANK_TOKENS.get(rank)
+        if value is None:
+            if not rank:
+                raise ValueError("Missing rank value.")
+            value = _RANK_TOKENS.get(rank.lower())
+        if value is not None:
+            return value
+    elif rank in range(1, 15):
         return 14 if rank == 1 else rank
-    elif isinstance(rank, str):
-        if not rank:
-            raise ValueError("Missing rank value.")
-
-        # Added to avoid ambiguity with 'two' and 'three'
-        # when short name is used.
-
-        if rank == 't' or rank == 'T':
-            return 10
-
-        for key in _ALLOWABLE_RANK_STRINGS.keys():
-            if key.startswith(rank.lower()):
-                return _ALLOWABLE_RANK_STRINGS[key]
 
     raise ValueError("Invalid rank value '{0}'".format(rank))
 
@@ -90,19 +90,41 @@ def get_suit_integer(suit):
 
     """Returns a valid integer suit from an input of unspecified type."""
 
-    if suit in range(0, 4):
+    if isinstance(suit, str):
+        value = _SUIT_TOKENS.get(suit)
+        if value is None:
+            if not suit:
+                raise ValueError("Missing suit value.")
+            value = _SUIT_TOKENS.get(suit.lower())
+        if value is not None:
+            return value
+    elif suit in range(0, 4):
         return suit
-    elif isinstance(suit, str):
-        if not suit:
-            raise ValueError("Missing suit value.")
-
-        for key in _ALLOWABLE_SUIT_STRINGS.keys():
-            if key.startswith(suit.lower()):
-                return _ALLOWABLE_SUIT_STRINGS[key]
 
     raise ValueError("Invalid suit value '{0}'".format(suit))
 
 
+def parse_cards(names):
+
+    """Returns a list of card indices from a string of short card
+    names separated by whitespace and/or commas, e.g. "AS KD 10H",
+    without creating any Card instances.
+
+    Exceptions raised:
+    ValueError -- if any of the names is invalid.
+
+    """
+
+    name_indices = _NAME_INDICES
+    indices = []
+    for name in names.replace(",", " ").split():
+        index = name_indices.get(name)
+        if index is None:
+            index = _get_index_from_name(name)
+        indices.append(index)
+    return indices
+
+
 def rank_string(rank, short=False, capitalize=False):
 
     """Returns a string representing a specified rank,
@@ -123,15 +145,7 @@ def rank_string(rank, short=False, capitalize=False):
     if rank not in range(1, 15):
         raise ValueError("Invalid rank value '{0}'".format(rank))
 
-    if short:
-        outstr = _RANK_SHORT_STRINGS[rank]
-    else:
-        outstr = _RANK_LONG_STRINGS[rank]
-
-    if capitalize:
-        outstr = outstr.capitalize()
-
-    return outstr
+    return _RANK_STRINGS[_string_form(short, capitalize)][rank]
 
 
 def suit_string(suit, short=False, capitalize=False):
@@ -153,15 +167,22 @@ def suit_string(suit, short=False, capitalize=False):
     if suit not in range(0, 4):
         raise ValueError("Invalid suit value '{0}'".format(suit))
 
-    if short:
-        outstr = _SUIT_LONG_STRINGS[suit][0].upper()
-    else:
-        outstr = _SUIT_LONG_STRINGS[suit]
+    return _SUIT_STRINGS[_string_form(short, capitalize)][suit]
 
-    if capitalize:
-        outstr = outstr.capitalize()
 
-    return outstr
+def cards_string(indices, separator=" "):
+
+    """Returns a string of the short names of a sequence of card
+    indices, e.g. "AS KD TH", the reverse of parse_cards().
+
+    Arguments:
+    indices -- a sequence of valid card indices.
+    separator -- the string to place between the names.
+
+    """
+
+    names = _NAME_STRINGS[_SHORT]
+    return separator.join([names[index] for index in indices])
 
 
 # Non-public functions
@@ -206,7 +227,7 @@ def _get_rank_and_suit_from_name(name):
 
     """
 
-    return (get_rank_integer(name[0:-1]), get_suit_integer(name[-1]))
+    return _INDEX_RANKS_SUITS[_get_index_from_name(name)]
 
 
 def _get_index_from_name(name):
@@ -216,10 +237,177 @@ def _get_index_from_name(name):
 
     """
 
-    rank = get_rank_integer(name[0:-1])
-    suit = get_suit_integer(name[-1])
+    index = _NAME_INDICES.get(name)
+    if index is None:
+        rank = get_rank_integer(name[0:-1])
+        suit = get_suit_integer(name[-1])
+        index = _get_index_from_rank_and_suit(rank, suit)
+    return index
+
+
+def _card_indices(cards):
+
+    """Returns a list of card indices from a Hand instance, or from
+    a sequence of Card instances, short names (e.g. "AS", "TD") or
+    card indices. None is treated as an empty sequence.
+
+    """
+
+    if cards is None:
+        return []
+    elif hasattr(cards, "index_list"):
+
+        # Hands are recognized by their index_list() method, since
+        # the hand module imports this one.
+
+        return cards.index_list()
+
+    indices = []
+    for card in cards:
+        if isinstance(card, Card):
+            indices.append(card.index())
+        elif isinstance(card, str):
+            indices.append(_get_index_from_name(card))
+        elif card in range(0, 52):
+            indices.append(card)
+        else:
+            raise ValueError("Invalid card value '{0}'".format(card))
+    return indices
+
+
+def _string_form(short, capitalize):
+
+    """Returns the position in the string tables of the strings
+    for a combination of the short and capitalize arguments.
+
+    """
+
+    return (_SHORT if short else 0) + (_CAPITALIZE if capitalize else 0)
 
-    return _get_index_from_rank_and_suit(rank, suit)
+
+def _make_rank_string(rank, short, capitalize):
+
+    """Returns a string representing a valid rank."""
+
+    if short:
+        outstr = _RANK_SHORT_STRINGS[rank]
+    else:
+        outstr = _RANK_LONG_STRINGS[rank]
+
+    if capitalize:
+        outstr = outstr.capitalize()
+
+    return outstr
+
+
+def _make_suit_string(suit, short, capitalize):
+
+    """Returns a string representing a valid suit."""
+
+    if short:
+        outstr = _SUIT_LONG_STRINGS[suit][0].upper()
+    else:
+        outstr = _SUIT_LONG_STRINGS[suit]
+
+    if capitalize:
+        outstr = outstr.capitalize()
+
+    return outstr
+
+
+def _make_name_string(index, short, capitalize):
+
+    """Returns a string representing the name of a valid index."""
+
+    rank, suit = _get_rank_and_suit_from_index(index)
+    return (_make_rank_string(rank, short, capitalize) +
+            ("" if short else " of ") +
+            _make_suit_string(suit, short, capitalize))
+
+
+def _name_table():
+
+    """Returns a dictionary mapping each short card name, in upper,
+    lower or mixed case, to its index.
+
+    """
+
+    names = {}
+    for rank in ["a", "2", "3", "4", "5", "6", "7", "8", "9",
+                 "t", "10", "j", "q", "k"]:
+        for suit in "chsd":
+            index = _get_index_from_rank_and_suit(_RANK_TOKENS[rank],
+                                                  _SUIT_TOKENS[suit])
+            for name in (rank + suit, rank.upper() + suit,
+                         rank + suit.upper(), rank.upper() + suit.upper()):
+                names[name] = index
+    return names
+
+
+def _token_table(strings):
+
+    """Returns a dictionary mapping each accepted spelling of a
+    rank or suit string to its value, from a dictionary of the full
+    strings in order of precedence.
+
+    Every starting substring of each string is accepted, and where
+    a substring starts more than one string (e.g. "t" for "two",
+    "three" and "ten") the first string takes precedence, so that
+    a lookup gives the same result as checking each string in turn.
+    Lower case, upper case and capitalized forms are all included,
+    so that the common spellings are found without conversion.
+
+    """
+
+    lower_tokens = {}
+    for string, value in strings.items():
+        for length in range(1, len(string) + 1):
+            lower_tokens.setdefault(string[0:length], value)
+
+    tokens = {}
+    for token, value in lower_tokens.items():
+        for form in (token, token.upper(), token.capitalize()):
+            tokens.setdefault(form, value)
+    return tokens
+
+
+# Rank and suit for each card index, so that cards can be created
+# and copied from an index without validation or arithmetic.
+
+_INDEX_RANKS_SUITS = [_get_rank_and_suit_from_index(idx)
+                      for idx in range(52)]
+
+# Tables of every accepted spelling of a rank or suit, and of every
+# short card name, e.g. "AS", "as", "10d", "TD", so that strings can
+# be parsed with a single lookup. "t" is taken to mean ten rather
+# than two or three, and "10" is accepted as a short name for ten.
+
+_RANK_TOKENS = _token_table(_ALLOWABLE_RANK_STRINGS)
+_RANK_TOKENS.update({"t": 10, "T": 10, "10": 10})
+_SUIT_TOKENS = _token_table(_ALLOWABLE_SUIT_STRINGS)
+
+_NAME_INDICES = _name_table()
+
+# Rank, suit and card name strings, indexed first by the value of
+# _string_form() for the short and capitalize arguments, and then by
+# rank, suit or card index respectively, so that cards can be shown
+# without building any strings. The names padded to four characters
+# are used to show hands, e.g. "  AS 10D".
+
+_RANK_STRINGS = [[None] + [_make_rank_string(rank, form & _SHORT,
+                                             form & _CAPITALIZE)
+                           for rank in range(1, 15)]
+                 for form in range(4)]
+_SUIT_STRINGS = [[_make_suit_string(suit, form & _SHORT,
+                                    form & _CAPITALIZE)
+                  for suit in range(4)]
+                 for form in range(4)]
+_NAME_STRINGS = [[_make_name_string(index, form & _SHORT,
+                                    form & _CAPITALIZE)
+                  for index in range(52)]
+                 for form in range(4)]
+_PADDED_SHORT_NAMES = [" {0:>3}".format(name)
+                       for name in _NAME_STRINGS[_SHORT]]
 
 
 # Exceptions
@@ -259,8 +447,13 @@ class Card(object):
     __str__ -- returns the result from name_string(capitalized=True)
     __int__ -- returns the card rank, with aces always one.
 
+    Card instances use __slots__ rather than an instance dictionary,
+    since decks and hands create and copy large numbers of them.
+
     """
 
+    __slots__ = ("_rank", "_suit", "_index", "_facedown")
+
     def __init__(self, rank=None, suit=None, index=None, name=None):
 
         """Instance initialization function.
@@ -311,13 +504,30 @@ class Card(object):
 
         self._facedown = True
 
+    @classmethod
+    def _from_index(cls, index, facedown=True):
+
+        """Returns a new card from a valid index, without the
+        argument checking performed by the initializer.
+
+        """
+
+        card = cls.__new__(cls)
+        card._rank, card._suit = _INDEX_RANKS_SUITS[index]
+        card._index = index
+        card._facedown = facedown
+        return card
+
     # Public methods
 
     def copy(self):
 
         """Returns a copy of the card."""
 
-        copy_card = self.__class__(index=self.index())
+        copy_card = self.__class__.__new__(self.__class__)
+        copy_card._rank = self._rank
+        copy_card._suit = self._suit
+        copy_card._index = self._index
         copy_card._facedown = self._facedown
         return copy_card
 
@@ -400,7 +610,7 @@ class Card(object):
 
         """
 
-        return rank_string(self._rank, short=short, capitalize=capitalize)
+        return _RANK_STRINGS[_string_form(short, capitalize)][self._rank]
 
     def suit_string(self, short=False, capitalize=False):
 
@@ -415,7 +625,7 @@ class Card(object):
 
         """
 
-        return suit_string(self._suit, short=short, capitalize=capitalize)
+        return _SUIT_STRINGS[_string_form(short, capitalize)][self._suit]
 
     def name_string(self, short=False, capitalize=False):
 
@@ -430,13 +640,7 @@ class Card(object):
 
         """
 
-        if short:
-            ofstr = ""
-        else:
-            ofstr = " of "
-
-        return (self.rank_string(short=short, capitalize=capitalize) + ofstr +
-                self.suit_string(short=short, capitalize=capitalize))
+        return _NAME_STRINGS[_string_form(short, capitalize)][self._index]
 
     # Non-public methods
 
@@ -459,7 +663,7 @@ class Card(object):
 
         """
 
-        return self.name_string(capitalize=True)
+        return _NAME_STRINGS[_CAPITALIZE][self._index]
 
     def __int__(self):
 
@@ -0,0 +1,359 @@
+"""Card bitmask module.
+
+Library Release 1.2
+
+Copyright 2013 Paul Griffiths
+Email: mail@paulgriffiths.net
+
+Distributed under the terms of the GNU General Public License.
+http://www.gnu.org/licenses/
+
+"""
+
+
+from .card import Card, get_rank_integer, get_suit_integer
+from .card import _PADDED_SHORT_NAMES
+from .hand import Hand
+
+
+# Public constants
+
+FULL_MASK = (1 << 52) - 1
+
+
+# Non-public constants
+
+_SUIT_MASKS = [0x1FFF << (13 * suit) for suit in range(4)]
+_RANK_MASKS = [sum(1 << (13 * suit + offset) for suit in range(4))
+               for offset in range(13)]
+
+
+# Public functions
+
+def indices_to_mask(indices):
+
+    """Returns an integer bitmask with a bit set for each of a
+    sequence of card indices.
+
+    Exceptions raised:
+    ValueError -- if any index is invalid, or appears more than once.
+
+    """
+
+    mask = 0
+    for index in indices:
+        if index not in range(0, 52):
+            raise ValueError("Invalid index value '{0}'".format(index))
+        bit = 1 << index
+        if mask & bit:
+            raise ValueError("Duplicate index value '{0}'".format(index))
+        mask |= bit
+    return mask
+
+
+def mask_to_indices(mask):
+
+    """Returns a list of the card indices set in an integer bitmask,
+    in ascending order.
+
+    """
+
+    indices = []
+    while mask:
+        low_bit = mask & -mask
+        indices.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return indices
+
+
+# Class
+
+class CardMask(object):
+
+    """Implements an immutable set of cards from a single pack,
+    stored as an integer with one bit set for each Card.index().
+
+    Public methods:
+    __init__(mask)
+    from_indices(indices)
+    from_hand(hand)
+    mask()
+    index_list()
+    to_hand(hand_class)
+    rank_count(rank)
+    rank_counts()
+    suit_count(suit)
+    suit_counts()
+
+    Set operators:
+    __or__ (union), __and__ (intersection), __sub__ (difference),
+    __xor__ (symmetric difference) and __invert__ (complement
+    within a single pack) return new CardMask instances.
+
+    Container methods:
+    __contains__ accepts Card instances or card indices, __len__
+    returns the number of cards, and __iter__ yields card indices
+    in ascending order.
+
+    """
+
+    __slots__ = ("_mask",)
+
+    def __init__(self, mask=0):
+
+        """Initializes a CardMask instance.
+
+        Arguments:
+        mask -- an integer with bit n set if the card with index n
+        is in the set.
+
+        Exceptions raised:
+        ValueError -- if the mask has bits set other than the
+        lowest 52.
+
+        """
+
+        if not isinstance(mask, int) or mask & ~FULL_MASK:
+            raise ValueError("Invalid mask value '{0}'".format(mask))
+
+        self._mask = mask
+
+    # Alternative constructors
+
+    @classmethod
+    def from_indices(cls, indices):
+
+        """Returns a new CardMask instance from a sequence of
+        card indices.
+
+        """
+
+        return cls(indices_to_mask(indices))
+
+    @classmethod
+    def from_hand(cls, hand):
+
+        """Returns a new CardMask instance from a Hand instance, or
+        from any sequence of Card instances.
+
+        Exceptions raised:
+        ValueError -- if the same card appears more than once, since
+        a bitmask can only represent cards from a single pack.
+
+        """
+
+        if isinstance(hand, Hand):
+            return cls.from_indices(hand.index_list())
+        else:
+            return cls.from_indices([card.index() for card in hand])
+
+    # Public methods
+
+    def mask(self):
+
+        """Returns the integer bitmask."""
+
+        return self._mask
+
+    def index_list(self):
+
+        """Returns a list of the card indices in the set, in
+        ascending order.
+
+        """
+
+        return mask_to_indices(self._mask)
+
+    def to_hand(self, hand_class=Hand):
+
+        """Returns a new hand containing the cards in the set, in
+        ascending order of index.
+
+        Arguments:
+        hand_class -- the class of hand to create, e.g. PokerHand.
+
+        """
+
+        # Disable pylint message for access to protected member
+        # Card._from_index(), used for creating cards from indices
+        # known to be valid.
+        #
+        # pylint: disable=W0212
+
+        cards = [Card._from_index(idx) for idx in
+                 mask_to_indices(self._mask)]
+
+        # pylint: enable=W0212
+
+        return hand_class(cardlist=cards)
+
+    def rank_count(self, rank):
+
+        """Returns the number of cards of a rank in the set.
+
+        Arguments:
+        rank -- the rank, in any form accepted by the Card class.
+
+        """
+
+        rank = get_rank_integer(rank)
+        offset = 0 if rank == 14 else rank - 1
+        return (self._mask & _RANK_MASKS[offset]).bit_count()
+
+    def rank_counts(self):
+
+        """Returns a list of 15 rank counts, indexed by rank from 2
+        to 14 inclusive, with aces counted at 14 only.
+
+        """
+
+        counts = [0] * 15
+        for offset, rank_mask in enumerate(_RANK_MASKS):
+            counts[offset + 1 if offset else 14] = \
+                (self._mask & rank_mask).bit_count()
+        return counts
+
+    def suit_count(self, suit):
+
+        """Returns the number of cards of a suit in the set.
+
+        Arguments:
+        suit -- the suit, in any form accepted by the Card class.
+
+        """
+
+        suit = get_suit_integer(suit)
+        return (self._mask & _SUIT_MASKS[suit]).bit_count()
+
+    def suit_counts(self):
+
+        """Returns a list of the number of cards of each suit in the
+        set, indexed by suit.
+
+        """
+
+        return [(self._mask & suit_mask).bit_count()
+                for suit_mask in _SUIT_MASKS]
+
+    # Conversion operators
+
+    def __str__(self):
+
+        """Override string conversion operator to return a
+        representation of the cards in short "6D" format.
+
+        """
+
+        return ''.join([_PADDED_SHORT_NAMES[idx]
+                        for idx in mask_to_indices(self._mask)])
+
+    def __int__(self):
+
+        """Override integer conversion operator to return the mask."""
+
+        return self._mask
+
+    # Set operators
+
+    # Disable pylint message for access to protected other._mask,
+    # usage is safe when operating on two instances of the same
+    # class by an instance method.
+    #
+    # pylint: disable=W0212
+
+    def __or__(self, other):
+
+        """Returns the union of two sets of cards."""
+
+        if not isinstance(other, CardMask):
+            return NotImplemented
+        return self.__class__(self._mask | other._mask)
+
+    def __and__(self, other):
+
+        """Returns the intersection of two sets of cards."""
+
+        if not isinstance(other, CardMask):
+            return NotImplemented
+        return self.__class__(self._mask & other._mask)
+
+    def __sub__(self, other):
+
+        """Returns the cards in this set but not in another."""
+
+        if not isinstance(other, CardMask):
+            return NotImplemented
+        return self.__class__(self._mask & ~other._mask)
+
+    def __xor__(self, other):
+
+        """Returns the cards in exactly one of two sets."""
+
+        if not isinstance(other, CardMask):
+            return NotImplemented
+        return self.__class__(self._mask ^ other._mask)
+
+    def __invert__(self):
+
+        """Returns the cards in a single pack not in this set."""
+
+        return self.__class__(FULL_MASK & ~self._mask)
+
+    # Comparison operators
+
+    def __eq__(self, other):
+
+        """Override == operator to compare the sets of cards."""
+
+        if not isinstance(other, CardMask):
+            return NotImplemented
+        return self._mask == other._mask
+
+    def __ne__(self, other):
+
+        """Override != operator to compare the sets of cards."""
+
+        if not isinstance(other, CardMask):
+            return NotImplemented
+        return self._mask != other._mask
+
+    # pylint: enable=W0212
+
+    def __hash__(self):
+
+        """Returns a hash value, so masks can be used as keys."""
+
+        return hash(self._mask)
+
+    # Container methods
+
+    def __len__(self):
+
+        """Returns the number of cards in the set."""
+
+        return self._mask.bit_count()
+
+    def __bool__(self):
+
+        """Returns True if the set contains any cards."""
+
+        return self._mask != 0
+
+    def __iter__(self):
+
+        """Returns an iterator over the card indices in the set."""
+
+        return iter(mask_to_indices(self._mask))
+
+    def __contains__(self, item):
+
+        """Returns True if a Card instance or card index is in
+        the set.
+
+        """
+
+        if isinstance(item, Card):
+            item = item.index()
+        elif not isinstance(item, int) or item not in range(0, 52):
+            return False
+        return bool(self._mask >> item & 1)
@@ -0,0 +1,487 @@
+"""Card combinations module.
+
+Library Release 1.2
+
+Copyright 2013 Paul Griffiths
+Email: mail@paulgriffiths.net
+
+Distributed under the terms of the GNU General Public License.
+http://www.gnu.org/licenses/
+
+"""
+
+
+from math import comb
+
+from .card import _card_indices
+from .cardmask import CardMask, mask_to_indices
+
+
+# Non-public constants
+
+# Binomial coefficients comb(n, k) for n and k from 0 to 52, enough
+# for any combination of cards from one pack.
+
+_BINOMIALS = [[comb(n, k) for k in range(53)] for n in range(53)]
+
+
+# Non-public variables
+
+# Canonical hand layouts for each hand size, and colexicographic
+# positions of rank masks, built on first use.
+
+_LAYOUTS = {}
+_MASK_RANKS = []
+
+
+# Non-public functions
+
+def _colex_rank(indices):
+
+    """Returns the position of a combination of distinct card
+    indices, given in ascending order, in the colexicographic order
+    of all combinations of the same size.
+
+    In colexicographic order, combinations are compared by their
+    highest index first, so the combinations of k of the first n
+    indices are always the first comb(n, k) combinations, and the
+    position is the sum of comb(index, i + 1) over the i-th index.
+
+    """
+
+    binomials = _BINOMIALS
+    rank = 0
+    for position, index in enumerate(indices, 1):
+        rank += binomials[index][position]
+    return rank
+
+
+def _colex_rank_any(combo):
+
+    """Returns the colexicographic position of a combination of any
+    size of distinct non-negative integers, given in ascending order.
+
+    """
+
+    rank = 0
+    for position, value in enumerate(combo, 1):
+        rank += comb(value, position)
+    return rank
+
+
+def _colex_unrank(rank, size):
+
+    """Returns a list of size distinct non-negative integers in
+    ascending order, being the combination at a position in the
+    colexicographic order of all combinations of that size.
+
+    """
+
+    combo = [0] * size
+    for position in range(size, 0, -1):
+        value = position - 1
+        while comb(value + 1, position) <= rank:
+            value += 1
+        combo[position - 1] = value
+        rank -= comb(value, position)
+    return combo
+
+
+def _mask_ranks():
+
+    """Returns a list of the position of each 13 bit rank mask in the
+    colexicographic order of all masks with the same number of ranks
+    set, building it if necessary.
+
+    """
+
+    if not _MASK_RANKS:
+        ranks = [0] * (1 << 13)
+        for mask in range(1, 1 << 13):
+            high = mask.bit_length() - 1
+            ranks[mask] = (ranks[mask ^ (1 << high)] +
+                           comb(high, bin(mask).count("1")))
+        _MASK_RANKS.extend(ranks)
+    return _MASK_RANKS
+
+
+def _partitions(remaining, parts, largest):
+
+    """Yields the partitions of a number into a number of parts, each
+    no larger than largest and including zero parts, as tuples in
+    non-increasing order, in descending lexicographic order.
+
+    """
+
+    if parts == 1:
+        if remaining <= largest:
+            yield (remaining,)
+        return
+    for part in range(min(remaining, largest), -1, -1):
+        for rest in _partitions(remaining - part, parts - 1, part):
+            yield (part,) + rest
+
+
+def _layouts(size):
+
+    """Returns the canonical hand layouts for a hand size, building
+    them if necessary, as a tuple containing a dictionary mapping the
+    number of cards of each canonical suit to a tuple of the first
+    canonical id and the suit groups of hands with those numbers, a
+    list of (first id, counts, groups) tuples in id order, and the
+    number of canonical hands.
+
+    The canonical suits have non-increasing numbers of cards, so each
+    layout is a partition of the hand size into four parts. Suits with
+    the same number of cards form a group, given as a tuple of the
+    number of suits and the number of ways of choosing their ranks,
+    since their rank masks are in non-increasing order and so form a
+    multiset of the comb(13, n) possible masks.
+
+    """
+
+    if size not in _LAYOUTS:
+        by_counts = {}
+        ordered = []
+        first = 0
+
+        for counts in _partitions(size, 4, 13):
+            groups = []
+            number = 1
+            for count in sorted(set(counts), reverse=True):
+                suits = counts.count(count)
+                ways = comb(comb(13, count) + suits - 1, suits)
+                groups.append((suits, ways))
+                number *= ways
+            by_counts[counts] = (first, groups)
+            ordered.append((first, counts, groups))
+            first += number
+
+        _LAYOUTS[size] = (by_counts, ordered, first)
+    return _LAYOUTS[size]
+
+
+def _canonical_suits(indices):
+
+    """Returns a tuple containing the canonical id of a hand of
+    distinct card indices, and a list mapping each suit of the hand
+    to its suit in the canonical hand.
+
+    """
+
+    # Each suit is keyed by its number of cards above a mask of its
+    # ranks, and the canonical suits are in descending order of key.
+
+    keys = [0] * 4
+    for index in indices:
+        suit = index // 13
+        keys[suit] += (1 << 13) + (1 << (index - 13 * suit))
+    order = sorted(range(4), key=keys.__getitem__, reverse=True)
+    suit_map = [0] * 4
+    for canonical, suit in enumerate(order):
+        suit_map[suit] = canonical
+
+    by_counts = _layouts(len(indices))[0]
+    first, groups = by_counts[tuple(keys[suit] >> 13 for suit in order)]
+
+    # The rank masks of each group are in non-increasing order, so
+    # adding its position to the rank of each mask, taken in
+    # ascending order, gives a combination which indexes the group.
+
+    mask_ranks = _mask_ranks()
+    hand_id = 0
+    suit = 0
+    for suits, ways in groups:
+        ranks = [mask_ranks[keys[order[suit + offset]] & 0x1FFF]
+                 for offset in range(suits - 1, -1, -1)]
+        hand_id = hand_id * ways + _colex_rank_any(
+            [rank + offset for offset, rank in enumerate(ranks)])
+        suit += suits
+
+    return (first + hand_id, suit_map)
+
+
+def _distinct_indices(cards):
+
+    """Returns a list of distinct card indices from a hand in any
+    of the forms accepted by canonical_id().
+
+    """
+
+    indices = _card_indices(cards)
+    if len(set(indices)) != len(indices):
+        raise ValueError("A hand of different cards is required.")
+    return indices
+
+
+# Public functions
+
+def canonical_id(cards):
+
+    """Returns the canonical id of a hand of cards from a single
+    pack, from zero to one less than canonical_count() for the number
+    of cards. Two hands have the same canonical id if and only if
+    they differ only by a permutation of the suits, so the id can be
+    used to index tables of results which do not depend on the suits.
+
+    Arguments:
+    cards -- a Hand instance, or a sequence of Card instances, short
+    names (e.g. "AS") or card indices.
+
+    Exceptions raised:
+    ValueError -- if any card is invalid, or appears more than once.
+
+    """
+
+    return _canonical_suits(_distinct_indices(cards))[0]
+
+
+def canonical_indices(cards):
+
+    """Returns a list, in ascending order, of the card indices of
+    the canonical hand for a hand of cards, which is the same for any
+    two hands that differ only by a permutation of the suits.
+
+    The suits of the canonical hand are in descending order of the
+    number of cards of each, and then of their ranks, so clubs has
+    the most cards.
+
+    Arguments:
+    cards -- as for canonical_id().
+
+    Exceptions raised:
+    ValueError -- as for canonical_id().
+
+    """
+
+    indices = _distinct_indices(cards)
+    suit_map = _canonical_suits(indices)[1]
+    return sorted(suit_map[index // 13] * 13 + index % 13
+                  for index in indices)
+
+
+def canonical_count(size):
+
+    """Returns the number of canonical hands of a number of cards,
+    e.g. 134,459 for five cards, compared to 2,598,960 hands.
+
+    Exceptions raised:
+    ValueError -- if the number of cards is not from 0 to 52.
+
+    """
+
+    if not isinstance(size, int) or size not in range(0, 53):
+        raise ValueError("Invalid hand size '{0}'".format(size))
+    return _layouts(size)[2]
+
+
+def canonical_from_id(hand_id, size):
+
+    """Returns a list, in ascending order, of the card indices of
+    the canonical hand with a canonical id.
+
+    Arguments:
+    hand_id -- the canonical id, as returned by canonical_id().
+    size -- the number of cards in the hand.
+
+    Exceptions raised:
+    ValueError -- if the number of cards is not from 0 to 52, or the
+    canonical id is not valid for that number of cards.
+
+    """
+
+    count = canonical_count(size)
+    if not isinstance(hand_id, int) or hand_id not in range(0, count):
+        raise ValueError("Invalid canonical id '{0}'".format(hand_id))
+
+    ordered = _layouts(size)[1]
+    low, high = 0, len(ordered)
+    while high - low > 1:
+        middle = (low + high) // 2
+        if ordered[middle][0] <= hand_id:
+            low = middle
+        else:
+            high = middle
+    first, counts, groups = ordered[low]
+
+    indices = []
+    remainder = hand_id - first
+    suit = 4
+    for suits, ways in reversed(groups):
+        remainder, rank = divmod(remainder, ways)
+        suit -= suits
+        combo = _colex_unrank(rank, suits)
+        for offset in range(suits):
+            mask_rank = combo[suits - 1 - offset] - (suits - 1 - offset)
+            for rank_offset in _colex_unrank(mask_rank, counts[suit]):
+                indices.append((suit + offset) * 13 + rank_offset)
+    return sorted(indices)
+
+
+def combination_rank(cards):
+
+    """Returns the position of a combination of distinct cards from
+    a single pack in the colexicographic order of all combinations of
+    the same number of cards, from zero to one less than comb(52, k)
+    for k cards. The position can be used to index tables of results
+    for every combination directly, and is the position at which
+    colex_combinations() over a full pack yields the combination.
+
+    Arguments:
+    cards -- a Hand or CardMask instance, an integer bitmask with bit
+    n set for the card with index n, or a sequence of Card instances,
+    short names (e.g. "AS") or card indices.
+
+    Exceptions raised:
+    ValueError -- if any card or bitmask is invalid, or any card
+    appears more than once.
+
+    """
+
+    if isinstance(cards, CardMask):
+        cards = int(cards)
+    if isinstance(cards, int):
+        if cards < 0 or cards >> 52:
+            raise ValueError("Invalid card mask '{0}'".format(cards))
+        return _colex_rank(mask_to_indices(cards))
+    return _colex_rank(sorted(_distinct_indices(cards)))
+
+
+def combination_from_rank(rank, size, masks=False):
+
+    """Returns a list, in ascending order, of the card indices of the
+    combination of cards at a position in the colexicographic order
+    of all combinations of a number of cards from a single pack, as
+    returned by combination_rank(), or an integer bitmask of them.
+
+    Arguments:
+    rank -- the position of the combination.
+    size -- the number of cards in the combination.
+    masks -- if set to 'True', return a bitmask rather than a list.
+
+    Exceptions raised:
+    ValueError -- if the number of cards is not from 0 to 52, or the
+    position is not valid for that number of cards.
+
+    """
+
+    if not isinstance(size, int) or size not in range(0, 53):
+        raise ValueError("Invalid hand size '{0}'".format(size))
+    if not isinstance(rank, int) or rank not in range(0, comb(52, size)):
+        raise ValueError("Invalid combination rank '{0}'".format(rank))
+
+    # Each card is the highest index whose binomial coefficient does
+    # not exceed the remaining position, and is lower than the card
+    # above it, so the indices are found in a single downward scan.
+
+    binomials = _BINOMIALS
+    indices = [0] * size
+    value = 52
+    for position in range(size, 0, -1):
+        value -= 1
+        while binomials[value][position] > rank:
+            value -= 1
+        indices[position - 1] = value
+        rank -= binomials[value][position]
+
+    if masks:
+        mask = 0
+        for index in indices:
+            mask |= 1 << index
+        return mask
+    return indices
+
+
+def colex_combinations(indices, size, start=0, stop=None, masks=False):
+
+    """Yields each combination of a number of distinct card indices
+    from a set of card indices, in colexicographic order, as a tuple
+    of card indices in ascending order, or as an integer bitmask with
+    a bit set for each card index.
+
+    Combinations are generated one at a time, so any number can be
+    enumerated in constant memory, and enumeration can start and stop
+    at any position, so that it can be split into chunks, e.g. for
+    separate processes. The combinations of k of the first m indices
+    always come before any others, and the position of a combination
+    is the sum of comb(p, i) over the position p in the sorted set of
+    its i-th lowest card, counting from 1.
+
+    Arguments:
+    indices -- the card indices to choose from, in any order.
+    Repeated indices are included once.
+    size -- the number of cards in each combination.
+    start -- the position of the first combination to yield.
+    stop -- if provided, the position after the last combination to
+    yield, otherwise yield every combination from start.
+    masks -- if set to 'True', yield bitmasks rather than tuples.
+
+    Exceptions raised:
+    ValueError -- if size or start is negative.
+
+    """
+
+    if size < 0 or start < 0:
+        raise ValueError("Size and start must not be negative.")
+
+    values = sorted(set(indices))
+    count = len(values)
+    total = comb(count, size)
+    remaining = (total if stop is None else min(stop, total)) - start
+    if remaining <= 0:
+        return
+    if size == 0:
+        yield 0 if masks else ()
+        return
+
+    if masks:
+        values = [1 << value for value in values]
+    combo = _colex_unrank(start, size)
+    if size == 1:
+        if masks:
+            yield from values[combo[0]:combo[0] + remaining]
+        else:
+            yield from [(value,) for value in
+                        values[combo[0]:combo[0] + remaining]]
+        return
+
+    while True:
+
+        # Generate every combination with the same higher cards, by
+        # varying only the lowest two cards.
+
+        low, second = combo[0], combo[1]
+        top = combo[2] if size > 2 else count
+        if masks:
+            higher = 0
+            for position in combo[2:]:
+                higher |= values[position]
+            chunk = [value | values[second] | higher
+                     for value in values[low:second]]
+            for position in range(second + 1, top):
+                upper = values[position] | higher
+                chunk.extend([value | upper for value in values[:position]])
+        else:
+            higher = tuple([values[position] for position in combo[2:]])
+            upper = (values[second],) + higher
+            chunk = [(value,) + upper for value in values[low:second]]
+            for position in range(second + 1, top):
+                upper = (values[position],) + higher
+                chunk.extend([(value,) + upper
+                              for value in values[:position]])
+
+        if len(chunk) >= remaining:
+            yield from chunk[:remaining]
+            return
+        yield from chunk
+        remaining -= len(chunk)
+
+        # Move to the next set of higher cards, by advancing the lowest
+        # of them which can be advanced and resetting the cards below.
+
+        pos = 2
+        while pos < size - 1 and combo[pos] + 1 == combo[pos + 1]:
+            pos += 1
+        combo[pos] += 1
+        for lower in range(pos):
+            combo[lower] = lower
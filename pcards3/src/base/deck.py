@@ -11,9 +11,93 @@ http://www.gnu.org/licenses/
 """
 
 
+import hashlib
 import random
+from math import factorial
 
-from .card import Card
+from .card import Card, _card_indices
+from .combinatorics import colex_combinations
+
+
+# Non-public constants
+
+# Decks of up to this many cards are shuffled by drawing a single
+# random permutation number and decoding it, which avoids a call to
+# the random number generator for every card. Larger decks, such as
+# multiple pack shoes, would need very large permutation numbers, so
+# are shuffled card by card.
+
+_PERMUTATION_LIMIT = 52
+
+
+# Non-public variables
+
+# Number of permutations, and the number of random bits needed to
+# choose one, for each deck size shuffled by permutation number.
+
+_PERMUTATION_COUNTS = {}
+
+
+# Non-public functions
+
+def _shuffle_cards(cards, rng):
+
+    """Shuffles a list in place, using a random number generator
+    with the interface of the random module.
+
+    """
+
+    size = len(cards)
+    if size > _PERMUTATION_LIMIT:
+        rng.shuffle(cards)
+        return
+
+    if size not in _PERMUTATION_COUNTS:
+        count = factorial(size)
+        _PERMUTATION_COUNTS[size] = (count, count.bit_length())
+    count, bits = _PERMUTATION_COUNTS[size]
+
+    # Draw a permutation number uniformly by rejecting numbers out of
+    # range, then decode it one digit at a time in a mixed radix, to
+    # give the choices of a Fisher-Yates shuffle.
+
+    number = rng.getrandbits(bits)
+    while number >= count:
+        number = rng.getrandbits(bits)
+    for pos in range(size - 1, 0, -1):
+        number, choice = divmod(number, pos + 1)
+        cards[pos], cards[choice] = cards[choice], cards[pos]
+
+
+# Public functions
+
+def spawn_seeds(seed, number, start=0):
+
+    """Returns a list of seeds for independent random number
+    generators derived from a single seed, such as for the decks of
+    workers in a process pool. The same seed always gives the same
+    seeds, and any number of seeds can be derived in separate calls
+    by giving different starting positions.
+
+    Arguments:
+    seed -- the seed to derive from, an integer, string or bytes.
+    number -- the number of seeds to return.
+    start -- the position of the first seed to return.
+
+    Exceptions raised:
+    TypeError -- if the seed is not an integer, string or bytes.
+
+    """
+
+    if not isinstance(seed, (int, str, bytes)):
+        raise TypeError("Seed must be an integer, string or bytes.")
+
+    seeds = []
+    for position in range(start, start + number):
+        digest = hashlib.sha256("{0!r}/{1}".format(seed, position)
+                                .encode("utf-8")).digest()
+        seeds.append(int.from_bytes(digest[:16], "little"))
+    return seeds
 
 
 class EmptyDeckError(Exception):
@@ -29,8 +113,20 @@ class Deck(object):
 
     """Implements a deck of cards, using Card instances.
 
+    The deck is a list of cards with the top of the deck at the end
+    of the list. Drawing cards only truncates the list, so drawing k
+    cards takes O(k) time regardless of the size of the deck, and
+    shuffling rearranges the list in place.
+
+    Shuffling uses the random module by default, or a random number
+    generator of its own if the deck is created with a seed or a
+    generator, so that deals are reproducible and separate decks do
+    not share state.
+
     Public methods:
-    __init__(packs)
+    __init__(packs, seed, rng)
+    combinations()
+    deal_tables()
     discard()
     discard_size()
     draw()
@@ -38,10 +134,11 @@ class Deck(object):
     get_discard_list()
     replace_discards()
     shuffle()
+    spawn()
 
     """
 
-    def __init__(self, packs=1):
+    def __init__(self, packs=1, seed=None, rng=None):
 
         """Initializes a Deck instance.
 
@@ -51,22 +148,103 @@ class Deck(object):
         packs -- the number of packs to put into the deck, set to
         something greater than 1 to create a deck consisting of
         multiple packs.
+        seed -- if provided, an integer, string or bytes seed for a
+        random number generator used only by this deck.
+        rng -- if provided, a random.Random instance, or any object
+        with its getrandbits() and shuffle() methods, to use for
+        shuffling instead of the random module.
+
+        Exceptions raised:
+        ValueError -- if packs is not a positive integer, or if both
+        seed and rng are provided.
 
         """
 
         if not isinstance(packs, int) or not packs > 0:
             raise ValueError("Argument 'packs' must be a positive integer.")
+        if seed is not None and rng is not None:
+            raise ValueError("Only one of 'seed' and 'rng' may be provided.")
+
+        self._packs = packs
+        self._seed = seed
+        self._spawned = 0
+        if seed is not None:
+            self._rng = random.Random(seed)
+        elif rng is not None:
+            self._rng = rng
+        else:
+            self._rng = random
 
-        # Disable pylint warning about unused variable 'pack'
-        # pylint: disable=W0612
-        self._cards = [Card(index=idx) for pack in range(packs)
-                                       for idx in range(51, -1, -1)]
-        # pylint: enable=W0612
+        # Disable pylint warnings about unused variable 'pack'
+        # and access to protected member Card._from_index()
+        # pylint: disable=W0612,W0212
+        self._cards = [Card._from_index(idx) for pack in range(packs)
+                                             for idx in range(51, -1, -1)]
+        # pylint: enable=W0612,W0212
 
         self._discards = []
 
     # Public methods
 
+    def combinations(self, number, dead=None, start=0, stop=None,
+                     masks=False):
+
+        """Returns a generator of every combination of a number of
+        the different cards remaining in the deck, in colexicographic
+        order of card index, as tuples of card indices in ascending
+        order, or as integer bitmasks. The combinations are generated
+        one at a time, so that any number can be enumerated in
+        constant memory, and enumeration can start and stop at any
+        position, e.g. to split it into chunks for separate processes.
+
+        Arguments:
+        number -- the number of cards in each combination.
+        dead -- cards to leave out, as a Hand instance, or a sequence
+        of Card instances, short names (e.g. "AS") or card indices.
+        start -- the position of the first combination to generate.
+        stop -- if provided, the position after the last combination
+        to generate.
+        masks -- if set to 'True', generate bitmasks with bit n set
+        for the card with index n, rather than tuples.
+
+        Exceptions raised:
+        ValueError -- if number or start is negative, or if any dead
+        card is invalid.
+
+        """
+
+        indices = set([card.index() for card in self._cards])
+        indices.difference_update(_card_indices(dead))
+        return colex_combinations(indices, number, start, stop, masks)
+
+    def deal_tables(self, tables, players, cards, board=0):
+
+        """Deals cards for many independent tables at once from
+        shuffles of the cards remaining in the deck, and returns them
+        as arrays of card indices, as for batch.deal_tables(). The
+        deck itself is not changed, other than advancing its random
+        number generator. Requires NumPy.
+
+        Arguments:
+        tables -- the number of tables to deal.
+        players -- the number of players at each table.
+        cards -- the number of cards to deal to each player.
+        board -- the number of board cards to deal for each table.
+
+        Exceptions raised:
+        ValueError -- if any number is negative, or if the deck does
+        not contain enough cards.
+
+        """
+
+        # Imported here, so that decks can be used without NumPy.
+
+        from ..batch import deal_tables
+
+        indices = [card.index() for card in self._cards]
+        return deal_tables(tables, players, cards, board,
+                           self._rng.getrandbits(128), indices)
+
     def discard(self, cards):
 
         """Adds a list of cards to the discard pile.
@@ -99,24 +277,27 @@ class Deck(object):
 
         """
 
-        if number > len(self._cards):
+        cards = self._cards
+        if number > len(cards):
             raise EmptyDeckError
-        else:
-            drawn_cards = self._cards[-number:]
+        elif number < 1:
+            return []
 
-            if face_up:
-                for card in drawn_cards:
-                    card.face_up()
-            elif face_down:
-                for card in drawn_cards:
-                    card.face_down()
+        # Take the cards from the top of the deck downwards, to
+        # simulate cards being popped off the top in order
 
-            # Call reverse() to simulate cards being popped
-            # off the top of the deck in order
+        drawn_cards = cards[-number:]
+        drawn_cards.reverse()
+        del cards[-number:]
 
-            drawn_cards.reverse()
-            self._cards = self._cards[0:-number]
-            return drawn_cards
+        if face_up:
+            for card in drawn_cards:
+                card.face_up()
+        elif face_down:
+            for card in drawn_cards:
+                card.face_down()
+
+        return drawn_cards
 
     def get_card_list(self):
 
@@ -134,9 +315,10 @@ class Deck(object):
 
         """Replaces the discard pile at the bottom of the deck."""
 
-        self._discards.extend(self._cards)
-        self._cards = self._discards
-        self._discards = []
+        if self._discards:
+            self._discards.extend(self._cards)
+            self._cards = self._discards
+            self._discards = []
 
     def shuffle(self, return_discards=True):
 
@@ -153,7 +335,29 @@ class Deck(object):
         if return_discards and self._discards:
             self.replace_discards()
 
-        random.shuffle(self._cards)
+        _shuffle_cards(self._cards, self._rng)
+
+    def spawn(self, number):
+
+        """Returns a list of new decks, with the same number of packs,
+        each with its own independent random number generator.
+
+        If this deck was created with a seed, the new decks are seeded
+        from it, so the same seed always gives the same sequence of
+        new decks over successive calls. Otherwise, they are seeded
+        from this deck's random number generator.
+
+        Arguments:
+        number -- the number of decks to create.
+
+        """
+
+        if self._seed is None:
+            seeds = spawn_seeds(self._rng.getrandbits(128), number)
+        else:
+            seeds = spawn_seeds(self._seed, number, self._spawned)
+            self._spawned += number
+        return [Deck(self._packs, seed=seed) for seed in seeds]
 
     # Indexing and iteration methods
 
@@ -201,7 +405,8 @@ class Deck(object):
         if not isinstance(item, Card):
             return False
         else:
+            index = item.index()
             for card in self._cards:
-                if card.index() == item.index():
+                if card.index() == index:
                     return True
             return False
@@ -0,0 +1,368 @@
+"""Poker hand equity module.
+
+Library Release 1.2
+
+Copyright 2013 Paul Griffiths
+Email: mail@paulgriffiths.net
+
+Distributed under the terms of the GNU General Public License.
+http://www.gnu.org/licenses/
+
+"""
+
+
+from __future__ import division
+
+import math
+import os
+import random
+import time
+from collections import namedtuple
+from itertools import combinations
+
+from .card import _card_indices
+from .evaluator import _evaluate_indices, _evaluate_best
+
+
+# Public named tuples
+
+# pylint raises a convention warning for EquityResult
+# rather than EQUITYRESULT, but we use named tuples
+# in a similar way to classes, so we follow that
+# naming convention instead and disable the message.
+#
+# pylint: disable=C0103
+
+EquityResult = namedtuple("EquityResult", ["win", "tie", "lose",
+                                           "equity", "stderr", "trials"])
+
+# pylint: enable=C0103
+
+
+# Non-public functions
+
+def _prepare(hands, board, dead, hole_cards, board_cards):
+
+    """Returns a tuple of the list of known hole card indices for
+    each player, the list of known board indices and the list of
+    indices of the cards remaining in the deck.
+
+    """
+
+    if len(hands) < 2:
+        raise ValueError("At least two hands are required.")
+
+    players = [_card_indices(hand) for hand in hands]
+    board = _card_indices(board)
+    dead = _card_indices(dead)
+
+    if max(len(player) for player in players) > hole_cards:
+        raise ValueError("Too many hole cards in hand.")
+    if len(board) > board_cards:
+        raise ValueError("Too many cards on board.")
+    if hole_cards + board_cards not in range(5, 8):
+        raise ValueError("Hands must total five, six or seven cards.")
+
+    known = [idx for player in players for idx in player] + board + dead
+    known_set = set(known)
+    if len(known_set) != len(known):
+        raise ValueError("The same card appears more than once.")
+
+    remaining = [idx for idx in range(52) if idx not in known_set]
+    needed = (sum(hole_cards - len(player) for player in players) +
+              board_cards - len(board))
+    if needed > len(remaining):
+        raise ValueError("Not enough cards remaining in the deck.")
+
+    return (players, board, remaining)
+
+
+def _showdown(hands):
+
+    """Returns a list of the positions of the winning hands from
+    a list of lists of card indices.
+
+    """
+
+    ranks = []
+    for cards in hands:
+        if len(cards) == 5:
+            ranks.append(_evaluate_indices(cards[0], cards[1], cards[2],
+                                           cards[3], cards[4]))
+        else:
+            ranks.append(_evaluate_best(cards))
+
+    best = min(ranks)
+    return [pos for pos, rank in enumerate(ranks) if rank == best]
+
+
+def _results(wins, ties, shares, squares, trials):
+
+    """Returns a list of EquityResult instances from per-player
+    win and tie counts, and sums and sums of squares of the
+    share of each pot won.
+
+    """
+
+    results = []
+    for win, tie, share, square in zip(wins, ties, shares, squares):
+        mean = share / trials
+        variance = max(square / trials - mean * mean, 0.0)
+        results.append(EquityResult(win / trials, tie / trials,
+                                    (trials - win - tie) / trials,
+                                    mean, math.sqrt(variance / trials),
+                                    trials))
+    return results
+
+
+def _share_scale(num_players):
+
+    """Returns the least common multiple of the integers from 1 to
+    num_players inclusive, so that a share of a pot split between
+    any number of players can be counted as an exact integer.
+
+    """
+
+    scale = 1
+    for number in range(2, num_players + 1):
+        scale = scale * number // math.gcd(scale, number)
+    return scale
+
+
+def _exact_chunk(task):
+
+    """Enumerates one chunk of the possible boards for a list of
+    complete hands, and returns a tuple of lists of per-player win
+    counts, tie counts and pot shares (in units of 1/scale pots).
+
+    Arguments:
+    task -- a tuple of the hole card indices for each player, the
+    known board indices, the remaining deck indices, a tuple of
+    positions in the remaining deck of the first board cards dealt
+    in this chunk, the number of further board cards to deal after
+    those, and the share scale.
+
+    """
+
+    players, board, remaining, prefix, fill, scale = task
+
+    num_players = len(players)
+    wins = [0] * num_players
+    ties = [0] * num_players
+    shares = [0] * num_players
+
+    start = prefix[-1] + 1 if prefix else 0
+    prefix_board = board + [remaining[pos] for pos in prefix]
+
+    for rest in combinations(remaining[start:], fill):
+        full_board = prefix_board + list(rest)
+        winners = _showdown([player + full_board for player in players])
+        if len(winners) == 1:
+            wins[winners[0]] += 1
+            shares[winners[0]] += scale
+        else:
+            share = scale // len(winners)
+            for winner in winners:
+                ties[winner] += 1
+                shares[winner] += share
+
+    return (wins, ties, shares)
+
+
+def _merge_chunks(chunk_results, wins, ties, shares):
+
+    """Adds the per-player counts from an iterable of chunk
+    results to lists of win counts, tie counts and shares.
+
+    """
+
+    for chunk_wins, chunk_ties, chunk_shares in chunk_results:
+        for pos, win in enumerate(chunk_wins):
+            wins[pos] += win
+            ties[pos] += chunk_ties[pos]
+            shares[pos] += chunk_shares[pos]
+
+
+# Public functions
+
+def equity(hands, board=None, dead=None, trials=10000, seed=None,
+           target_stderr=None, time_limit=None,
+           hole_cards=2, board_cards=5):
+
+    """Returns a list of EquityResult instances estimating the
+    equity of each of a number of hands by Monte Carlo simulation.
+
+    Each trial deals the unknown cards at random from the cards
+    remaining in the deck, and the pot is shared equally between
+    the hands which tie for the best hand. Each EquityResult
+    contains the proportion of trials won outright, tied and lost,
+    the average share of the pot won (the equity), its standard
+    error, and the number of trials run.
+
+    Arguments:
+    hands -- a list of at least two hands. Each hand is a Hand
+    instance, or a sequence of Card instances, short names (e.g.
+    "AS") or card indices. A hand with fewer than 'hole_cards'
+    cards is completed at random, so None or an empty list
+    represents a random opponent.
+    board -- the known board cards, in any of the forms accepted
+    for a hand, completed at random up to 'board_cards' cards.
+    dead -- cards known not to be in the deck, in any of the forms
+    accepted for a hand.
+    trials -- the maximum number of trials to run.
+    seed -- a seed for the random number generator, for
+    reproducible results.
+    target_stderr -- if provided, stop early once the standard
+    error of every hand's equity is no more than this.
+    time_limit -- if provided, stop early once this many seconds
+    have elapsed.
+    hole_cards -- the number of cards in each hand, 2 for hold'em.
+    board_cards -- the number of board cards, 5 for hold'em.
+
+    Exceptions raised:
+    ValueError -- if fewer than two hands are provided, if any card
+    is invalid or appears more than once, if there are too many
+    cards for the game, or if 'trials' is not a positive integer.
+
+    """
+
+    if not isinstance(trials, int) or not trials > 0:
+        raise ValueError("Argument 'trials' must be a positive integer.")
+
+    players, board, remaining = _prepare(hands, board, dead,
+                                         hole_cards, board_cards)
+
+    rng = random.Random(seed)
+    num_players = len(players)
+    fills = [hole_cards - len(player) for player in players]
+    board_fill = board_cards - len(board)
+    needed = sum(fills) + board_fill
+
+    wins = [0] * num_players
+    ties = [0] * num_players
+    shares = [0.0] * num_players
+    squares = [0.0] * num_players
+
+    check_every = 1000
+    start_time = time.time()
+    trial = 0
+
+    while trial < trials:
+        drawn = rng.sample(remaining, needed)
+        full_board = board + drawn[:board_fill]
+
+        hand_cards = []
+        pos = board_fill
+        for player, fill in zip(players, fills):
+            hand_cards.append(player + drawn[pos:pos + fill] + full_board)
+            pos += fill
+
+        winners = _showdown(hand_cards)
+        if len(winners) == 1:
+            wins[winners[0]] += 1
+            shares[winners[0]] += 1.0
+            squares[winners[0]] += 1.0
+        else:
+            share = 1.0 / len(winners)
+            for winner in winners:
+                ties[winner] += 1
+                shares[winner] += share
+                squares[winner] += share * share
+
+        trial += 1
+
+        if trial % check_every == 0 and trial < trials:
+            if time_limit is not None:
+                if time.time() - start_time >= time_limit:
+                    break
+            if target_stderr is not None:
+                results = _results(wins, ties, shares, squares, trial)
+                if max(result.stderr for result in results) <= target_stderr:
+                    break
+
+    return _results(wins, ties, shares, squares, trial)
+
+
+def exact_equity(hands, board=None, dead=None, workers=None,
+                 hole_cards=2, board_cards=5):
+
+    """Returns a list of EquityResult instances giving the exact
+    equity of each of a number of complete hands, by enumerating
+    every possible completion of the board.
+
+    The possible boards are partitioned into chunks by their first
+    one or two cards, in the same way as the outer loops of a set
+    of nested loops over the remaining deck, and the chunks are
+    evaluated across a pool of worker processes. The results are
+    merged as exact integer counts, so they do not depend on the
+    number of workers. The standard error in each result is zero,
+    and the number of trials is the number of boards enumerated.
+
+    Arguments:
+    hands -- a list of at least two hands, each with exactly
+    'hole_cards' cards, in any of the forms accepted by equity().
+    board -- the known board cards.
+    dead -- cards known not to be in the deck.
+    workers -- the number of worker processes to use, defaulting
+    to the number of processors. Set to 1 to run in the calling
+    process.
+    hole_cards -- the number of cards in each hand, 2 for hold'em.
+    board_cards -- the number of board cards, 5 for hold'em.
+
+    Exceptions raised:
+    ValueError -- if fewer than two hands are provided, if any hand
+    is incomplete, if any card is invalid or appears more than
+    once, or if there are too many cards for the game.
+
+    """
+
+    players, board, remaining = _prepare(hands, board, dead,
+                                         hole_cards, board_cards)
+    if min(len(player) for player in players) != hole_cards:
+        raise ValueError("Exact equity requires complete hands.")
+
+    num_players = len(players)
+    scale = _share_scale(num_players)
+    fill = board_cards - len(board)
+
+    # Chunk by the first two board cards dealt when there are enough
+    # boards to keep many processes busy, otherwise by the first one,
+    # or run everything as one chunk for the river and turn.
+
+    prefix_length = min(max(fill - 2, 0), 2)
+    tasks = [(players, board, remaining, prefix, fill - prefix_length,
+              scale)
+             for prefix in combinations(range(len(remaining)),
+                                        prefix_length)]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    wins = [0] * num_players
+    ties = [0] * num_players
+    shares = [0] * num_players
+
+    if workers == 1 or len(tasks) == 1:
+        chunk_results = map(_exact_chunk, tasks)
+        _merge_chunks(chunk_results, wins, ties, shares)
+    else:
+
+        # Imported here as it is relatively slow to import, and is
+        # not needed by the rest of the package.
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(tasks) // (workers * 8))
+            chunk_results = executor.map(_exact_chunk, tasks,
+                                         chunksize=chunksize)
+            _merge_chunks(chunk_results, wins, ties, shares)
+
+    boards = math.comb(len(remaining), fill)
+
+    results = []
+    for win, tie, share in zip(wins, ties, shares):
+        results.append(EquityResult(win / boards, tie / boards,
+                                    (boards - win - tie) / boards,
+                                    share / (scale * boards), 0.0, boards))
+    return results
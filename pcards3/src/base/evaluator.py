@@ -0,0 +1,422 @@
+"""Lookup table poker hand evaluator module.
+
+Library Release 1.2
+
+Copyright 2013 Paul Griffiths
+Email: mail@paulgriffiths.net
+
+Distributed under the terms of the GNU General Public License.
+http://www.gnu.org/licenses/
+
+"""
+
+
+from itertools import combinations
+
+
+# Public constants
+
+WORST_RANK = 7462
+
+
+# Non-public constants
+
+# Each rank is associated with a prime number, two being 2 and ace
+# being 41, in the style of Kevin Suffecool's evaluator. Since every
+# integer has a unique prime factorization, the product of the primes
+# of the cards in a hand identifies the ranks in that hand regardless
+# of their order, and can be used as a key into a lookup table.
+
+_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+# Straights as a bit pattern of ranks (two is bit 0, ace is bit 12)
+# from the ace high straight down to the wheel.
+
+_STRAIGHTS = [0x1F00, 0x0F80, 0x07C0, 0x03E0, 0x01F0,
+              0x00F8, 0x007C, 0x003E, 0x001F, 0x100F]
+
+# Equivalence class rank boundaries, best hands first. The first
+# rank of each category is paired with the category code used
+# by the pokerhand module.
+
+_CATEGORY_BOUNDS = [
+    (1, 9), (2, 8), (11, 7), (167, 6), (323, 5),
+    (1600, 4), (1610, 3), (2468, 2), (3326, 1), (6186, 0)
+]
+
+# Worst ranks of the straight flushes, and of the hands which beat
+# any flush.
+
+_WORST_STRAIGHT_FLUSH = 10
+_WORST_FULL_HOUSE = 322
+
+
+# Non-public functions
+
+def _card_rank(index):
+
+    """Returns the evaluator rank number of a card from its index,
+    where two is 0 and ace is 12.
+
+    """
+
+    rank = index % 13 - 1
+    return 12 if rank < 0 else rank
+
+
+def _bits_ranks(bits):
+
+    """Returns a list of the ranks set in a bit pattern."""
+
+    return [rank for rank in range(13) if bits & (1 << rank)]
+
+
+def _rank_bits(ranks):
+
+    """Returns a bit pattern with a bit set for each rank."""
+
+    bits = 0
+    for rank in ranks:
+        bits |= 1 << rank
+    return bits
+
+
+def _rank_product(ranks):
+
+    """Returns the product of the primes for a list of ranks."""
+
+    product = 1
+    for rank in ranks:
+        product *= _PRIMES[rank]
+    return product
+
+
+def _build_tables():
+
+    """Builds and returns the flush and non-flush lookup tables,
+    mapping the prime product of a five card hand to its
+    equivalence class rank.
+
+    """
+
+    flushes = {}
+    products = {}
+
+    descending = list(range(12, -1, -1))
+    straights = set(_STRAIGHTS)
+    high_cards = [_rank_bits(cmb) for cmb in combinations(descending, 5)
+                  if _rank_bits(cmb) not in straights]
+
+    # Straight flushes, from the royal flush down to the wheel
+
+    rank = 1
+    for bits in _STRAIGHTS:
+        flushes[_rank_product(_bits_ranks(bits))] = rank
+        rank += 1
+
+    # Four of a kind
+
+    for four in descending:
+        for kicker in descending:
+            if kicker != four:
+                products[_rank_product([four] * 4 + [kicker])] = rank
+                rank += 1
+
+    # Full houses
+
+    for three in descending:
+        for pair in descending:
+            if pair != three:
+                products[_rank_product([three] * 3 + [pair] * 2)] = rank
+                rank += 1
+
+    # Flushes
+
+    for bits in high_cards:
+        flushes[_rank_product(_bits_ranks(bits))] = rank
+        rank += 1
+
+    # Straights
+
+    for bits in _STRAIGHTS:
+        products[_rank_product(_bits_ranks(bits))] = rank
+        rank += 1
+
+    # Three of a kind
+
+    for three in descending:
+        others = [r for r in descending if r != three]
+        for kickers in combinations(others, 2):
+            products[_rank_product([three] * 3 + list(kickers))] = rank
+            rank += 1
+
+    # Two pair
+
+    for pairs in combinations(descending, 2):
+        for kicker in descending:
+            if kicker not in pairs:
+                products[_rank_product([pairs[0]] * 2 + [pairs[1]] * 2 +
+                                       [kicker])] = rank
+                rank += 1
+
+    # One pair
+
+    for pair in descending:
+        others = [r for r in descending if r != pair]
+        for kickers in combinations(others, 3):
+            products[_rank_product([pair] * 2 + list(kickers))] = rank
+            rank += 1
+
+    # High card
+
+    for bits in high_cards:
+        products[_rank_product(_bits_ranks(bits))] = rank
+        rank += 1
+
+    return (flushes, products)
+
+
+_CARD_PRIMES = [_PRIMES[_card_rank(idx)] for idx in range(52)]
+_CARD_SUITS = [1 << (idx // 13) for idx in range(52)]
+_FLUSHES, _PRODUCTS = _build_tables()
+
+# Suit counts for five, six and seven card hands are accumulated in one
+# four bit field per suit. Adding three to each field sets its top
+# bit only if the suit has five or more cards.
+
+_CARD_SUIT_COUNTS = [1 << (4 * (idx // 13)) for idx in range(52)]
+_FLUSH_TEST = 0x3333
+_FLUSH_MASK = 0x8888
+
+# Tables mapping the prime product of six or seven ranks to the
+# best rank which can be made from them, filled as new products
+# are encountered. There are at most 49,205 seven card and 18,395
+# six card non-flush products from a single pack. Flush products
+# map to a tuple of the best rank of five different cards, and
+# whether the best flush contains the same card more than once.
+
+_BEST_PRODUCTS = {}
+_BEST_FLUSHES = {}
+
+
+def _repeated_flush_rank(product):
+
+    """Returns the equivalence class rank of five cards of one suit
+    including the same card more than once, from multiple packs, from
+    the product of their primes.
+
+    The cards make a flush which beats any flush of five different
+    cards, and which has no equivalence class rank, so 0 is returned
+    unless they make a full house or four of a kind.
+
+    """
+
+    rank = _PRODUCTS.get(product, 0)
+    return rank if rank <= _WORST_FULL_HOUSE else 0
+
+
+def _evaluate_indices(ix1, ix2, ix3, ix4, ix5):
+
+    """Returns the equivalence class rank of five valid card indices,
+    or 0 if the cards do not form a rankable hand, for instance a
+    flush containing the same card twice.
+
+    """
+
+    primes = _CARD_PRIMES
+    suits = _CARD_SUITS
+    product = (primes[ix1] * primes[ix2] * primes[ix3] *
+               primes[ix4] * primes[ix5])
+
+    if suits[ix1] & suits[ix2] & suits[ix3] & suits[ix4] & suits[ix5]:
+        return _FLUSHES.get(product) or _repeated_flush_rank(product)
+    else:
+        return _PRODUCTS.get(product, 0)
+
+
+def _best_rank(primes, table):
+
+    """Returns the best rank which can be made from any five of a
+    list of primes using the specified five card table, or 0 if
+    none can be made.
+
+    """
+
+    best = 0
+    for cmb in combinations(primes, 5):
+        rank = table.get(cmb[0] * cmb[1] * cmb[2] * cmb[3] * cmb[4], 0)
+        if rank and (not best or rank < best):
+            best = rank
+    return best
+
+
+def _evaluate_counts(product, suit_counts, size, indices):
+
+    """Returns the equivalence class rank of the best five card hand
+    which can be made from five, six or seven valid card indices, from
+    the product of their primes and the sum of their suit counts, or
+    0 if no rankable hand can be made. The indices themselves are
+    only needed for six or seven cards, and can be None for five.
+
+    With cards from multiple packs, the best flush may contain the
+    same card more than once. Such a flush beats any flush of five
+    different cards and has no equivalence class rank, so the hand
+    cannot be ranked unless it makes a straight flush, four of a kind
+    or a full house.
+
+    """
+
+    if size == 5:
+        if (suit_counts + _FLUSH_TEST) & _FLUSH_MASK:
+            return _FLUSHES.get(product) or _repeated_flush_rank(product)
+        else:
+            return _PRODUCTS.get(product, 0)
+
+    rank = _BEST_PRODUCTS.get(product)
+    if rank is None:
+        primes = _CARD_PRIMES
+        rank = _best_rank([primes[idx] for idx in indices], _PRODUCTS)
+        _BEST_PRODUCTS[product] = rank
+
+    flush_bits = (suit_counts + _FLUSH_TEST) & _FLUSH_MASK
+    if flush_bits:
+
+        # At most one suit can have five or more cards, and
+        # the flush is made only from the cards of that suit.
+
+        primes = _CARD_PRIMES
+        suit = (flush_bits.bit_length() - 4) // 4
+        flush_primes = [primes[idx] for idx in indices if idx // 13 == suit]
+        flush_product = 1
+        for prime in flush_primes:
+            flush_product *= prime
+
+        # The best flush is made from the five highest cards of the
+        # suit, so it contains the same card twice if they do.
+
+        flush = _BEST_FLUSHES.get(flush_product)
+        if flush is None:
+            highest = sorted(flush_primes, reverse=True)[:5]
+            flush = (_best_rank(flush_primes, _FLUSHES),
+                     len(set(highest)) < 5)
+            _BEST_FLUSHES[flush_product] = flush
+        flush_rank, repeated = flush
+
+        if repeated:
+            if flush_rank > _WORST_STRAIGHT_FLUSH:
+                flush_rank = 0
+            if rank > _WORST_FULL_HOUSE:
+                rank = 0
+        if flush_rank and (not rank or flush_rank < rank):
+            rank = flush_rank
+
+    return rank
+
+
+def _evaluate_best(indices):
+
+    """Returns the equivalence class rank of the best five card hand
+    which can be made from six or seven valid card indices, or 0 if
+    no rankable hand can be made.
+
+    """
+
+    primes = _CARD_PRIMES
+    suit_counts = _CARD_SUIT_COUNTS
+    product = 1
+    counts = 0
+    for index in indices:
+        product *= primes[index]
+        counts += suit_counts[index]
+
+    return _evaluate_counts(product, counts, len(indices), indices)
+
+
+def _check_indices(indices):
+
+    """Raises ValueError if a sequence of card indices is not
+    a valid five, six or seven card hand.
+
+    """
+
+    if len(indices) not in range(5, 8):
+        raise ValueError("Only five, six or seven card hands " +
+                         "can be evaluated.")
+
+    for index in indices:
+        if index not in range(0, 52):
+            raise ValueError("Invalid index value '{0}'".format(index))
+
+
+# Public functions
+
+def evaluate(indices):
+
+    """Returns the equivalence class rank of a poker hand.
+
+    The rank is an integer from 1 to 7462 inclusive, where 1 is a
+    royal flush and 7462 is the worst possible high card hand,
+    7-5-4-3-2. Two hands with the same rank are of exactly equal
+    value. Six and seven card hands are ranked by the best five
+    card hand which can be made from them.
+
+    Arguments:
+    indices -- a sequence of five, six or seven card indices, as
+    returned from Card.index().
+
+    Exceptions raised:
+    ValueError -- if the wrong number of cards is provided, if any
+    index is invalid, or if the cards do not form a rankable hand
+    (e.g. five of a kind from multiple packs, or a hand whose best
+    five cards are a flush containing the same card twice).
+
+    """
+
+    _check_indices(indices)
+
+    if len(indices) == 5:
+        rank = _evaluate_indices(indices[0], indices[1], indices[2],
+                                 indices[3], indices[4])
+    else:
+        rank = _evaluate_best(indices)
+
+    if not rank:
+        raise ValueError("Cards do not form a rankable hand.")
+    return rank
+
+
+def best_five(indices):
+
+    """Returns a tuple of the five card indices making up the best
+    hand which can be made from a five, six or seven card hand.
+
+    Arguments:
+    indices -- a sequence of five, six or seven card indices, as
+    returned from Card.index().
+
+    Exceptions raised:
+    ValueError -- in the same circumstances as evaluate().
+
+    """
+
+    rank = evaluate(indices)
+    for cmb in combinations(indices, 5):
+        if _evaluate_indices(*cmb) == rank:     # pylint: disable=W0142
+            return cmb
+
+
+def rank_category(rank):
+
+    """Returns the category of a hand from its equivalence class rank.
+
+    The category is an integer from 0 (high card) to 9 (royal flush),
+    following the same order as the hand strings used by PokerHand.
+
+    """
+
+    if rank not in range(1, WORST_RANK + 1):
+        raise ValueError("Invalid rank value '{0}'".format(rank))
+
+    for first, category in reversed(_CATEGORY_BOUNDS):
+        if rank >= first:
+            return category
@@ -12,8 +12,10 @@ http://www.gnu.org/licenses/
 
 
 from collections import defaultdict
+from contextlib import contextmanager
 
-from .card import Card, get_rank_integer
+from .card import Card, get_rank_integer, _get_index_from_name
+from .card import _PADDED_SHORT_NAMES
 
 
 # Exceptions
@@ -39,6 +41,7 @@ class Hand(object):
 
     Public methods:
     __init__(deck, numcards, namelist, cardlist, nocopy)
+    batch()
     copy()
     discard()
     draw(numcards)
@@ -92,28 +95,67 @@ class Hand(object):
 
         """
 
-        self._score = []
+        self._score = 0
         self._cards = []
         self._deck = deck
         self._observers = []
+        self._batch_depth = 0
+        self._batch_changed = False
+
+        # The cards are added in one batch, so the hand is evaluated
+        # once rather than after each card is added.
 
         if numcards and deck and not namelist:
             self.draw(numcards)
-            self._cards_changed()
         elif namelist:
-            for name in namelist:
-                self._cards.append(Card(name=name))
-                self._cards_changed()
+            # Disable pylint message for access to protected member
+            # Card._from_index(), since the name lookup validates the
+            # index.
+            #
+            # pylint: disable=W0212
+
+            self._cards = [Card._from_index(_get_index_from_name(name))
+                           for name in namelist]
+            self._cards_changed()
+
+            # pylint: enable=W0212
         elif cardlist:
             if nocopy:
                 self._cards = cardlist
             else:
-                for card in cardlist:
-                    self._cards.append(card.copy())
-                    self._cards_changed()
+                self._cards = [card.copy() for card in cardlist]
+                self._cards_changed()
 
     # Public methods
 
+    @contextmanager
+    def batch(self):
+
+        """Returns a context manager which defers evaluation of the
+        hand and notification of observers until the end of a block
+        of changes, e.g.:
+
+            with hand.batch():
+                hand[0] = card1
+                hand[3] = card2
+
+        The hand is evaluated and observers are notified once at the
+        end of the block, if any cards changed, even if the block
+        raises an exception. Blocks may be nested, in which case this
+        happens at the end of the outermost block. The hand should
+        not be compared or shown inside the block.
+
+        """
+
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_changed:
+                self._batch_changed = False
+                self._cards_changed()
+
     def copy(self):
 
         """Returns a new Hand instance which is a copy of the
@@ -154,8 +196,9 @@ class Hand(object):
         if self._deck is None:
             raise NoAssociatedDeckError
         else:
-            self._cards.extend(self._deck.draw(numcards, face_up, face_down))
-            self._cards_changed()
+            drawn_cards = self._deck.draw(numcards, face_up, face_down)
+            self._cards.extend(drawn_cards)
+            self._cards_replaced([], drawn_cards)
 
     def exchange(self, chg=None, face_up=False, face_down=False):
 
@@ -172,6 +215,7 @@ class Hand(object):
         """
 
         discards = []
+        drawn_cards = []
 
         if chg:
             for idx in chg:
@@ -180,14 +224,16 @@ class Hand(object):
                     self._cards[int(idx) - 1] = self._deck.draw(1,
                                                                 face_up,
                                                                 face_down)[0]
+                    drawn_cards.append(self._cards[int(idx) - 1])
         else:
             for idx, card in enumerate(self._cards):
                 if card.is_face_down():
                     discards.append(card)
                     self._cards[idx] = self._deck.draw(1, face_up, face_down)[0]
+                    drawn_cards.append(self._cards[idx])
 
         self._deck.discard(discards)
-        self._cards_changed()
+        self._cards_replaced(discards, drawn_cards)
 
     def face_up(self, position=None):
 
@@ -261,8 +307,10 @@ class Hand(object):
 
         """
 
-        return ''.join([" {0:>3}".format(c.name_string(short=True))
-                        for c in self._cards])
+        # pylint: disable=W0212
+
+        return ''.join([_PADDED_SHORT_NAMES[card._index]
+                        for card in self._cards])
 
     # Comparison operators
 
@@ -388,8 +436,9 @@ class Hand(object):
             raise NotImplementedError("You can only add another " +
                                       "Hand to a Hand.")
         else:
-            self.extend(other)
-            self._cards_changed()
+            with self.batch():
+                self.extend(other)
+                self._cards_changed()
             return self
 
     def __imul__(self, other):
@@ -400,11 +449,12 @@ class Hand(object):
             raise NotImplementedError("You can only multiply a Hand by " +
                                       "a positive integer")
         else:
-            new_cards = []
-            for copies in range(other - 1):    # pylint: disable=W0612
-                new_cards.extend(self.copy().get_list())
-            self._cards.extend(new_cards)
-            self._cards_changed()
+            with self.batch():
+                new_cards = []
+                for copies in range(other - 1):    # pylint: disable=W0612
+                    new_cards.extend([card.copy() for card in self._cards])
+                self._cards.extend(new_cards)
+                self._cards_changed()
             return self
 
     # Indexing and iteration methods
@@ -442,15 +492,20 @@ class Hand(object):
         elif not isinstance(value, Card):
             raise TypeError("Only Card instances can be assigned.")
         else:
+            old_card = self._cards[key]
             self._cards[key] = value.copy()
-            self._cards_changed()
+            self._cards_replaced([old_card], [self._cards[key]])
 
     def __delitem__(self, key):
 
         """Deletes the card at the specified index."""
 
-        del self._cards[key] 
-        self._cards_changed()
+        if isinstance(key, slice):
+            del self._cards[key]
+            self._cards_changed()
+        else:
+            old_card = self._cards.pop(key)
+            self._cards_replaced([old_card], [])
 
     def __iter__(self):
 
@@ -479,8 +534,9 @@ class Hand(object):
         if not isinstance(value, Card):
             raise TypeError("Only Card instances can be appended.")
         else:
-            self._cards.append(value.copy())
-            self._cards_changed()
+            new_card = value.copy()
+            self._cards.append(new_card)
+            self._cards_replaced([], [new_card])
 
     def count(self, value):
 
@@ -509,8 +565,9 @@ class Hand(object):
             raise TypeError("Hand instances may only be extended with " +
                             "other Hand instances.")
         else:
-            self._cards.extend(hand.copy().get_list())
-            self._cards_changed()
+            new_cards = hand.copy().get_list()
+            self._cards.extend(new_cards)
+            self._cards_replaced([], new_cards)
 
     def index(self, value):
 
@@ -541,8 +598,9 @@ class Hand(object):
             raise TypeError("Only Card instances may be inserted into " +
                             "Hand instances.")
         else:
-            self._cards.insert(idx, value.copy())
-            self._cards_changed()
+            new_card = value.copy()
+            self._cards.insert(idx, new_card)
+            self._cards_replaced([], [new_card])
 
     def pop(self, idx=None):
 
@@ -557,7 +615,7 @@ class Hand(object):
             ret_card = self._cards.pop(idx)
         else:
             ret_card = self._cards.pop()
-        self._cards_changed()
+        self._cards_replaced([ret_card], [])
         return ret_card
 
     def remove(self, value):
@@ -570,8 +628,8 @@ class Hand(object):
         if not isinstance(value, Card):
             raise TypeError("Only Cards may be removed from a Hand.")
         else:
-            self._cards.remove(value)
-            self._cards_changed()
+            old_card = self._cards.pop(self._cards.index(value))
+            self._cards_replaced([old_card], [])
 
     def sort(self, key=None, reverse=False):        # pylint: disable=W0613
 
@@ -598,8 +656,37 @@ class Hand(object):
 
         """
 
+        if self._deferred():
+            return
+
         self._notify_observers()
 
+    def _cards_replaced(self, removed, added):
+
+        """Called instead of _cards_changed() when the cards which
+        were removed from and added to the card list are known, with
+        lists of those cards. Subclasses can override this to update
+        their state incrementally, rather than from the whole list.
+
+        """
+
+        self._cards_changed()
+
+    def _deferred(self):
+
+        """Returns True, and records that the cards have changed, if
+        evaluation and notification are deferred by batch().
+        Subclasses which override _cards_changed() or
+        _cards_replaced() should return immediately if so.
+
+        """
+
+        if self._batch_depth:
+            self._batch_changed = True
+            return True
+        else:
+            return False
+
     def _notify_observers(self):
 
         """Notifies observers."""
@@ -12,8 +12,11 @@ http://www.gnu.org/licenses/
 
 
 from collections import namedtuple
+from itertools import combinations
 
 from .card import rank_string
+from .evaluator import _CARD_PRIMES, _CARD_SUIT_COUNTS
+from .evaluator import _evaluate_counts, best_five
 from .hand import Hand
 
 
@@ -47,6 +50,8 @@ _STRAIGHT = 6
 _STRAIGHTFLUSH = 7
 _ROYALFLUSH = 8
 
+_CATEGORY_SHIFT = 20
+
 _HAND_STRINGS_SHORT = [
     "HI", "PR", "TP", "TK", "ST",
     "FL", "FH", "FK", "SF", "RF"
@@ -70,14 +75,47 @@ _HAND_STRINGS_LONG = [
 ]
 
 
+# Non-public variables
+
+# Cache of evaluation results for each equivalence class rank
+# returned by the evaluator module. Hands in the same class
+# always have the same score and hand information, so each
+# class only needs to be evaluated in full once.
+
+_RANK_CLASSES = {}
+
+
+# Non-public functions
+
+def _pack_score(category, ranks):
+
+    """Returns an integer score from a hand category and a list
+    of up to five ranks, in order of significance.
+
+    """
+
+    score = category << _CATEGORY_SHIFT
+    shift = _CATEGORY_SHIFT
+    for rank in ranks:
+        shift -= 4
+        score |= rank << shift
+    return score
+
+
 # Class
 
 class PokerHand(Hand):
 
     """Implements a five card regular poker hand class.
 
+    Six and seven card hands, e.g. hold'em hole cards together
+    with the board, are evaluated on the best five card hand
+    which can be made from them.
+
     Public methods:
     __init__(deck, numcards, namelist)
+    best_five()
+    score_int()
     show_value(short, full)
     video_winnings(bet, easy)
 
@@ -97,11 +135,88 @@ class PokerHand(Hand):
 
         self._singles = []
         self._hand_info = None
+        self._rank = 0
+
+        # The product of the primes of the ranks of the cards, and
+        # the sum of their suit counts, from the evaluator module, as
+        # calculated by _count_cards(), and the number of cards they
+        # were calculated from, or None if they are out of date. They
+        # are calculated again from the whole card list after every
+        # change, which for hands of up to seven cards costs no more
+        # than updating them for the cards changed, and picks up any
+        # changes made without notification, e.g. through get_list().
+
+        self._product = 1
+        self._suit_counts = 0
+        self._counted = 0
 
         Hand.__init__(self, deck, numcards, namelist, cardlist)
 
     # Public methods
 
+    def best_five(self):
+
+        """Returns a new PokerHand instance containing copies of the
+        five cards which make up the best hand which can be made from
+        a five, six or seven card hand.
+
+        Hands which the tables cannot rank (e.g. a flush containing
+        duplicate cards from multiple packs) are compared one five
+        card hand at a time, each evaluated in full, leaving out any
+        which cannot be evaluated (e.g. five of a kind).
+
+        Exceptions raised:
+        ValueError -- if the hand does not have five, six or seven
+        cards.
+        NotImplementedError -- if every five card hand which can be
+        made is five of a kind.
+
+        """
+
+        if not 5 <= len(self._cards) <= 7:
+            raise ValueError("Only five, six or seven card hands " +
+                             "have a best five card hand.")
+
+        try:
+            best = list(best_five(self.index_list()))
+        except ValueError:
+            best_hand = None
+            for cmb in combinations(self._cards, 5):
+                try:
+                    hand = self.__class__(cardlist=list(cmb))
+                except NotImplementedError:
+                    continue
+                if (best_hand is None or
+                        hand.score_int() > best_hand.score_int()):
+                    best_hand = hand
+            if best_hand is None:
+                raise NotImplementedError("Five of a kind not " +
+                                          "implemented.")
+            return best_hand
+
+        cards = []
+        for card in self._cards:
+            if card.index() in best:
+                best.remove(card.index())
+                cards.append(card)
+        return self.__class__(cardlist=cards)
+
+    def score_int(self):
+
+        """Returns the score of the hand as a single integer.
+
+        Higher scores are better hands, and hands with equal
+        scores are of equal value. The hand category, from 0 for
+        high card to 9 for a royal flush, is stored above bit 20,
+        and the ranks which break ties within a category are
+        stored in four bit fields below it, most significant
+        first. Scores are 0 for hands which have not been
+        evaluated.
+
+        """
+
+        return self._score
+
     def show_value(self, short=False, full=True):
 
         """Returns a string containing the name of, and
@@ -118,9 +233,9 @@ class PokerHand(Hand):
         """
 
         if short:
-            return _HAND_STRINGS_SHORT[self._score[0]]
+            return _HAND_STRINGS_SHORT[self._score >> _CATEGORY_SHIFT]
         elif full:
-            hsl = _HAND_STRINGS_LONG[self._score[0]]
+            hsl = _HAND_STRINGS_LONG[self._score >> _CATEGORY_SHIFT]
             if hsl.fargs:
                 arg_list = [rank_string(self._hand_info_item(item))
                             for item in hsl.fargs]
@@ -133,7 +248,7 @@ class PokerHand(Hand):
             else:
                 return hsl.fstr.format()
         else:
-            return _HAND_STRINGS_NORMAL[self._score[0]]
+            return _HAND_STRINGS_NORMAL[self._score >> _CATEGORY_SHIFT]
 
     def video_winnings(self, bet, easy=False):
 
@@ -151,10 +266,11 @@ class PokerHand(Hand):
         else:
             rtns = PokerHand._vp_returns_normal
 
-        if self._score[0] == 1 and self._hand_info.low_pair < 11:
+        category = self._score >> _CATEGORY_SHIFT
+        if category == 1 and self._hand_info.low_pair < 11:
             return 0        # Pairs only win if Jacks or better
         else:
-            return rtns[self._score[0]] * bet
+            return rtns[category] * bet
 
     # Non-public methods
 
@@ -181,6 +297,42 @@ class PokerHand(Hand):
         """Evaluates a poker hand and stores information
         necessary for later comparison.
 
+        The equivalence class of the hand is looked up from the
+        evaluator tables, and the score and hand information for
+        that class are reused if it has been seen before. Hands
+        which the tables cannot rank (e.g. a flush containing
+        duplicate cards from multiple packs) are evaluated in full.
+
+        """
+
+        if self._counted is None:
+            self._count_cards()
+
+        size = len(self._cards)
+        self._rank = _evaluate_counts(self._product, self._suit_counts, size,
+                                      None if size == 5 else
+                                      self.index_list())
+
+        cached = _RANK_CLASSES.get(self._rank)
+        if cached:
+            self._score, self._hand_info, self._singles = cached
+        elif size != 5:
+            best = self.best_five()
+            self._score = best._score
+            self._hand_info = best._hand_info
+            self._singles = best._singles
+        elif self._rank:
+            self._evaluate_cards()
+            _RANK_CLASSES[self._rank] = (self._score, self._hand_info,
+                                         self._singles)
+        else:
+            self._evaluate_cards()
+
+    def _evaluate_cards(self):
+
+        """Evaluates a poker hand directly from its cards and
+        stores information necessary for later comparison.
+
         """
 
         # Identify singles, pairs, threes and fours
@@ -217,45 +369,47 @@ class PokerHand(Hand):
     def _set_score(self):
 
         """Stores a score for the hand, to enable us to
-        compare them, later. The score is a list,
-        representing - from left to right - the things
-        that determine a winning poker hand. For example,
-        for a three of a kind, first compare the overall
-        category (e.g. a three of a kind (4) always beats
-        a pair (2) but never beats a flush (6)). If we
-        have two threes of a kind, then compare the ranks
-        of the threes (self.three). If the ranks of the
-        threes are the same (this is possible in reality
-        if wild cards or community cards are used) then
-        look through the remaining cards (self._singles)
-        for the hightest card. Because of the way Python
-        compares lists, we can set up the score like this
-        and have Python do almost all of the dirty work
-        for us just using comparison operators.
+        compare them, later. The score is a single integer
+        packing - from the most significant bits to the
+        least - the things that determine a winning poker
+        hand. For example, for a three of a kind, first
+        compare the overall category (e.g. a three of a
+        kind (3) always beats a pair (1) but never beats a
+        flush (5)). If we have two threes of a kind, then
+        compare the ranks of the threes (self.three). If the
+        ranks of the threes are the same (this is possible in
+        reality if wild cards or community cards are used)
+        then look through the remaining cards (self._singles)
+        for the hightest card. The category is stored above
+        bit 20, and each of up to five ranks is stored in a
+        four bit field below it, highest first, so plain
+        integer comparisons do all of the dirty work for us.
 
         """
 
-        if self._hand_info.royal_flush:
-            self._score = [9]
-        elif self._hand_info.straight_flush:
-            self._score = [8, self._hand_info.high_card]
-        elif self._hand_info.four:
-            self._score = [7, self._hand_info.four, self._singles]
-        elif self._hand_info.three and self._hand_info.low_pair:
-            self._score = [6, self._hand_info.three, self._hand_info.low_pair]
-        elif self._hand_info.flush:
-            self._score = [5, self._ranks(reverse=True)]
-        elif self._hand_info.straight:
-            self._score = [4, self._hand_info.high_card]
-        elif self._hand_info.three:
-            self._score = [3, self._hand_info.three, self._singles]
-        elif self._hand_info.high_pair:
-            self._score = [2, self._hand_info.high_pair,
-                           self._hand_info.low_pair, self._singles]
-        elif self._hand_info.low_pair:
-            self._score = [1, self._hand_info.low_pair, self._singles]
+        info = self._hand_info
+
+        if info.royal_flush:
+            self._score = _pack_score(9, [])
+        elif info.straight_flush:
+            self._score = _pack_score(8, [info.high_card])
+        elif info.four:
+            self._score = _pack_score(7, [info.four] + self._singles)
+        elif info.three and info.low_pair:
+            self._score = _pack_score(6, [info.three, info.low_pair])
+        elif info.flush:
+            self._score = _pack_score(5, self._ranks(reverse=True))
+        elif info.straight:
+            self._score = _pack_score(4, [info.high_card])
+        elif info.three:
+            self._score = _pack_score(3, [info.three] + self._singles)
+        elif info.high_pair:
+            self._score = _pack_score(2, [info.high_pair, info.low_pair] +
+                                      self._singles)
+        elif info.low_pair:
+            self._score = _pack_score(1, [info.low_pair] + self._singles)
         else:
-            self._score = [0, self._singles]
+            self._score = _pack_score(0, self._singles)
 
     def _get_rank_matches(self):
 
@@ -328,10 +482,37 @@ class PokerHand(Hand):
         else:
             return False
 
+    def _count_cards(self):
+
+        """Calculates the prime product and suit counts of the
+        cards from the whole card list.
+
+        """
+
+        # pylint: disable=W0212
+
+        primes = _CARD_PRIMES
+        suit_counts = _CARD_SUIT_COUNTS
+        product = 1
+        counts = 0
+        for card in self._cards:
+            product *= primes[card._index]
+            counts += suit_counts[card._index]
+
+        # pylint: enable=W0212
+
+        self._product = product
+        self._suit_counts = counts
+        self._counted = len(self._cards)
+
     def _cards_changed(self):
 
         """Override superclass function and evaluate hand."""
 
+        if self._deferred():
+            return
+
         Hand._cards_changed(self)
-        if len(self._cards) == 5:
+        self._counted = None
+        if 5 <= len(self._cards) <= 7:
             self._evaluate()
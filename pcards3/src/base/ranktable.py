@@ -0,0 +1,215 @@
+"""Five card rank table module.
+
+Library Release 1.2
+
+Copyright 2013 Paul Griffiths
+Email: mail@paulgriffiths.net
+
+Distributed under the terms of the GNU General Public License.
+http://www.gnu.org/licenses/
+
+"""
+
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from .evaluator import _CARD_PRIMES, _CARD_SUIT_COUNTS
+from .evaluator import _FLUSH_TEST, _FLUSH_MASK, _FLUSHES, _PRODUCTS
+
+
+# Public constants
+
+# Number of five card hands from a single pack, and so of entries
+# in the rank table.
+
+RANK_TABLE_SIZE = 2598960
+
+
+# Non-public constants
+
+# Default rank table file, which may be overridden by setting the
+# environment variable named by _PATH_VARIABLE.
+
+_DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "ranks5.tbl")
+_PATH_VARIABLE = "PCARDS_RANK_TABLE"
+
+# Rank table file header: identifier, format version, size in bytes
+# of each entry, number of entries and CRC-32 checksum of the
+# entries. The header is followed by the rank of each hand as a
+# little-endian 16-bit integer, in colexicographic order of the
+# hands' card indices.
+
+_TABLE_MAGIC = b"PCRT"
+_TABLE_VERSION = 1
+_TABLE_HEADER = struct.Struct("<4sHHII")
+
+
+# Non-public variables
+
+# Rank tables loaded or built by this process, by file name.
+
+_TABLES = {}
+
+
+# Non-public functions
+
+def _build_ranks():
+
+    """Returns an array of the rank of every five card hand, in
+    colexicographic order of the hands' card indices.
+
+    """
+
+    primes = _CARD_PRIMES
+    suit_counts = _CARD_SUIT_COUNTS
+    flushes = _FLUSHES
+    products = _PRODUCTS
+    flush_test = _FLUSH_TEST
+    flush_mask = _FLUSH_MASK
+
+    # In colexicographic order the highest index changes slowest, so
+    # the hands are generated highest card first, with the product
+    # and suit counts of the higher cards carried into the inner loops.
+
+    ranks = array("H")
+    append = ranks.append
+    for ix5 in range(4, 52):
+        product5 = primes[ix5]
+        counts5 = suit_counts[ix5]
+        for ix4 in range(3, ix5):
+            product4 = product5 * primes[ix4]
+            counts4 = counts5 + suit_counts[ix4]
+            for ix3 in range(2, ix4):
+                product3 = product4 * primes[ix3]
+                counts3 = counts4 + suit_counts[ix3]
+                for ix2 in range(1, ix3):
+                    product2 = product3 * primes[ix2]
+                    counts2 = counts3 + suit_counts[ix2]
+                    for ix1 in range(ix2):
+                        counts = counts2 + suit_counts[ix1]
+                        if (counts + flush_test) & flush_mask:
+                            append(flushes[product2 * primes[ix1]])
+                        else:
+                            append(products[product2 * primes[ix1]])
+    return ranks
+
+
+def _table_path(filename):
+
+    """Returns the rank table file name to use."""
+
+    if filename is not None:
+        return filename
+    return os.environ.get(_PATH_VARIABLE) or _DEFAULT_PATH
+
+
+def _map_table(filename):
+
+    """Returns a read-only memoryview of the ranks in a rank table
+    file, shared with any other process mapping the same file, or
+    None if the file is missing or invalid.
+
+    """
+
+    if sys.byteorder != "little":
+        return None
+
+    try:
+        with open(filename, "rb") as infile:
+            mapped = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    size = _TABLE_HEADER.size
+    if len(mapped) != size + RANK_TABLE_SIZE * 2:
+        mapped.close()
+        return None
+    magic, version, entry_size, count, checksum = \
+        _TABLE_HEADER.unpack_from(mapped)
+    if (magic != _TABLE_MAGIC or version != _TABLE_VERSION or
+            entry_size != 2 or count != RANK_TABLE_SIZE or
+            zlib.crc32(memoryview(mapped)[size:]) != checksum):
+        mapped.close()
+        return None
+
+    # The memoryview keeps the mapping open for as long as it is used.
+
+    return memoryview(mapped)[size:].cast("H")
+
+
+# Public functions
+
+def build_rank_table(filename=None):
+
+    """Calculates the rank of every five card hand, which takes a
+    few seconds, and writes them to a rank table file for
+    rank_table() to load. Returns the name of the file written.
+
+    The file is written to a temporary file first and then renamed,
+    so that processes loading it at the same time never see a
+    partly written table.
+
+    Arguments:
+    filename -- the name of the file to write. Defaults to the file
+    named by the PCARDS_RANK_TABLE environment variable, or to
+    ranks5.tbl in the pcards package directory.
+
+    """
+
+    filename = _table_path(filename)
+    ranks = _build_ranks()
+    if sys.byteorder != "little":
+        ranks.byteswap()
+    data = ranks.tobytes()
+
+    temporary = "{0}.{1}.tmp".format(filename, os.getpid())
+    with open(temporary, "wb") as outfile:
+        outfile.write(_TABLE_HEADER.pack(
+            _TABLE_MAGIC, _TABLE_VERSION, 2, RANK_TABLE_SIZE,
+            zlib.crc32(data)))
+        outfile.write(data)
+    os.replace(temporary, filename)
+
+    _TABLES.pop(filename, None)
+    return filename
+
+
+def rank_table(filename=None, build=True):
+
+    """Returns a sequence of the equivalence class rank of every
+    five card hand, as returned by evaluator.evaluate(), indexed by
+    the position of the hand's card indices in colexicographic order,
+    i.e. comb(i1, 1) + comb(i2, 2) + ... + comb(i5, 5) for card
+    indices i1 < i2 < ... < i5.
+
+    The table is loaded once per process from a rank table file
+    written by build_rank_table(), by memory-mapping it, so that all
+    processes using the same file share a single copy in memory. Its
+    checksum is verified when it is first loaded. If the file is
+    missing or invalid, the table is built in memory instead, which
+    takes a few seconds.
+
+    Arguments:
+    filename -- the name of the rank table file. Defaults as for
+    build_rank_table().
+    build -- if set to 'False', return None rather than building the
+    table if the file is missing or invalid.
+
+    """
+
+    filename = _table_path(filename)
+    table = _TABLES.get(filename)
+    if table is None:
+        table = _map_table(filename)
+        if table is None:
+            if not build:
+                return None
+            table = _build_ranks()
+        _TABLES[filename] = table
+    return table
@@ -0,0 +1,487 @@
+"""Batch poker hand evaluation module. Requires NumPy.
+
+Library Release 1.2
+
+Copyright 2013 Paul Griffiths
+Email: mail@paulgriffiths.net
+
+Distributed under the terms of the GNU General Public License.
+http://www.gnu.org/licenses/
+
+"""
+
+
+from itertools import combinations, combinations_with_replacement
+
+import numpy as np
+
+from .base import evaluator
+from .base.combinatorics import _BINOMIALS
+from .base.evaluator import WORST_RANK
+from .base.evaluator import _WORST_FULL_HOUSE, _WORST_STRAIGHT_FLUSH
+from .base.ranktable import rank_table
+
+
+# Non-public constants
+
+# Rows are evaluated in blocks of this many hands, to bound the
+# size of the temporary arrays.
+
+_BLOCK_SIZE = 1 << 20
+
+# Disable pylint message for access to protected members of the
+# evaluator module, which provides the five card tables.
+#
+# pylint: disable=W0212
+
+_CARD_PRIMES = np.array(evaluator._CARD_PRIMES, dtype=np.int64)
+_CARD_SUITS = np.arange(52, dtype=np.int64) // 13
+
+# First rank of each category, best hands first, and the category
+# code for each, as used by rank_categories().
+
+_CATEGORY_FIRSTS = np.array([first for first, _ in
+                             evaluator._CATEGORY_BOUNDS])
+_CATEGORY_CODES = np.array([code for _, code in
+                            evaluator._CATEGORY_BOUNDS])
+
+# pylint: enable=W0212
+
+# Binomial coefficients comb(index, k) for each card index and k
+# from 0 to 52, for the colexicographic positions of combinations of
+# cards, such as five card hands in the shared rank table.
+
+_COLEX_BINOMIALS = np.array(_BINOMIALS[:52], dtype=np.int64)
+
+
+# Non-public variables
+
+# Sorted lookup tables, as a (keys, ranks) tuple of arrays for
+# each of the flush and non-flush tables for each hand size,
+# built on first use.
+
+_TABLES = {}
+
+
+# Non-public functions
+
+def _sorted_table(table):
+
+    """Returns a (keys, ranks) tuple of arrays sorted by key from
+    a dictionary mapping prime products to ranks.
+
+    """
+
+    keys = np.array(sorted(table), dtype=np.int64)
+    ranks = np.array([table[key] for key in keys.tolist()], dtype=np.int32)
+    return (keys, ranks)
+
+
+def _tables(size):
+
+    """Returns the flush and non-flush lookup tables for hands of
+    a given size, building them if necessary.
+
+    """
+
+    # pylint: disable=W0212
+
+    if size not in _TABLES:
+        if size == 5:
+            flushes = evaluator._FLUSHES
+            products = evaluator._PRODUCTS
+        else:
+            primes = evaluator._PRIMES
+            products = {}
+
+            # Ranks with more than four cards, from multiple packs,
+            # are included, and ranked by the best five cards without
+            # five of a kind, as by the evaluator module.
+
+            for ranks in combinations_with_replacement(range(13), size):
+                cards = [primes[rank] for rank in ranks]
+                product = evaluator._rank_product(ranks)
+                products[product] = evaluator._best_rank(
+                    cards, evaluator._PRODUCTS)
+
+            # The ranks of the cards of a flush suit may be repeated
+            # with multiple packs, and the best rank is then of five
+            # different cards, or 0 if there are none.
+
+            flushes = {}
+            for length in range(5, size + 1):
+                for ranks in combinations_with_replacement(range(13),
+                                                           length):
+                    cards = [primes[rank] for rank in ranks]
+                    product = evaluator._rank_product(ranks)
+                    flushes[product] = evaluator._best_rank(
+                        cards, evaluator._FLUSHES)
+
+        _TABLES[size] = (_sorted_table(flushes), _sorted_table(products))
+
+    # pylint: enable=W0212
+
+    return _TABLES[size]
+
+
+def _lookup(table, products):
+
+    """Returns an array of ranks looked up from a (keys, ranks)
+    table for an array of prime products, with 0 for products
+    not found in the table.
+
+    """
+
+    keys, ranks = table
+    positions = np.searchsorted(keys, products)
+    np.minimum(positions, len(keys) - 1, out=positions)
+    return np.where(keys[positions] == products, ranks[positions], 0)
+
+
+def _repeated_flush_ranks(ranks):
+
+    """Returns an array of ranks for hands whose best flush contains
+    the same card more than once, from an array of their best ranks
+    without a flush, keeping only those which beat any flush, as the
+    evaluator module does.
+
+    """
+
+    return np.where(ranks <= _WORST_FULL_HOUSE, ranks, 0)
+
+
+def _evaluate_block(indices, flush_table, product_table):
+
+    """Returns an array of ranks for a two dimensional array of
+    valid card indices.
+
+    """
+
+    primes = _CARD_PRIMES[indices]
+    suits = _CARD_SUITS[indices]
+    ranks = _lookup(product_table, primes.prod(axis=1))
+
+    if indices.shape[1] == 5:
+        flush = (suits == suits[:, :1]).all(axis=1)
+        if flush.any():
+            flush_ranks = _lookup(flush_table, primes[flush].prod(axis=1))
+            ranks[flush] = np.where(flush_ranks > 0, flush_ranks,
+                                    _repeated_flush_ranks(ranks[flush]))
+        return ranks
+
+    # With six or seven cards, at most one suit can hold five or
+    # more cards, and the flush is made only from that suit.
+
+    counts = np.zeros((len(indices), 4), dtype=np.int64)
+    for suit in range(4):
+        counts[:, suit] = (suits == suit).sum(axis=1)
+    flush = counts.max(axis=1) >= 5
+
+    if flush.any():
+        flush_suits = counts[flush].argmax(axis=1)
+        flush_primes = np.where(suits[flush] == flush_suits[:, None],
+                                primes[flush], 1)
+        flush_ranks = _lookup(flush_table, flush_primes.prod(axis=1))
+        others = ranks[flush]
+
+        # With multiple packs, the best flush is made from the five
+        # highest cards of the suit, and contains the same card twice
+        # if they do, as for the evaluator module.
+
+        highest = -np.sort(-flush_primes, axis=1)[:, :5]
+        repeated = (highest[:, 1:] == highest[:, :-1]).any(axis=1)
+        flush_ranks = np.where(repeated & (flush_ranks >
+                                           _WORST_STRAIGHT_FLUSH),
+                               0, flush_ranks)
+        others = np.where(repeated, _repeated_flush_ranks(others), others)
+
+        better = (flush_ranks > 0) & ((others == 0) |
+                                      (flush_ranks < others))
+        ranks[flush] = np.where(better, flush_ranks, others)
+
+    return ranks
+
+
+def _evaluate_five_table(indices, ranks, flush_table, product_table):
+
+    """Returns an array of ranks for a two dimensional array of
+    valid five card indices, looked up from the shared rank table by
+    the colexicographic position of each hand, except for hands
+    which contain the same card more than once.
+
+    """
+
+    ordered = np.sort(indices, axis=1)
+    repeated = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+    result = np.empty(len(indices), dtype=np.int32)
+
+    # Hands with a repeated card have no position in the table, and
+    # the sum of their binomial coefficients may lie past its end, so
+    # only the other hands are looked up.
+
+    distinct = ~repeated
+    ordered = ordered[distinct]
+    positions = _COLEX_BINOMIALS[ordered[:, 0], 1]
+    for column in range(1, 5):
+        positions += _COLEX_BINOMIALS[ordered[:, column], column + 1]
+    result[distinct] = ranks[positions]
+
+    if repeated.any():
+        result[repeated] = _evaluate_block(indices[repeated],
+                                           flush_table, product_table)
+    return result
+
+
+# Public functions
+
+def evaluate_many(indices):
+
+    """Returns an array of equivalence class ranks for an array
+    of poker hands.
+
+    Each rank is an integer from 1 to 7462 inclusive, where 1 is a
+    royal flush and 7462 is the worst possible high card hand, as
+    returned by the evaluator.evaluate() function. Six and seven
+    card hands are ranked by the best five card hand which can be
+    made from them. Hands which do not form a rankable hand (e.g.
+    five of a kind from multiple packs) are given a rank of 0.
+
+    Five card hands are looked up directly from the shared rank table
+    of the ranktable module if its file has been built, and are
+    otherwise looked up by the prime product of their ranks.
+
+    Arguments:
+    indices -- an array of shape (N, 5), (N, 6) or (N, 7) of card
+    indices, as returned from Card.index(), one hand per row.
+
+    Exceptions raised:
+    ValueError -- if the array has the wrong shape, or if any
+    index is invalid.
+
+    """
+
+    indices = np.asarray(indices)
+    if (indices.ndim != 2 or indices.shape[1] not in range(5, 8) or
+            not np.issubdtype(indices.dtype, np.integer)):
+        raise ValueError("Indices must be an integer array of shape " +
+                         "(N, 5), (N, 6) or (N, 7).")
+    if indices.size and (indices.min() < 0 or indices.max() > 51):
+        raise ValueError("Invalid index value in indices.")
+
+    flush_table, product_table = _tables(indices.shape[1])
+    shared = rank_table(build=False) if indices.shape[1] == 5 else None
+    if shared is not None:
+        shared = np.frombuffer(shared, dtype=np.uint16)
+
+    ranks = np.empty(len(indices), dtype=np.int32)
+    for start in range(0, len(indices), _BLOCK_SIZE):
+        block = indices[start:start + _BLOCK_SIZE]
+        if shared is not None:
+            result = _evaluate_five_table(block, shared, flush_table,
+                                          product_table)
+        else:
+            result = _evaluate_block(block, flush_table, product_table)
+        ranks[start:start + len(block)] = result
+    return ranks
+
+
+def rank_categories(ranks):
+
+    """Returns an array of hand categories for an array of
+    equivalence class ranks.
+
+    Each category is an integer from 0 (high card) to 9 (royal
+    flush), following the same order as the hand strings used by
+    PokerHand. Ranks of 0, for unrankable hands, are given a
+    category of -1.
+
+    Arguments:
+    ranks -- an array of ranks, as returned by evaluate_many().
+
+    Exceptions raised:
+    ValueError -- if any rank is invalid.
+
+    """
+
+    ranks = np.asarray(ranks)
+    if ranks.size and (ranks.min() < 0 or ranks.max() > WORST_RANK):
+        raise ValueError("Invalid rank value in ranks.")
+
+    positions = np.searchsorted(_CATEGORY_FIRSTS, ranks, side="right") - 1
+    return np.where(ranks > 0, _CATEGORY_CODES[np.maximum(positions, 0)],
+                    -1)
+
+
+def deal_tables(tables, players, cards, board=0, rng=None, deck=None):
+
+    """Deals cards for many independent tables at once, and returns
+    a tuple containing an array of shape (tables, players, cards) of
+    the card indices of each player's hand, and an array of shape
+    (tables, board) of the card indices of each board, as returned
+    from Card.index().
+
+    Each table is dealt from its own shuffle of the same deck, by
+    choosing only the cards needed with a partial Fisher-Yates
+    shuffle applied to every table at once.
+
+    Arguments:
+    tables -- the number of tables to deal.
+    players -- the number of players at each table.
+    cards -- the number of cards to deal to each player.
+    board -- the number of board cards to deal for each table.
+    rng -- a numpy.random.Generator, or a seed for one.
+    deck -- a sequence of the card indices to deal from, which may
+    contain repeated indices for multiple packs. Defaults to a
+    single pack.
+
+    Exceptions raised:
+    ValueError -- if any number is negative, or if the deck does not
+    contain enough cards, or contains an invalid index.
+
+    """
+
+    if min(tables, players, cards, board) < 0:
+        raise ValueError("Numbers of tables, players and cards " +
+                         "must not be negative.")
+
+    deck = (np.arange(52, dtype=np.int8) if deck is None
+            else np.asarray(deck, dtype=np.int64))
+    if deck.size and (deck.min() < 0 or deck.max() > 51):
+        raise ValueError("Invalid index value in deck.")
+    deck = deck.astype(np.int8)
+
+    size = len(deck)
+    dealt = players * cards + board
+    if dealt > size:
+        raise ValueError("Not enough cards in deck.")
+    rng = np.random.default_rng(rng)
+
+    result = np.empty((tables, dealt), dtype=np.int8)
+    block_tables = max(1, _BLOCK_SIZE // max(size, 1))
+    for start in range(0, tables, block_tables):
+        count = min(block_tables, tables - start)
+        shuffled = np.tile(deck, (count, 1))
+        flat = shuffled.reshape(-1)
+        row_starts = np.arange(0, count * size, size)
+
+        # Swap each dealt position with a random position at or after
+        # it, on every table at once.
+
+        for pos in range(dealt):
+            choices = rng.integers(pos, size, size=count)
+            choices += row_starts
+            column = shuffled[:, pos].copy()
+            shuffled[:, pos] = flat[choices]
+            flat[choices] = column
+
+        result[start:start + count] = shuffled[:, :dealt]
+
+    hands = result[:, :players * cards].reshape(tables, players, cards)
+    return (hands, result[:, players * cards:])
+
+
+def combination_ranks(hands):
+
+    """Returns an array of the position of each of an array of
+    combinations of distinct cards in the colexicographic order of all
+    combinations of the same number of cards, as returned by the
+    combinatorics.combination_rank() function.
+
+    Arguments:
+    hands -- an array of shape (N, k) of card indices, as returned
+    from Card.index(), one combination per row in any order, or an
+    array of shape (N,) of integer bitmasks, each with the same
+    number of bits set.
+
+    Exceptions raised:
+    ValueError -- if the array has the wrong shape, or if any index
+    or bitmask is invalid, or if any combination contains the same
+    card more than once, or the bitmasks have different numbers of
+    bits set.
+
+    """
+
+    hands = np.asarray(hands)
+    if hands.ndim not in (1, 2) or not np.issubdtype(hands.dtype,
+                                                     np.integer):
+        raise ValueError("Hands must be an integer array of shape " +
+                         "(N, k) or (N,).")
+
+    if hands.ndim == 1:
+        if hands.size and (hands.min() < 0 or hands.max() >> 52):
+            raise ValueError("Invalid bitmask value in hands.")
+
+        # Add the binomial coefficient of each bit set, from the lowest
+        # bit up, counting the bits set so far.
+
+        masks = hands.astype(np.int64)
+        ranks = np.zeros(len(masks), dtype=np.int64)
+        counts = np.zeros(len(masks), dtype=np.intp)
+        for index in range(52):
+            present = (masks >> index) & 1
+            counts += present
+            ranks += present * _COLEX_BINOMIALS[index, counts]
+        if counts.size and (counts != counts[0]).any():
+            raise ValueError("Bitmasks must have the same number " +
+                             "of bits set.")
+        return ranks
+
+    if hands.size and (hands.min() < 0 or hands.max() > 51):
+        raise ValueError("Invalid index value in hands.")
+    ordered = np.sort(hands, axis=1).astype(np.intp)
+    if (ordered[:, 1:] == ordered[:, :-1]).any():
+        raise ValueError("A hand of different cards is required.")
+
+    ranks = np.zeros(len(ordered), dtype=np.int64)
+    for column in range(ordered.shape[1]):
+        ranks += _COLEX_BINOMIALS[ordered[:, column], column + 1]
+    return ranks
+
+
+def combinations_from_ranks(ranks, size, masks=False):
+
+    """Returns an array of shape (N, size) of the card indices, in
+    ascending order, of the combinations of cards at each of an array
+    of positions in colexicographic order, as returned by the
+    combinatorics.combination_from_rank() function, or an array of
+    shape (N,) of integer bitmasks of them.
+
+    Arguments:
+    ranks -- an array of positions, as returned by
+    combination_ranks().
+    size -- the number of cards in each combination.
+    masks -- if set to 'True', return bitmasks rather than indices.
+
+    Exceptions raised:
+    ValueError -- if the number of cards is not from 0 to 52, or if
+    any position is not valid for that number of cards.
+
+    """
+
+    if not isinstance(size, int) or size not in range(0, 53):
+        raise ValueError("Invalid hand size '{0}'".format(size))
+    ranks = np.asarray(ranks)
+    if ranks.ndim != 1 or (ranks.size and
+                           not np.issubdtype(ranks.dtype, np.integer)):
+        raise ValueError("Ranks must be an integer array of shape (N,).")
+    if ranks.size and (ranks.min() < 0 or
+                       ranks.max() >= _BINOMIALS[52][size]):
+        raise ValueError("Invalid rank value in ranks.")
+
+    # Find the cards from the highest down, each being the highest
+    # index whose binomial coefficient does not exceed the remaining
+    # position, which the coefficients' ascending order gives by a
+    # binary search.
+
+    remaining = ranks.astype(np.int64)
+    result = np.empty((len(ranks), size), dtype=np.int8)
+    for position in range(size, 0, -1):
+        column = _COLEX_BINOMIALS[:, position]
+        values = np.searchsorted(column, remaining, side="right") - 1
+        result[:, position - 1] = values
+        remaining -= column[values]
+
+    if masks:
+        return np.left_shift(np.int64(1),
+                             result.astype(np.int64)).sum(axis=1)
+    return result
@@ -0,0 +1,302 @@
+"""Hand history module.
+
+Library Release 1.2
+
+Copyright 2013 Paul Griffiths
+Email: mail@paulgriffiths.net
+
+Distributed under the terms of the GNU General Public License.
+http://www.gnu.org/licenses/
+
+"""
+
+
+import struct
+from collections import namedtuple
+
+from .base.pokerhand import _CATEGORY_SHIFT
+
+
+# Public named tuples
+
+# pylint raises a convention warning for HistoryRecord
+# rather than HISTORYRECORD, but we use named tuples
+# in a similar way to classes, so we follow that
+# naming convention instead and disable the message.
+#
+# pylint: disable=C0103
+
+HistoryRecord = namedtuple("HistoryRecord",
+                           ["cards", "score", "rank", "category", "payout"])
+
+# pylint: enable=C0103
+
+
+# Public constants
+
+# Size in bytes of each record, and of the file header before the
+# first record.
+
+RECORD_SIZE = 20
+HEADER_SIZE = 16
+
+
+# Non-public constants
+
+# File header: identifier, format version and record size, padded
+# to HEADER_SIZE bytes.
+
+_HISTORY_MAGIC = b"PCHH"
+_HISTORY_VERSION = 1
+_HISTORY_HEADER = struct.Struct("<4sHH8x")
+
+# Each record holds up to seven card indices as bytes, with unused
+# bytes set to _NO_CARD, then the number of cards, the score from
+# PokerHand.score_int(), the equivalence class rank from the
+# evaluator, the hand category, a padding byte and the video poker
+# payout, all little-endian.
+
+_MAX_CARDS = 7
+_NO_CARD = 0xFF
+_RECORD = struct.Struct("<7sBIHBxi")
+
+# Fields of the NumPy structured array type matching the record.
+
+_RECORD_FIELDS = [("cards", "u1", (_MAX_CARDS,)), ("size", "u1"),
+                  ("score", "<u4"), ("rank", "<u2"), ("category", "u1"),
+                  ("pad", "u1"), ("payout", "<i4")]
+
+# Number of records read at a time by iter_history().
+
+_READ_RECORDS = 4096
+
+# Padding for the card indices of hands of each size.
+
+_CARD_PADDING = [bytes([_NO_CARD] * (_MAX_CARDS - size))
+                 for size in range(_MAX_CARDS + 1)]
+
+
+# Non-public functions
+
+def _check_header(data, filename):
+
+    """Raises ValueError if data does not start with a valid hand
+    history file header.
+
+    """
+
+    if len(data) < HEADER_SIZE:
+        raise ValueError("Invalid hand history file '{0}'".format(filename))
+    magic, version, size = _HISTORY_HEADER.unpack_from(data)
+    if (magic != _HISTORY_MAGIC or version != _HISTORY_VERSION or
+            size != RECORD_SIZE):
+        raise ValueError("Invalid hand history file '{0}'".format(filename))
+
+
+# Public functions
+
+def iter_history(filename):
+
+    """Yields a HistoryRecord for each record of a hand history file,
+    reading the file in large blocks. The cards are a tuple of card
+    indices, as returned from Card.index().
+
+    Arguments:
+    filename -- the name of a file written by HistoryWriter.
+
+    Exceptions raised:
+    ValueError -- if the file is not a valid hand history file.
+
+    """
+
+    with open(filename, "rb") as infile:
+        _check_header(infile.read(HEADER_SIZE), filename)
+        while True:
+            data = infile.read(RECORD_SIZE * _READ_RECORDS)
+            if len(data) % RECORD_SIZE:
+                raise ValueError("Truncated hand history file " +
+                                 "'{0}'".format(filename))
+            if not data:
+                return
+            for (cards, size, score, rank,
+                 category, payout) in _RECORD.iter_unpack(data):
+                yield HistoryRecord(tuple(cards[:size]), score, rank,
+                                    category, payout)
+
+
+def read_history(filename):
+
+    """Returns a read-only NumPy structured array of the records of
+    a hand history file, memory-mapped rather than read, so that even
+    very large files can be analyzed without parsing them. Requires
+    NumPy.
+
+    The fields of the array are "cards", an array of seven card
+    indices with unused entries set to 255, "size", the number of
+    cards, "score", "rank", "category" and "payout".
+
+    Arguments:
+    filename -- the name of a file written by HistoryWriter.
+
+    Exceptions raised:
+    ValueError -- if the file is not a valid hand history file.
+
+    """
+
+    # Imported here, so that hand histories can be written and read
+    # without NumPy.
+
+    import numpy as np
+
+    with open(filename, "rb") as infile:
+        _check_header(infile.read(HEADER_SIZE), filename)
+        infile.seek(0, 2)
+        length = infile.tell() - HEADER_SIZE
+    if length % RECORD_SIZE:
+        raise ValueError("Truncated hand history file '{0}'".format(filename))
+
+    dtype = np.dtype(_RECORD_FIELDS)
+    if not length:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(filename, dtype=dtype, mode="r", offset=HEADER_SIZE,
+                     shape=(length // RECORD_SIZE,))
+
+
+# Class
+
+class HistoryWriter(object):
+
+    """Implements a writer of poker hands to a hand history file of
+    fixed size binary records, buffering records to write them in
+    bulk.
+
+    Public methods:
+    __init__(filename, append, bet, easy, buffer_records)
+    close()
+    flush()
+    write(hand)
+    write_many(hands)
+
+    Context manager methods:
+    Instances may be used in a 'with' statement, which closes the
+    file at the end.
+
+    """
+
+    def __init__(self, filename, append=False, bet=1, easy=False,
+                 buffer_records=4096):
+
+        """Initializes a HistoryWriter instance.
+
+        Arguments:
+        filename -- the name of the file to write.
+        append -- if set to 'True' and the file exists, add records to
+        the end of it, otherwise start a new file.
+        bet -- the integer bet used to calculate the video poker
+        payout of each hand.
+        easy -- if set to 'True', calculate payouts with the higher
+        winnings of PokerHand.video_winnings().
+        buffer_records -- the number of records to buffer before
+        writing them to the file.
+
+        Exceptions raised:
+        ValueError -- if appending to a file which is not a valid
+        hand history file.
+
+        """
+
+        self._bet = bet
+        self._easy = easy
+        self._buffer_records = max(1, buffer_records)
+        self._buffer = []
+
+        self._file = open(filename, "ab" if append else "wb")
+        if self._file.tell():
+            with open(filename, "rb") as infile:
+                try:
+                    _check_header(infile.read(HEADER_SIZE), filename)
+                except ValueError:
+                    self._file.close()
+                    raise
+        else:
+            self._file.write(_HISTORY_HEADER.pack(
+                _HISTORY_MAGIC, _HISTORY_VERSION, RECORD_SIZE))
+
+    # Public methods
+
+    def write(self, hand):
+
+        """Adds a hand to the file.
+
+        Arguments:
+        hand -- a PokerHand instance of up to seven cards.
+
+        Exceptions raised:
+        ValueError -- if the hand has more than seven cards.
+
+        """
+
+        indices = hand.index_list()
+        if len(indices) > _MAX_CARDS:
+            raise ValueError("Hands of more than seven cards " +
+                             "cannot be written.")
+
+        # Disable pylint message for access to protected member
+        # PokerHand._rank, the rank kept from evaluating the hand.
+        #
+        # pylint: disable=W0212
+
+        score = hand.score_int()
+        self._buffer.append(_RECORD.pack(
+            bytes(indices) + _CARD_PADDING[len(indices)], len(indices),
+            score, hand._rank, score >> _CATEGORY_SHIFT,
+            hand.video_winnings(self._bet, self._easy)))
+
+        # pylint: enable=W0212
+
+        if len(self._buffer) >= self._buffer_records:
+            self.flush()
+
+    def write_many(self, hands):
+
+        """Adds each of an iterable of hands to the file.
+
+        Arguments:
+        hands -- an iterable of PokerHand instances.
+
+        """
+
+        for hand in hands:
+            self.write(hand)
+
+    def flush(self):
+
+        """Writes any buffered records to the file."""
+
+        if self._buffer:
+            self._file.write(b"".join(self._buffer))
+            self._buffer = []
+        self._file.flush()
+
+    def close(self):
+
+        """Writes any buffered records and closes the file."""
+
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    # Context manager methods
+
+    def __enter__(self):
+
+        """Returns the writer for use in a 'with' statement."""
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        """Closes the file at the end of a 'with' statement."""
+
+        self.close()
+        return False
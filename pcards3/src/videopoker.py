@@ -0,0 +1,523 @@
+"""Video poker strategy module. Requires NumPy.
+
+Library Release 1.2
+
+Copyright 2013 Paul Griffiths
+Email: mail@paulgriffiths.net
+
+Distributed under the terms of the GNU General Public License.
+http://www.gnu.org/licenses/
+
+"""
+
+
+import argparse
+import struct
+import sys
+from collections import namedtuple
+from math import comb, factorial
+
+import numpy as np
+
+from .base.card import parse_cards, _card_indices
+from .base.combinatorics import canonical_count, canonical_from_id
+from .base.combinatorics import _BINOMIALS, _colex_rank, _canonical_suits
+from .base.evaluator import evaluate, rank_category, WORST_RANK
+from .base.pokerhand import PokerHand
+from .base.ranktable import rank_table
+
+
+# Public named tuples
+
+# pylint raises a convention warning for HoldResult
+# rather than HOLDRESULT, but we use named tuples
+# in a similar way to classes, so we follow that
+# naming convention instead and disable the message.
+#
+# pylint: disable=C0103
+
+HoldResult = namedtuple("HoldResult", ["hold", "positions", "ev"])
+
+# pylint: enable=C0103
+
+
+# Non-public constants
+
+# Pairs only win if jacks or better, and pairs are ranked from aces
+# down, so the winning pairs are those ranked no worse than the
+# worst pair of jacks.
+
+_WORST_HIGH_PAIR = evaluate(parse_cards("JC JD 4H 3S 2C"))
+
+# The number of cards which can be drawn to replace the discards,
+# after five have been dealt, and the number of ways of drawing
+# them for each number of cards held.
+
+_DRAW_CARDS = 47
+_DRAW_WAYS = [comb(_DRAW_CARDS, 5 - held) for held in range(6)]
+
+# Offsets into the payout sum table of the entries for each size of
+# combination, and the number of cards held for each hold pattern.
+
+_SIZE_OFFSETS = [sum(comb(52, size) for size in range(limit))
+                 for limit in range(6)]
+_HOLD_SIZES = [bin(hold).count("1") for hold in range(32)]
+
+# Hold patterns ordered by the number of cards held, so that the
+# first of several holds with the same expected return holds the
+# fewest cards.
+
+_HOLDS_BY_SIZE = sorted(range(32), key=lambda hold: _HOLD_SIZES[hold])
+
+# Strategy file header: identifier, format version, number of
+# hands, the ten payouts of the paytable and the return to player,
+# padded to 64 bytes. The header is followed by the expected return
+# of the best hold for each hand as 32-bit floats, and then the best
+# hold for each hand as bytes, both in canonical id order and
+# little-endian, so that each array is aligned when the file is
+# read into memory.
+
+_STRATEGY_MAGIC = b"PCVS"
+_STRATEGY_VERSION = 2
+_STRATEGY_HEADER = struct.Struct("<4sHI10Id6x")
+
+
+# Non-public variables
+
+# Payout sum tables for each paytable, built on first use.
+
+_TABLES = {}
+
+
+# Non-public functions
+
+def _paytable(easy, paytable):
+
+    """Returns a paytable as a tuple of ten payouts by category,
+    defaulting to those used by PokerHand.video_winnings().
+
+    """
+
+    # pylint: disable=W0212
+
+    if paytable is None:
+        if easy:
+            paytable = PokerHand._vp_returns_easy
+        else:
+            paytable = PokerHand._vp_returns_normal
+
+    # pylint: enable=W0212
+
+    if len(paytable) != 10:
+        raise ValueError("A paytable must have ten payouts.")
+    return tuple(paytable)
+
+
+def _rank_payouts(paytable):
+
+    """Returns an array of the payout for each equivalence class
+    rank, paying pairs only if jacks or better.
+
+    """
+
+    payouts = np.zeros(WORST_RANK + 1, dtype=np.int64)
+    for rank in range(1, WORST_RANK + 1):
+        category = rank_category(rank)
+        if category != 1 or rank <= _WORST_HIGH_PAIR:
+            payouts[rank] = paytable[category]
+    return payouts
+
+
+def _colex_combinations(size):
+
+    """Returns an array of every combination of size card indices
+    from a single pack, one combination in ascending order per row,
+    with the rows in colexicographic order.
+
+    """
+
+    combos = np.arange(52, dtype=np.int8)[:, None]
+    for length in range(2, size + 1):
+        blocks = []
+        for highest in range(length - 1, 52):
+            block = combos[:comb(highest, length - 1)]
+            column = np.full((len(block), 1), highest, dtype=np.int8)
+            blocks.append(np.hstack([block, column]))
+        combos = np.vstack(blocks)
+    return combos
+
+
+def _build_table(paytable):
+
+    """Returns an array containing, for every combination of up to
+    five card indices, the sum of the payouts of all the five card
+    hands which contain it. The sums for combinations of each size
+    start at the offset in _SIZE_OFFSETS for that size, and are in
+    colexicographic order.
+
+    """
+
+    # The hands are in colexicographic order, as are their ranks in
+    # the rank table.
+
+    hands = _colex_combinations(5)
+    ranks = np.frombuffer(rank_table(), dtype=np.uint16)
+    payouts = _rank_payouts(paytable)[ranks]
+    binomials = np.array(_BINOMIALS, dtype=np.int64)
+    columns = hands.astype(np.int64)
+
+    table = np.zeros(_SIZE_OFFSETS[5] + len(hands), dtype=np.int64)
+    for hold in range(32):
+        positions = [pos for pos in range(5) if hold & (1 << pos)]
+        ranks = np.zeros(len(hands), dtype=np.int64)
+        for order, pos in enumerate(positions, 1):
+            ranks += binomials[columns[:, pos], order]
+        size = len(positions)
+        sums = np.bincount(ranks, weights=payouts, minlength=comb(52, size))
+        start = _SIZE_OFFSETS[size]
+        table[start:start + len(sums)] += np.rint(sums).astype(np.int64)
+    return table
+
+
+def _table(paytable):
+
+    """Returns the payout sum table for a paytable, building it
+    if necessary.
+
+    """
+
+    if paytable not in _TABLES:
+        _TABLES[paytable] = _build_table(paytable)
+    return _TABLES[paytable]
+
+
+def _hold_values(indices, table):
+
+    """Returns a list of the expected payout of each of the 32 ways
+    of holding cards from five distinct dealt card indices, using a
+    payout sum table. Bit n of each hold pattern is set if the card
+    at position n is held.
+
+    """
+
+    # Look up the payout sums of the hands containing each subset
+    # of the dealt cards.
+
+    keys = []
+    for hold in range(32):
+        held = sorted(indices[pos] for pos in range(5) if hold & (1 << pos))
+        keys.append(_SIZE_OFFSETS[len(held)] + _colex_rank(held))
+    sums = table[keys].tolist()
+
+    # The hands drawn to a hold contain the held cards and none of
+    # the discards, so by inclusion-exclusion their payout sum is
+    # the alternating sum, over each subset of the discards, of the
+    # payout sums of the hands containing the held cards and that
+    # subset. This is calculated for every hold at once with one
+    # pass over the cards.
+
+    for pos in range(5):
+        bit = 1 << pos
+        for hold in range(32):
+            if not hold & bit:
+                sums[hold] -= sums[hold | bit]
+
+    return [sums[hold] / _DRAW_WAYS[_HOLD_SIZES[hold]]
+            for hold in range(32)]
+
+
+def _hold_values_many(hands, table):
+
+    """Returns an array of the expected payout of each of the 32
+    ways of holding cards from each of an array of hands, one hand
+    per row with its card indices in ascending order, as calculated
+    for a single hand by _hold_values().
+
+    """
+
+    binomials = np.array(_BINOMIALS, dtype=np.int64)
+    columns = hands.astype(np.int64)
+
+    sums = np.empty((len(hands), 32), dtype=np.int64)
+    for hold in range(32):
+        keys = np.full(len(hands), _SIZE_OFFSETS[_HOLD_SIZES[hold]],
+                       dtype=np.int64)
+        order = 1
+        for pos in range(5):
+            if hold & (1 << pos):
+                keys += binomials[columns[:, pos], order]
+                order += 1
+        sums[:, hold] = table[keys]
+
+    for pos in range(5):
+        bit = 1 << pos
+        for hold in range(32):
+            if not hold & bit:
+                sums[:, hold] -= sums[:, hold | bit]
+
+    ways = np.array([_DRAW_WAYS[size] for size in _HOLD_SIZES])
+    return sums / ways
+
+
+def _canonical_hands():
+
+    """Returns a tuple containing an array of the card indices of
+    every canonical five card hand in canonical id order, one hand
+    per row in ascending order, and an array of the number of hands
+    which have each canonical hand.
+
+    """
+
+    hands = []
+    counts = []
+    for hand_id in range(canonical_count(5)):
+        indices = canonical_from_id(hand_id, 5)
+        hands.append(indices)
+
+        # Permuting suits with the same ranks, including suits with
+        # no cards, gives the same hand.
+
+        masks = [0] * 4
+        for index in indices:
+            masks[index // 13] |= 1 << (index % 13)
+        same = 1
+        for mask in set(masks):
+            same *= factorial(masks.count(mask))
+        counts.append(24 // same)
+
+    return (np.array(hands, dtype=np.int8), np.array(counts))
+
+
+def _dealt_indices(hand):
+
+    """Returns a list of five distinct card indices from a hand in
+    any of the forms accepted by hold_values().
+
+    """
+
+    indices = _card_indices(hand)
+    if len(indices) != 5 or len(set(indices)) != 5:
+        raise ValueError("A hand of five different cards is required.")
+    return indices
+
+
+# Public functions
+
+def hold_values(hand, easy=False, paytable=None):
+
+    """Returns a list of the expected return of each of the 32 ways
+    of holding cards from a dealt video poker hand, per unit bet.
+
+    The expected return of a hold is calculated exactly over every
+    possible draw from the 47 cards not dealt. The hold patterns are
+    numbered from 0 to 31, and bit n of each is set if the card at
+    position n of the hand is held, so 0 discards every card and 31
+    holds every card. The payout sums for every combination of cards
+    are calculated once for each paytable, which takes a few seconds
+    on first use.
+
+    Arguments:
+    hand -- the five dealt cards, as a Hand instance, or a sequence
+    of Card instances, short names (e.g. "AS") or card indices.
+    easy -- if set to 'True', use the higher winnings awarded by
+    PokerHand.video_winnings() with 'easy' set.
+    paytable -- if provided, a sequence of ten payouts for each hand
+    category from high card to royal flush, used instead of those of
+    PokerHand. Pairs are only paid if jacks or better.
+
+    Exceptions raised:
+    ValueError -- if the hand does not contain five different valid
+    cards, or if the paytable does not have ten payouts.
+
+    """
+
+    indices = _dealt_indices(hand)
+    return _hold_values(indices, _table(_paytable(easy, paytable)))
+
+
+def best_hold(hand, easy=False, paytable=None):
+
+    """Returns a HoldResult for the hold with the highest expected
+    return for a dealt video poker hand, containing the hold pattern
+    as numbered by hold_values(), a tuple of the positions of the
+    held cards starting at 0, and the expected return per unit bet.
+
+    Where several holds have the same expected return, the one
+    holding the fewest cards is returned.
+
+    Arguments:
+    hand, easy, paytable -- as for hold_values().
+
+    Exceptions raised:
+    ValueError -- in the same circumstances as hold_values().
+
+    """
+
+    values = hold_values(hand, easy, paytable)
+    best = max(range(32), key=lambda hold: (values[hold],
+                                            -_HOLD_SIZES[hold]))
+    positions = tuple(pos for pos in range(5) if best & (1 << pos))
+    return HoldResult(best, positions, values[best])
+
+
+def build_strategy(filename, easy=False, paytable=None):
+
+    """Calculates the best hold for every five card hand, which
+    takes several seconds, writes it to a strategy file, and returns
+    a Strategy instance for the file.
+
+    Strategy is stored only for the 134,459 hands which are distinct
+    when the suits are permuted, with the expected return of the
+    best hold for each, as a file of about 660KB. The file can also
+    be built from the command line with:
+
+        python -m pcards.videopoker FILENAME [--easy]
+
+    Arguments:
+    filename -- the name of the file to write.
+    easy, paytable -- as for hold_values().
+
+    Exceptions raised:
+    ValueError -- if the paytable does not have ten payouts.
+
+    """
+
+    paytable = _paytable(easy, paytable)
+    hands, counts = _canonical_hands()
+    values = _hold_values_many(hands, _table(paytable))
+
+    choices = values[:, _HOLDS_BY_SIZE].argmax(axis=1)
+    holds = np.array(_HOLDS_BY_SIZE, dtype=np.uint8)[choices]
+    evs = values[np.arange(len(values)), holds]
+    rtp = float((evs * counts).sum() / counts.sum())
+
+    with open(filename, "wb") as outfile:
+        outfile.write(_STRATEGY_HEADER.pack(
+            _STRATEGY_MAGIC, _STRATEGY_VERSION, len(hands),
+            *paytable, rtp))
+        outfile.write(evs.astype("<f4").tobytes())
+        outfile.write(holds.tobytes())
+
+    return Strategy(filename)
+
+
+# Class
+
+class Strategy(object):
+
+    """Implements a video poker strategy loaded from a file written
+    by build_strategy(), giving the best hold for any dealt hand by
+    lookup rather than by calculation.
+
+    Public methods:
+    __init__(filename)
+    best_hold(hand)
+    paytable()
+    return_to_player()
+
+    """
+
+    def __init__(self, filename):
+
+        """Initializes a Strategy instance.
+
+        Arguments:
+        filename -- the name of a file written by build_strategy().
+
+        Exceptions raised:
+        ValueError -- if the file is not a valid strategy file.
+
+        """
+
+        with open(filename, "rb") as infile:
+            data = infile.read()
+
+        size = _STRATEGY_HEADER.size
+        if len(data) < size:
+            raise ValueError("Invalid strategy file '{0}'".format(filename))
+        header = _STRATEGY_HEADER.unpack_from(data)
+        count = header[2]
+        if (header[0] != _STRATEGY_MAGIC or
+                header[1] != _STRATEGY_VERSION or
+                len(data) != size + count * 5):
+            raise ValueError("Invalid strategy file '{0}'".format(filename))
+
+        self._paytable = header[3:13]
+        self._rtp = header[13]
+        self._evs = np.frombuffer(data, dtype="<f4", count=count,
+                                  offset=size)
+        self._holds = np.frombuffer(data, dtype=np.uint8, count=count,
+                                    offset=size + count * 4)
+
+    # Public methods
+
+    def best_hold(self, hand):
+
+        """Returns a HoldResult for the best hold for a dealt video
+        poker hand, as for the best_hold() function, except that the
+        expected return is only stored to single precision.
+
+        Arguments:
+        hand -- the five dealt cards, in any form accepted by
+        hold_values().
+
+        Exceptions raised:
+        ValueError -- if the hand does not contain five different
+        valid cards.
+
+        """
+
+        indices = _dealt_indices(hand)
+        entry, suit_map = _canonical_suits(indices)
+
+        # The stored hold numbers the cards of the canonical hand in
+        # ascending order, so find the canonical position of each
+        # dealt card.
+
+        canonical = [suit_map[idx // 13] * 13 + idx % 13 for idx in indices]
+        ordered = sorted(canonical)
+        stored = int(self._holds[entry])
+        positions = tuple(pos for pos in range(5)
+                          if stored & (1 << ordered.index(canonical[pos])))
+        hold = sum(1 << pos for pos in positions)
+        return HoldResult(hold, positions, float(self._evs[entry]))
+
+    def paytable(self):
+
+        """Returns the paytable as a tuple of ten payouts by category,
+        from high card to royal flush.
+
+        """
+
+        return self._paytable
+
+    def return_to_player(self):
+
+        """Returns the expected return per unit bet of playing every
+        hand with the best hold.
+
+        """
+
+        return self._rtp
+
+
+def main():
+
+    """
+    main() function.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Build a video poker strategy file.")
+    parser.add_argument("filename", help="name of the file to write")
+    parser.add_argument("--easy", action="store_true",
+                        help="use the higher 'easy' winnings")
+    args = parser.parse_args()
+
+    strategy = build_strategy(args.filename, args.easy)
+    print("Return to player: {0:.6f}".format(strategy.return_to_player()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+"""Unit test module for batch combination ranking functions."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+from math import comb
+
+from pcards import combination_rank, combination_from_rank
+
+try:
+    import numpy
+    from pcards.batch import combination_ranks, combinations_from_ranks
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for batch combination ranking functions."""
+
+    def setUp(self):
+        self.rng = numpy.random.default_rng(1)
+
+    def test_matches_single(self):
+        for size in (1, 2, 5, 7, 20):
+            ranks = self.rng.integers(0, comb(52, size), 200)
+            combos = combinations_from_ranks(ranks, size)
+            self.assertEqual(combos.shape, (200, size))
+            self.assertEqual(combos.tolist(),
+                             [combination_from_rank(int(rank), size)
+                              for rank in ranks])
+            self.assertEqual(combination_ranks(combos).tolist(),
+                             ranks.tolist())
+
+    def test_unsorted_rows(self):
+        combos = combinations_from_ranks(self.rng.integers(0, comb(52, 7),
+                                                           100), 7)
+        shuffled = self.rng.permuted(combos, axis=1)
+        self.assertEqual(combination_ranks(shuffled).tolist(),
+                         [combination_rank(row) for row in
+                          shuffled.tolist()])
+
+    def test_masks(self):
+        ranks = self.rng.integers(0, comb(52, 5), 500)
+        masks = combinations_from_ranks(ranks, 5, masks=True)
+        self.assertEqual(masks.tolist(),
+                         [combination_from_rank(int(rank), 5, masks=True)
+                          for rank in ranks])
+        self.assertEqual(combination_ranks(masks).tolist(),
+                         ranks.tolist())
+        self.assertEqual(combination_ranks(masks.astype(numpy.uint64))
+                         .tolist(), ranks.tolist())
+
+    def test_bounds(self):
+        last = comb(52, 26) - 1
+        combos = combinations_from_ranks([0, last], 26)
+        self.assertEqual(combos[0].tolist(), list(range(26)))
+        self.assertEqual(combos[1].tolist(), list(range(26, 52)))
+        self.assertEqual(combination_ranks(combos).tolist(), [0, last])
+        self.assertEqual(combinations_from_ranks([], 5).shape, (0, 5))
+        self.assertEqual(combination_ranks(numpy.zeros((3, 0),
+                                                       dtype=int))
+                         .tolist(), [0, 0, 0])
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, combination_ranks, [[1, 1, 2]])
+        self.assertRaises(ValueError, combination_ranks, [[1, 52]])
+        self.assertRaises(ValueError, combination_ranks, [3, 7])
+        self.assertRaises(ValueError, combination_ranks, [-1])
+        self.assertRaises(ValueError, combination_ranks, [1 << 52])
+        self.assertRaises(ValueError, combinations_from_ranks,
+                          [comb(52, 5)], 5)
+        self.assertRaises(ValueError, combinations_from_ranks, [-1], 5)
+        self.assertRaises(ValueError, combinations_from_ranks, [0], 53)
+
+
+if __name__ == '__main__':
+    unittest.main()
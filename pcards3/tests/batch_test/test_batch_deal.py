@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+"""Unit test module for batch dealing functions."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+
+from pcards import Deck
+
+try:
+    import numpy
+    from pcards.batch import deal_tables
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for batch dealing functions."""
+
+    def test_shapes(self):
+        hands, boards = deal_tables(100, 9, 2, 5, rng=1)
+        self.assertEqual(hands.shape, (100, 9, 2))
+        self.assertEqual(boards.shape, (100, 5))
+        hands, boards = deal_tables(10, 4, 5, rng=1)
+        self.assertEqual(hands.shape, (10, 4, 5))
+        self.assertEqual(boards.shape, (10, 0))
+
+    def test_distinct_cards(self):
+        hands, boards = deal_tables(500, 6, 2, 5, rng=2)
+        dealt = numpy.hstack([hands.reshape(500, -1), boards])
+        self.assertTrue((numpy.sort(dealt, axis=1)[:, 1:] !=
+                         numpy.sort(dealt, axis=1)[:, :-1]).all())
+        self.assertTrue(dealt.min() >= 0 and dealt.max() <= 51)
+
+    def test_whole_deck(self):
+        hands = deal_tables(50, 4, 13, rng=3)[0]
+        for table in hands.reshape(50, -1):
+            self.assertEqual(sorted(table.tolist()), list(range(52)))
+
+    def test_reproducible(self):
+        first = deal_tables(200, 2, 2, 5, rng=4)
+        second = deal_tables(200, 2, 2, 5, rng=4)
+        third = deal_tables(200, 2, 2, 5, rng=5)
+        self.assertTrue((first[0] == second[0]).all())
+        self.assertTrue((first[1] == second[1]).all())
+        self.assertFalse((first[0] == third[0]).all())
+
+    def test_uniform(self):
+        hands = deal_tables(52000, 1, 3, rng=6)[0]
+        for pos in range(3):
+            counts = numpy.bincount(hands[:, 0, pos], minlength=52)
+            self.assertTrue(counts.min() > 850 and counts.max() < 1150)
+
+    def test_custom_deck(self):
+        hands = deal_tables(100, 2, 3, rng=7, deck=[0, 0, 5, 5, 9, 9])[0]
+        for table in hands.reshape(100, -1):
+            self.assertEqual(sorted(table.tolist()), [0, 0, 5, 5, 9, 9])
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, deal_tables, 10, 10, 5, 3)
+        self.assertRaises(ValueError, deal_tables, -1, 2, 2)
+        self.assertRaises(ValueError, deal_tables, 1, 1, 1, 0, None, [52])
+
+    def test_deck_wrapper(self):
+        deck = Deck(seed=8)
+        deck.draw(2)
+        hands, boards = deck.deal_tables(300, 3, 2, 5)
+        self.assertEqual(len(deck), 50)
+        dealt = numpy.hstack([hands.reshape(300, -1), boards])
+        removed = [idx for idx in range(52) if idx not in
+                   [card.index() for card in deck.get_card_list()]]
+        self.assertFalse(numpy.isin(dealt, removed).any())
+        again = Deck(seed=8)
+        again.draw(2)
+        self.assertTrue((again.deal_tables(300, 3, 2, 5)[0] == hands).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
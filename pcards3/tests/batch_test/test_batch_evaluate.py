@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+"""Unit test module for batch evaluation functions."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import random
+import unittest
+
+from pcards import Hand, evaluate
+
+try:
+    import numpy
+    from pcards.batch import evaluate_many, rank_categories
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for batch evaluation functions."""
+
+    def setUp(self):
+        self.rng = random.Random(1)
+
+    def random_hands(self, size, number=500):
+
+        """Returns an array of random hands."""
+
+        return numpy.array([self.rng.sample(range(52), size)
+                            for _ in range(number)])
+
+    def test_matches_evaluate(self):
+
+        """Test that batch ranks match evaluate() for five, six
+        and seven card hands.
+
+        """
+
+        for size in range(5, 8):
+            hands = self.random_hands(size)
+            ranks = evaluate_many(hands)
+            self.assertEqual(ranks.shape, (len(hands),))
+            for hand, rank in zip(hands.tolist(), ranks.tolist()):
+                self.assertEqual(evaluate(hand), rank)
+
+    def test_flushes(self):
+
+        """Test that flushes and straight flushes are found in
+        seven card hands.
+
+        """
+
+        hands = numpy.array([
+            Hand(namelist=["AS", "KS", "QS", "JS", "TS",
+                           "AH", "AD"]).index_list(),
+            Hand(namelist=["2H", "3H", "4S", "5H", "9H",
+                           "AH", "AD"]).index_list()
+        ])
+        self.assertEqual(rank_categories(evaluate_many(hands)).tolist(),
+                         [9, 5])
+
+    def test_categories(self):
+
+        """Test category codes for the rank boundaries."""
+
+        ranks = numpy.array([1, 2, 10, 11, 166, 167, 322, 323, 1599,
+                             1600, 1609, 1610, 2467, 2468, 3325, 3326,
+                             6185, 6186, 7462, 0])
+        self.assertEqual(rank_categories(ranks).tolist(),
+                         [9, 8, 8, 7, 7, 6, 6, 5, 5, 4, 4, 3,
+                          3, 2, 2, 1, 1, 0, 0, -1])
+
+    def test_unrankable(self):
+
+        """Test that unrankable hands are given a rank of 0."""
+
+        hands = numpy.array([[0, 0, 0, 0, 0]])
+        self.assertEqual(evaluate_many(hands).tolist(), [0])
+        hands = numpy.array([[8, 6, 29, 8, 0, 44, 8],
+                             [0, 0, 15, 1, 9, 3, 5]])
+        self.assertEqual(evaluate_many(hands).tolist(), [0, 0])
+        hands = numpy.array([[8, 6, 8, 0, 8, 44], [0, 1, 2, 3, 5, 5]])
+        self.assertEqual(evaluate_many(hands).tolist(), [0, 0])
+
+    def test_repeated_flush_cards(self):
+
+        """Test that multiple pack hands with a repeated card in a
+        flush suit are given the same ranks as by evaluate(), or 0 if
+        evaluate() cannot rank them.
+
+        """
+
+        hands = numpy.array([[0, 12, 11, 10, 8, 1, 1],
+                             [0, 12, 11, 10, 9, 0, 0],
+                             [0, 0, 0, 0, 1, 2, 3],
+                             [0, 0, 0, 12, 12, 14, 1]])
+        self.assertEqual(evaluate_many(hands).tolist(),
+                         [evaluate(hand) for hand in hands.tolist()])
+        self.assertEqual(evaluate_many(numpy.array([[0, 0, 0, 12, 12]]))
+                         .tolist(), [evaluate([0, 0, 0, 12, 12])])
+
+        for size in (5, 6, 7):
+            hands = numpy.array([[self.rng.choice([0, 0, 0, 13]) +
+                                  self.rng.randrange(13)
+                                  for _ in range(size)]
+                                 for _ in range(500)])
+            for hand, rank in zip(hands.tolist(),
+                                  evaluate_many(hands).tolist()):
+                if rank:
+                    self.assertEqual(evaluate(hand), rank)
+                else:
+                    self.assertRaises(ValueError, evaluate, hand)
+
+    def test_five_of_a_rank(self):
+
+        """Test that six and seven card hands from multiple packs
+        with five or more cards of a rank are ranked by their best
+        five cards, as by evaluate(), or given a rank of 0 if every
+        five cards are five of a kind.
+
+        """
+
+        hands = [[0, 13, 22, 1, 13, 13, 0], [0, 13, 26, 39, 0, 14, 2],
+                 [5, 5, 5, 18, 18, 31, 7], [0, 13, 26, 39, 0, 1]]
+        for hand in hands:
+            self.assertEqual(evaluate_many(numpy.array([hand])).tolist(),
+                             [evaluate(hand)])
+        self.assertEqual(evaluate_many(numpy.array([[0, 13, 26, 39,
+                                                     0, 13, 26]])).tolist(),
+                         [0])
+
+        for size in (6, 7):
+            hands = []
+            while len(hands) < 500:
+                hand = [self.rng.choice([0, 13, 26, 39]) +
+                        self.rng.randrange(3) for _ in range(size)]
+                suits = [idx // 13 for idx in hand]
+                if max(suits.count(suit) for suit in range(4)) < 5:
+                    hands.append(hand)
+            ranks = evaluate_many(numpy.array(hands))
+            for hand, rank in zip(hands, ranks.tolist()):
+                if rank:
+                    self.assertEqual(evaluate(hand), rank)
+                else:
+                    self.assertRaises(ValueError, evaluate, hand)
+
+    def test_bad_arguments(self):
+
+        """Test that a ValueError exception is raised for arrays of
+        the wrong shape or with invalid indices.
+
+        """
+
+        self.assertRaises(ValueError, evaluate_many, numpy.zeros((3, 4),
+                                                                 dtype=int))
+        self.assertRaises(ValueError, evaluate_many, numpy.zeros(5,
+                                                                 dtype=int))
+        self.assertRaises(ValueError, evaluate_many,
+                          numpy.array([[0, 1, 2, 3, 52]]))
+        self.assertRaises(ValueError, rank_categories, numpy.array([7463]))
+
+
+if __name__ == "__main__":
+    unittest.main()
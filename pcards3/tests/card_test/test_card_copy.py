@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+"""Unit test module for Card class copying and storage."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+
+from pcards import Card
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for Card class copying and storage."""
+
+    def setUp(self):
+        pass
+
+    def test_no_instance_dict(self):
+
+        """Test that cards do not carry an instance dictionary."""
+
+        card = Card(name="AS")
+        self.assertFalse(hasattr(card, "__dict__"))
+        self.assertRaises(AttributeError, setattr, card, "spam", 1)
+
+    def test_copy_equal(self):
+
+        """Test that a copy has the same index and face state."""
+
+        for index in range(52):
+            card = Card(index=index)
+            card.face_up()
+            copy_card = card.copy()
+            self.assertFalse(copy_card is card)
+            self.assertEqual(copy_card.index(), card.index())
+            self.assertEqual(copy_card.rank(), card.rank())
+            self.assertEqual(copy_card.suit(), card.suit())
+            self.assertTrue(copy_card.is_face_up())
+
+    def test_copy_independent(self):
+
+        """Test that changing a copy does not change the original."""
+
+        card = Card(name="7D")
+        copy_card = card.copy()
+        copy_card.flip()
+        self.assertNotEqual(card.is_face_up(), copy_card.is_face_up())
+
+
+if __name__ == "__main__":
+    unittest.main()
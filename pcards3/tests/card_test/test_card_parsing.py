@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""Test module for card name parsing."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+
+from pcards import Card, Hand, parse_cards
+from pcards import get_rank_integer, get_suit_integer
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Test sequence class for card name parsing."""
+
+    def setUp(self):
+        pass
+
+    def test_rank_prefixes(self):
+
+        """Test that rank prefixes resolve as they always have."""
+
+        samples = [("t", 10), ("T", 10), ("tw", 2), ("th", 3), ("te", 10),
+                   ("f", 4), ("fi", 5), ("s", 6), ("se", 7), ("e", 8),
+                   ("a", 14), ("ACE", 14), ("Queen", 12), ("kIn", 13),
+                   ("9", 9), ("10", 10), (1, 14), (13, 13)]
+
+        for rank, value in samples:
+            self.assertEqual(get_rank_integer(rank), value)
+
+    def test_suit_prefixes(self):
+
+        """Test that suit prefixes and mixed case are accepted."""
+
+        samples = [("c", 0), ("H", 1), ("Sp", 2), ("diaMONDS", 3), (2, 2)]
+
+        for suit, value in samples:
+            self.assertEqual(get_suit_integer(suit), value)
+
+    def test_ten_names(self):
+
+        """Test that "10" and "T" names give the same card."""
+
+        for suit in "CHSDchsd":
+            self.assertEqual(Card(name="10" + suit).index(),
+                             Card(name="T" + suit).index())
+
+    def test_parse_cards(self):
+
+        """Test parsing a string of card names into indices."""
+
+        self.assertEqual(parse_cards("AS KD, 10h 7c  td"),
+                         [26, 51, 22, 6, 48])
+        self.assertEqual(parse_cards(""), [])
+        self.assertEqual(parse_cards("AS KD QH"),
+                         Hand(namelist=["AS", "KD", "QH"]).index_list())
+
+    def test_parse_cards_bad_names(self):
+
+        """Test that invalid names raise a ValueError exception."""
+
+        for names in ["AS XD", "AS 1S", "15C", "AS,,Q"]:
+            self.assertRaises(ValueError, parse_cards, names)
+
+
+if __name__ == "__main__":
+    unittest.main()
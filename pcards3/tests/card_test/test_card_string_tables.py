@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+"""Test module for cached card strings."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+
+from pcards import Card, Hand, cards_string, parse_cards
+from pcards import rank_string, suit_string
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Test sequence class for cached card strings."""
+
+    def setUp(self):
+        pass
+
+    def test_name_strings_all_forms(self):
+
+        """Test that card names are consistent with the rank and
+        suit strings for every combination of arguments.
+
+        """
+
+        for index in range(52):
+            card = Card(index=index)
+            for short in (False, True):
+                for cap in (False, True):
+                    joiner = "" if short else " of "
+                    expected = (rank_string(card.rank(), short, cap) +
+                                joiner +
+                                suit_string(card.suit(), short, cap))
+                    self.assertEqual(card.name_string(short, cap), expected)
+
+    def test_truthy_arguments(self):
+
+        """Test that non-boolean arguments select the same strings."""
+
+        card = Card(name="QH")
+        self.assertEqual(card.name_string(short=1, capitalize="yes"), "QH")
+        self.assertEqual(card.rank_string(capitalize=1), "Queen")
+        self.assertEqual(rank_string(1, short=1), "A")
+
+    def test_cards_string(self):
+
+        """Test that cards_string() reverses parse_cards()."""
+
+        names = "AS KD TH 7C 2D"
+        self.assertEqual(cards_string(parse_cards(names)), names)
+        self.assertEqual(cards_string([0, 13], separator=","), "AC,AH")
+        self.assertEqual(cards_string([]), "")
+
+    def test_hand_string(self):
+
+        """Test that hands show the padded short names."""
+
+        self.assertEqual(str(Hand(namelist=["AS", "10D", "7h"])),
+                         "  AS  TD  7H")
+
+
+if __name__ == "__main__":
+    unittest.main()
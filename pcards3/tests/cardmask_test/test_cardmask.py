@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+"""Unit test module for CardMask class."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+
+from pcards import Card, Hand, PokerHand, CardMask, FULL_MASK
+from pcards import indices_to_mask, mask_to_indices
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for CardMask class."""
+
+    def setUp(self):
+        self.hand = Hand(namelist=["AS", "KS", "AH", "7D", "2C"])
+        self.cmask = CardMask.from_hand(self.hand)
+
+    def test_round_trip(self):
+
+        """Test conversion from and back to a Hand."""
+
+        self.assertEqual(len(self.cmask), 5)
+        self.assertEqual(sorted(self.hand.index_list()),
+                         self.cmask.index_list())
+        self.assertEqual(self.cmask.to_hand().index_list(),
+                         self.cmask.index_list())
+        self.assertEqual(CardMask.from_hand(self.cmask.to_hand()),
+                         self.cmask)
+
+    def test_to_poker_hand(self):
+
+        """Test conversion to a PokerHand is evaluated."""
+
+        hand = CardMask.from_hand(Hand(namelist=["AS", "KS", "QS", "JS",
+                                                 "TS"])).to_hand(PokerHand)
+        self.assertEqual(hand.show_value(short=True), "RF")
+
+    def test_membership(self):
+
+        """Test membership by Card instance and by index."""
+
+        self.assertTrue(Card(name="AS") in self.cmask)
+        self.assertTrue(Card(name="7D").index() in self.cmask)
+        self.assertFalse(Card(name="7H") in self.cmask)
+        self.assertFalse("AS" in self.cmask)
+        self.assertFalse(52 in self.cmask)
+
+    def test_counts(self):
+
+        """Test rank and suit counts."""
+
+        self.assertEqual(self.cmask.rank_count("ace"), 2)
+        self.assertEqual(self.cmask.rank_count(1), 2)
+        self.assertEqual(self.cmask.rank_count(13), 1)
+        self.assertEqual(self.cmask.rank_count(8), 0)
+        self.assertEqual(self.cmask.suit_count("spades"), 2)
+        self.assertEqual(self.cmask.suit_counts(), [1, 1, 2, 1])
+        counts = self.cmask.rank_counts()
+        self.assertEqual(counts[14], 2)
+        self.assertEqual(counts[2], 1)
+        self.assertEqual(sum(counts), 5)
+
+    def test_set_operations(self):
+
+        """Test union, intersection, difference and complement."""
+
+        dead = CardMask.from_indices([Card(name="AS").index(),
+                                      Card(name="QH").index()])
+        self.assertEqual(len(self.cmask | dead), 6)
+        self.assertEqual((self.cmask & dead).index_list(),
+                         [Card(name="AS").index()])
+        self.assertEqual(len(self.cmask - dead), 4)
+        self.assertEqual(len(self.cmask ^ dead), 5)
+        self.assertEqual(len(~self.cmask), 47)
+        self.assertEqual((~CardMask()).mask(), FULL_MASK)
+
+    def test_int_functions(self):
+
+        """Test the integer mask functions."""
+
+        self.assertEqual(indices_to_mask([0, 3, 51]),
+                         (1 << 0) | (1 << 3) | (1 << 51))
+        self.assertEqual(mask_to_indices((1 << 3) | (1 << 51) | 1),
+                         [0, 3, 51])
+        self.assertRaises(ValueError, indices_to_mask, [3, 3])
+        self.assertRaises(ValueError, indices_to_mask, [52])
+
+    def test_bad_arguments(self):
+
+        """Test that a ValueError exception is raised for invalid
+        masks and for duplicate cards.
+
+        """
+
+        self.assertRaises(ValueError, CardMask, 1 << 52)
+        self.assertRaises(ValueError, CardMask, -1)
+        self.assertRaises(ValueError, CardMask.from_hand,
+                          Hand(namelist=["AS", "AS"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
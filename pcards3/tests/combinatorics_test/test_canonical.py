@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+"""Unit test module for suit-isomorphism canonicalization."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import random
+import unittest
+from itertools import combinations, permutations
+
+from pcards import Card, Hand, PokerHand
+from pcards import canonical_id, canonical_indices
+from pcards import canonical_count, canonical_from_id
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for suit-isomorphism canonicalization."""
+
+    def setUp(self):
+        self.rng = random.Random(1)
+
+    def permuted(self, indices, perm):
+
+        """Returns card indices with their suits permuted."""
+
+        return [perm[idx // 13] * 13 + idx % 13 for idx in indices]
+
+    def test_counts(self):
+        self.assertEqual([canonical_count(size) for size in range(8)],
+                         [1, 13, 169, 1755, 16432, 134459,
+                          962988, 6009159])
+        self.assertEqual(canonical_count(52), 1)
+        self.assertRaises(ValueError, canonical_count, 53)
+        self.assertRaises(ValueError, canonical_count, -1)
+
+    def test_small_hands_dense(self):
+        for size in range(4):
+            ids = set()
+            for combo in combinations(range(52), size):
+                hand_id = canonical_id(combo)
+                ids.add(hand_id)
+                self.assertEqual(canonical_from_id(hand_id, size),
+                                 canonical_indices(combo))
+            self.assertEqual(ids, set(range(canonical_count(size))))
+
+    def test_five_card_round_trip(self):
+        for hand_id in range(0, canonical_count(5), 97):
+            indices = canonical_from_id(hand_id, 5)
+            self.assertEqual(canonical_id(indices), hand_id)
+            self.assertEqual(canonical_indices(indices), indices)
+
+    def test_suit_permutations(self):
+        for size in (2, 5, 7, 13, 30):
+            indices = self.rng.sample(range(52), size)
+            hand_id = canonical_id(indices)
+            canonical = canonical_indices(indices)
+            for perm in permutations(range(4)):
+                permuted = self.permuted(indices, perm)
+                self.assertEqual(canonical_id(permuted), hand_id)
+                self.assertEqual(canonical_indices(permuted), canonical)
+
+    def test_different_hands(self):
+        self.assertNotEqual(canonical_id(["AS", "KS"]),
+                            canonical_id(["AS", "KH"]))
+        self.assertEqual(canonical_id(["AS", "KS"]),
+                         canonical_id(["AD", "KD"]))
+        self.assertNotEqual(canonical_id(["AS", "KS", "QH"]),
+                            canonical_id(["AS", "KH", "QH"]))
+
+    def test_canonical_suits(self):
+        self.assertEqual(canonical_indices(["7D", "2S", "9S"]),
+                         canonical_indices(["2C", "9C", "7H"]))
+        self.assertEqual(canonical_indices(["2C", "9C", "7H"]),
+                         [Card(name="2C").index(), Card(name="9C").index(),
+                          Card(name="7H").index()])
+
+    def test_hand_forms(self):
+        names = ["AS", "KD", "7D", "7H", "2C"]
+        indices = [Card(name=name).index() for name in names]
+        expected = canonical_id(indices)
+        self.assertEqual(canonical_id(names), expected)
+        self.assertEqual(canonical_id([Card(name=name) for name in names]),
+                         expected)
+        self.assertEqual(canonical_id(Hand(namelist=names)), expected)
+        self.assertEqual(canonical_id(PokerHand(namelist=names)), expected)
+
+    def test_invalid_hands(self):
+        self.assertRaises(ValueError, canonical_id, ["AS", "AS"])
+        self.assertRaises(ValueError, canonical_id, [52])
+        self.assertRaises(ValueError, canonical_from_id, -1, 5)
+        self.assertRaises(ValueError, canonical_from_id,
+                          canonical_count(5), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+"""Unit test module for lazy colexicographic combinations."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+from itertools import combinations, islice
+from math import comb
+
+from pcards import colex_combinations
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for lazy colexicographic combinations."""
+
+    def expected(self, values, size):
+
+        """Returns every combination in colexicographic order."""
+
+        return sorted(combinations(sorted(values), size),
+                      key=lambda combo: tuple(reversed(combo)))
+
+    def test_colex_order(self):
+        values = [3, 9, 11, 20, 21, 30, 41, 44, 51]
+        for size in range(len(values) + 1):
+            self.assertEqual(list(colex_combinations(values, size)),
+                             self.expected(values, size))
+
+    def test_unsorted_and_repeated_indices(self):
+        self.assertEqual(list(colex_combinations([5, 1, 5, 3], 2)),
+                         [(1, 3), (1, 5), (3, 5)])
+
+    def test_masks(self):
+        values = [0, 4, 13, 26, 39, 51]
+        self.assertEqual(list(colex_combinations(values, 3, masks=True)),
+                         [sum(1 << idx for idx in combo) for combo in
+                          self.expected(values, 3)])
+
+    def test_start_and_stop(self):
+        values = list(range(12))
+        expected = self.expected(values, 5)
+        for start in range(0, len(expected) + 3, 37):
+            for stop in (start, start + 1, start + 50, None):
+                self.assertEqual(list(colex_combinations(values, 5,
+                                                         start, stop)),
+                                 expected[start:stop])
+
+    def test_chunks(self):
+        total = comb(20, 4)
+        chunked = []
+        for start in range(0, total, 100):
+            chunked.extend(colex_combinations(range(20), 4, start,
+                                              start + 100))
+        self.assertEqual(chunked, list(colex_combinations(range(20), 4)))
+
+    def test_first_and_last(self):
+        self.assertEqual(next(colex_combinations(range(52), 7)),
+                         (0, 1, 2, 3, 4, 5, 6))
+        last = list(colex_combinations(range(52), 7, comb(52, 7) - 1))
+        self.assertEqual(last, [(45, 46, 47, 48, 49, 50, 51)])
+
+    def test_lazy(self):
+        first = list(islice(colex_combinations(range(52), 7), 3))
+        self.assertEqual(first[2], (0, 1, 2, 3, 4, 6, 7))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, list, colex_combinations(range(5), -1))
+        self.assertRaises(ValueError, list,
+                          colex_combinations(range(5), 2, -1))
+        self.assertEqual(list(colex_combinations(range(5), 6)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
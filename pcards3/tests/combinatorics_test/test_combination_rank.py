@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+"""Unit test module for combination ranking and unranking."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import random
+import unittest
+from math import comb
+
+from pcards import Card, Hand, CardMask, indices_to_mask
+from pcards import combination_rank, combination_from_rank
+from pcards import colex_combinations
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for combination ranking and unranking."""
+
+    def setUp(self):
+        self.rng = random.Random(1)
+
+    def test_colex_order(self):
+        for size in range(4):
+            for rank, combo in enumerate(colex_combinations(range(52),
+                                                            size)):
+                self.assertEqual(combination_rank(combo), rank)
+                self.assertEqual(combination_from_rank(rank, size),
+                                 list(combo))
+
+    def test_round_trip(self):
+        for size in (5, 7, 13, 26, 51, 52):
+            for _ in range(100):
+                rank = self.rng.randrange(comb(52, size))
+                combo = combination_from_rank(rank, size)
+                self.assertEqual(len(set(combo)), size)
+                self.assertEqual(combo, sorted(combo))
+                self.assertEqual(combination_rank(combo), rank)
+
+    def test_bounds(self):
+        self.assertEqual(combination_from_rank(0, 5), [0, 1, 2, 3, 4])
+        self.assertEqual(combination_from_rank(comb(52, 5) - 1, 5),
+                         [47, 48, 49, 50, 51])
+        self.assertEqual(combination_from_rank(0, 0), [])
+        self.assertEqual(combination_rank([]), 0)
+        self.assertEqual(combination_rank(range(52)), 0)
+
+    def test_card_forms(self):
+        indices = [40, 3, 17, 28, 9]
+        rank = combination_rank(indices)
+        cards = [Card(index=idx) for idx in indices]
+        self.assertEqual(combination_rank(cards), rank)
+        self.assertEqual(combination_rank([card.name_string(short=True)
+                                           for card in cards]), rank)
+        self.assertEqual(combination_rank(Hand(cardlist=cards)), rank)
+
+    def test_masks(self):
+        for _ in range(100):
+            size = self.rng.randrange(53)
+            indices = self.rng.sample(range(52), size)
+            mask = indices_to_mask(indices)
+            rank = combination_rank(indices)
+            self.assertEqual(combination_rank(mask), rank)
+            self.assertEqual(combination_rank(CardMask(mask)), rank)
+            self.assertEqual(combination_from_rank(rank, size, masks=True),
+                             mask)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, combination_rank, [3, 3])
+        self.assertRaises(ValueError, combination_rank, [52])
+        self.assertRaises(ValueError, combination_rank, -1)
+        self.assertRaises(ValueError, combination_rank, 1 << 52)
+        self.assertRaises(ValueError, combination_from_rank, -1, 5)
+        self.assertRaises(ValueError, combination_from_rank,
+                          comb(52, 5), 5)
+        self.assertRaises(ValueError, combination_from_rank, 0, 53)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+"""Test module for hand enumeration in deck module."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+from math import comb
+
+from pcards import Card, Deck, Hand
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Test sequence class for deck module."""
+
+    def test_count(self):
+        deck = Deck()
+        self.assertEqual(sum(1 for _ in deck.combinations(3)), comb(52, 3))
+
+    def test_dead_cards(self):
+        deck = Deck()
+        dead = ["AS", "KD", 5]
+        excluded = set([Card(name="AS").index(), Card(name="KD").index(), 5])
+        combos = list(deck.combinations(2, dead=dead))
+        self.assertEqual(len(combos), comb(49, 2))
+        self.assertFalse(any(set(combo) & excluded for combo in combos))
+        hand = Hand(namelist=["AS", "KD"])
+        self.assertEqual(len(list(deck.combinations(2, dead=hand))),
+                         comb(50, 2))
+
+    def test_drawn_cards(self):
+        deck = Deck()
+        drawn = set([card.index() for card in deck.draw(10)])
+        combos = list(deck.combinations(2))
+        self.assertEqual(len(combos), comb(42, 2))
+        self.assertFalse(any(set(combo) & drawn for combo in combos))
+
+    def test_multiple_packs(self):
+        deck = Deck(4)
+        self.assertEqual(sum(1 for _ in deck.combinations(2)), comb(52, 2))
+
+    def test_resume(self):
+        deck = Deck()
+        whole = list(deck.combinations(4, start=1000, stop=1100))
+        self.assertEqual(whole[:40], list(deck.combinations(4, start=1000,
+                                                            stop=1040)))
+        self.assertEqual(whole[40:], list(deck.combinations(4, start=1040,
+                                                            stop=1100)))
+
+    def test_masks(self):
+        deck = Deck()
+        for combo, mask in zip(deck.combinations(5, start=12345, stop=12400),
+                               deck.combinations(5, start=12345, stop=12400,
+                                                 masks=True)):
+            self.assertEqual(mask, sum(1 << idx for idx in combo))
+
+
+if __name__ == '__main__':
+    unittest.main()
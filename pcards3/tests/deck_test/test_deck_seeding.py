@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+"""Test module for seeded shuffling in deck module."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import random
+import unittest
+from collections import Counter
+
+from pcards import Deck, spawn_seeds
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Test sequence class for deck module."""
+
+    def shuffled_indices(self, deck):
+
+        """Shuffles a deck and returns its card indices."""
+
+        deck.shuffle()
+        return [card.index() for card in deck.get_card_list()]
+
+    def test_seed_reproducible(self):
+        deck1 = Deck(seed=42)
+        deck2 = Deck(seed=42)
+        for _ in range(3):
+            self.assertEqual(self.shuffled_indices(deck1),
+                             self.shuffled_indices(deck2))
+        self.assertNotEqual(self.shuffled_indices(Deck(seed=42)),
+                            self.shuffled_indices(Deck(seed=43)))
+
+    def test_seed_independent_of_global_state(self):
+        random.seed(1)
+        first = self.shuffled_indices(Deck(seed="table 1"))
+        random.seed(2)
+        second = self.shuffled_indices(Deck(seed="table 1"))
+        self.assertEqual(first, second)
+
+    def test_rng(self):
+        deck1 = Deck(rng=random.Random(7))
+        deck2 = Deck(rng=random.Random(7))
+        self.assertEqual(self.shuffled_indices(deck1),
+                         self.shuffled_indices(deck2))
+        self.assertRaises(ValueError, Deck, 1, 7, random.Random(7))
+
+    def test_shuffle_keeps_cards(self):
+        deck = Deck(seed=3)
+        self.assertEqual(sorted(self.shuffled_indices(deck)),
+                         list(range(52)))
+        deck.draw(10)
+        self.assertEqual(len(self.shuffled_indices(deck)), 42)
+        shoe = Deck(2, seed=3)
+        self.assertEqual(Counter(self.shuffled_indices(shoe)),
+                         Counter(list(range(52)) * 2))
+
+    def test_shuffle_uniform(self):
+
+        """
+        Test that each card reaches the top of a small deck about
+        equally often.
+
+        """
+
+        deck = Deck(seed=5)
+        deck.draw(48)
+        tops = Counter()
+        for _ in range(4000):
+            deck.shuffle(return_discards=False)
+            tops[deck[-1].index()] += 1
+        self.assertEqual(len(tops), 4)
+        for count in tops.values():
+            self.assertTrue(850 < count < 1150)
+
+    def test_spawn_seeds(self):
+        seeds = spawn_seeds(99, 5)
+        self.assertEqual(len(set(seeds)), 5)
+        self.assertEqual(spawn_seeds(99, 5), seeds)
+        self.assertEqual(spawn_seeds(99, 3, 2), seeds[2:])
+        self.assertNotEqual(spawn_seeds(98, 5), seeds)
+        self.assertRaises(TypeError, spawn_seeds, 1.5, 2)
+
+    def test_spawn(self):
+        children1 = Deck(seed=11).spawn(3)
+        parent = Deck(seed=11)
+        children2 = parent.spawn(2) + parent.spawn(1)
+        deals1 = [self.shuffled_indices(deck) for deck in children1]
+        deals2 = [self.shuffled_indices(deck) for deck in children2]
+        self.assertEqual(deals1, deals2)
+        self.assertEqual(len(set(tuple(deal) for deal in deals1)), 3)
+        self.assertEqual(len(Deck(4, seed=1).spawn(1)[0]), 208)
+
+    def test_spawn_unseeded(self):
+        children = Deck(rng=random.Random(2)).spawn(2)
+        again = Deck(rng=random.Random(2)).spawn(2)
+        self.assertEqual([self.shuffled_indices(deck) for deck in children],
+                         [self.shuffled_indices(deck) for deck in again])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+"""Test module for multiple pack decks in deck module."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import gc
+import unittest
+
+from pcards import Card, Deck, PokerHand
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Test sequence class for deck module."""
+
+    def setUp(self):
+        pass
+
+    def test_draw_order(self):
+
+        """
+        Test that cards are drawn from the top of the deck in order.
+
+        """
+
+        deck = Deck(8)
+        top_cards = deck[-5:]
+        top_cards.reverse()
+        drawn = deck.draw(5)
+        self.assertEqual(len(drawn), 5)
+        for top_card, card in zip(top_cards, drawn):
+            self.assertTrue(top_card is card)
+        self.assertEqual([card.index() for card in drawn], [0, 1, 2, 3, 4])
+        self.assertEqual(len(deck), 411)
+
+    def test_draw_whole_shoe(self):
+
+        """
+        Test that drawing a whole shoe returns every card once per pack.
+
+        """
+
+        deck = Deck(8)
+        deck.shuffle()
+        counts = [0] * 52
+        while len(deck):
+            for card in deck.draw(7 if len(deck) >= 7 else len(deck)):
+                counts[card.index()] += 1
+        self.assertEqual(counts, [8] * 52)
+
+    def test_shuffle_keeps_cards(self):
+
+        """
+        Test that shuffling with discards keeps the same cards.
+
+        """
+
+        deck = Deck(2)
+        deck.discard(deck.draw(30))
+        deck.shuffle()
+        self.assertEqual(len(deck), 104)
+        self.assertEqual(deck.discard_size(), 0)
+        self.assertEqual(sorted(card.index() for card in deck),
+                         sorted(list(range(52)) * 2))
+
+    def test_replace_foreign_discards(self):
+
+        """
+        Test that cards not taken from the deck can be discarded
+        to it, and are placed at the bottom.
+
+        """
+
+        deck = Deck()
+        foreign = Card(name="QH")
+        deck.discard([foreign])
+        deck.replace_discards()
+        self.assertEqual(len(deck), 53)
+        self.assertTrue(deck[0] is foreign)
+
+        other = Card(name="2C")
+        deck[5] = other
+        self.assertTrue(deck[5] is other)
+        self.assertTrue(deck.draw(53)[-6] is other)
+
+    def test_copied_discards_not_kept(self):
+
+        """
+        Test that a deck holds only its current cards when copies of
+        drawn cards are discarded to it over many deals.
+
+        """
+
+        deck = Deck(seed=1)
+        for _ in range(200):
+            deck.shuffle()
+            hand = PokerHand(cardlist=deck.draw(5))
+            deck.discard(hand.get_list())
+        deck.replace_discards()
+        self.assertEqual(len(deck), 52)
+
+        held = set()
+        for referent in gc.get_referents(vars(deck)):
+            if isinstance(referent, list):
+                held.update(id(card) for card in referent
+                            if isinstance(card, Card))
+        self.assertEqual(held, set(id(card) for card in deck))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+"""Unit test module for exact equity function."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+
+from pcards import Card, PokerHand, exact_equity
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for exact equity function."""
+
+    def setUp(self):
+        self.hands = [["AS", "AH"], ["KS", "KH"], ["7C", "8C"]]
+        self.board = ["2C", "9C", "KD"]
+
+    def test_matches_brute_force(self):
+
+        """Test that exact equity on the turn matches a brute force
+        evaluation with PokerHand instances.
+
+        """
+
+        board = self.board + ["3H"]
+        dealt = set(self.hands[0] + self.hands[1] + self.hands[2] + board)
+        wins = [0, 0, 0]
+        boards = 0
+        for index in range(52):
+            name = Card(index=index).name_string(short=True)
+            if name in dealt:
+                continue
+            boards += 1
+            hands = [PokerHand(namelist=hand + board + [name])
+                     for hand in self.hands]
+            best = max(hands)
+            winners = [pos for pos, hand in enumerate(hands)
+                       if hand == best]
+            if len(winners) == 1:
+                wins[winners[0]] += 1
+
+        results = exact_equity(self.hands, board=board, workers=1)
+        for result, win in zip(results, wins):
+            self.assertEqual(result.trials, boards)
+            self.assertAlmostEqual(result.win, win / boards)
+
+    def test_workers_deterministic(self):
+
+        """Test that the results do not depend on the number of
+        worker processes.
+
+        """
+
+        self.assertEqual(exact_equity(self.hands, board=self.board[:2],
+                                      workers=1),
+                         exact_equity(self.hands, board=self.board[:2],
+                                      workers=2))
+
+    def test_equities_sum_to_one(self):
+
+        """Test that the equities of all hands sum to one."""
+
+        results = exact_equity(self.hands, board=self.board, workers=1)
+        self.assertAlmostEqual(sum(result.equity for result in results), 1.0)
+        self.assertEqual(results[0].stderr, 0.0)
+
+    def test_incomplete_hand(self):
+
+        """Test that a ValueError exception is raised for an
+        incomplete hand.
+
+        """
+
+        self.assertRaises(ValueError, exact_equity, [["AS", "AH"], ["KS"]],
+                          board=self.board, workers=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+"""Unit test module for Monte Carlo equity function."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+
+from pcards import Card, Hand, equity
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for Monte Carlo equity function."""
+
+    def setUp(self):
+        pass
+
+    def test_aces_against_kings(self):
+
+        """Test that aces are about an 82% favourite against kings."""
+
+        results = equity([["AS", "AH"], ["KS", "KH"]],
+                         trials=20000, seed=1)
+        self.assertAlmostEqual(results[0].equity, 0.82, delta=0.02)
+        self.assertAlmostEqual(results[0].equity + results[1].equity, 1.0)
+        self.assertEqual(results[0].win, results[1].lose)
+        self.assertEqual(results[0].trials, 20000)
+
+    def test_seed_reproducible(self):
+
+        """Test that the same seed gives the same results."""
+
+        hands = [Hand(namelist=["AS", "KS"]), None]
+        self.assertEqual(equity(hands, trials=2000, seed=7),
+                         equity(hands, trials=2000, seed=7))
+
+    def test_board_decided(self):
+
+        """Test that a complete board gives exact results."""
+
+        results = equity([[Card(name="AS"), Card(name="AH")], [12, 25]],
+                         board=["AC", "KD", "2C", "7H", "9S"], trials=100)
+        self.assertEqual(results[0].win, 1.0)
+        self.assertEqual(results[1].lose, 1.0)
+        self.assertEqual(results[0].stderr, 0.0)
+
+    def test_split_pot(self):
+
+        """Test that a board playing for everybody splits the pot."""
+
+        results = equity([["2C", "3C"], ["2D", "3D"]],
+                         board=["AS", "KS", "QS", "JS", "TS"], trials=10)
+        self.assertEqual(results[0].tie, 1.0)
+        self.assertEqual(results[0].equity, 0.5)
+
+    def test_early_stopping(self):
+
+        """Test that a target standard error stops early."""
+
+        results = equity([["AS", "AH"], None], trials=100000, seed=3,
+                         target_stderr=0.01)
+        self.assertTrue(results[0].trials < 100000)
+        self.assertTrue(results[0].stderr <= 0.01)
+
+    def test_bad_arguments(self):
+
+        """Test that a ValueError exception is raised for bad
+        arguments.
+
+        """
+
+        self.assertRaises(ValueError, equity, [["AS", "AH"]])
+        self.assertRaises(ValueError, equity, [["AS", "AH"], ["AS", "KD"]])
+        self.assertRaises(ValueError, equity, [["AS", "AH", "AD"], None])
+        self.assertRaises(ValueError, equity, [["AS", "AH"], None],
+                          dead=["AH"])
+        self.assertRaises(ValueError, equity, [["AS", "AH"], None],
+                          trials=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
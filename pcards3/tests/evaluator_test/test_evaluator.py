@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+
+"""Unit test module for lookup table evaluator functions."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import random
+import unittest
+
+from itertools import combinations
+
+from pcards import Card, PokerHand, Hand, evaluate, rank_category
+from pcards import best_five
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for lookup table evaluator functions."""
+
+    def setUp(self):
+        self.samples = [
+            (["AS", "KS", "QS", "JS", "TS"], "RF"),
+            (["AD", "2D", "3D", "4D", "5D"], "SF"),
+            (["9C", "9H", "9S", "9D", "4C"], "FK"),
+            (["KC", "KH", "KS", "2D", "2C"], "FH"),
+            (["AC", "KC", "JC", "9C", "TC"], "FL"),
+            (["AC", "2H", "3S", "4D", "5C"], "ST"),
+            (["7C", "7H", "7S", "2D", "TC"], "TK"),
+            (["7C", "7H", "3S", "3D", "TC"], "TP"),
+            (["7C", "7H", "3S", "4D", "TC"], "PR"),
+            (["7C", "5H", "3S", "4D", "2C"], "HI")
+        ]
+
+    def test_rank_bounds(self):
+
+        """Test that the best and worst hands have the
+        expected ranks.
+
+        """
+
+        self.assertEqual(evaluate(Hand(namelist=["AS", "KS", "QS",
+                                                 "JS", "TS"]).index_list()),
+                         1)
+        self.assertEqual(evaluate(Hand(namelist=["7C", "5H", "4S",
+                                                 "3D", "2C"]).index_list()),
+                         7462)
+
+    def test_categories(self):
+
+        """Test that the category of each rank matches the
+        PokerHand evaluation.
+
+        """
+
+        short_strings = ["HI", "PR", "TP", "TK", "ST",
+                         "FL", "FH", "FK", "SF", "RF"]
+        for namelist, short in self.samples:
+            hand = PokerHand(namelist=namelist)
+            rank = evaluate(hand.index_list())
+            self.assertEqual(hand.show_value(short=True), short)
+            self.assertEqual(short_strings[rank_category(rank)], short)
+
+    def test_order_matches_comparisons(self):
+
+        """Test that lower ranks correspond to better hands."""
+
+        hands = [PokerHand(namelist=namelist)
+                 for namelist, _ in self.samples]
+        for better, worse in zip(hands, hands[1:]):
+            self.assertTrue(better > worse)
+            self.assertTrue(evaluate(better.index_list()) <
+                            evaluate(worse.index_list()))
+
+    def test_order_independent(self):
+
+        """Test that the order of the cards does not matter."""
+
+        hand = Hand(namelist=["7C", "7H", "3S", "4D", "TC"])
+        rank = evaluate(hand.index_list())
+        self.assertEqual(evaluate(list(reversed(hand.index_list()))), rank)
+
+    def test_seven_cards_best_subset(self):
+
+        """Test that six and seven card hands rank the same as the
+        best five card hand which can be made from them.
+
+        """
+
+        hands = [["AS", "KS", "2D", "QS", "7C", "JS", "TS"],
+                 ["AS", "AH", "2D", "2S", "7C", "7S", "TS"],
+                 ["3C", "3H", "3S", "5D", "5C", "5H", "KD"],
+                 ["2C", "3H", "4S", "5D", "9C", "AH", "6H"],
+                 ["2H", "3H", "4S", "5H", "9H", "AH", "6H"],
+                 ["2H", "3H", "4S", "5H", "9H", "AH"]]
+
+        for namelist in hands:
+            indices = Hand(namelist=namelist).index_list()
+            best = min(evaluate(list(cmb))
+                       for cmb in combinations(indices, 5))
+            self.assertEqual(evaluate(indices), best)
+            self.assertEqual(evaluate(list(best_five(indices))), best)
+
+    def test_best_five_cards(self):
+
+        """Test that best_five() returns the cards making up
+        the best hand.
+
+        """
+
+        indices = Hand(namelist=["AS", "KS", "2D", "QS",
+                                 "7C", "JS", "TS"]).index_list()
+        best = Hand(namelist=["AS", "KS", "QS", "JS", "TS"]).index_list()
+        self.assertEqual(sorted(best_five(indices)), sorted(best))
+
+    def test_bad_arguments(self):
+
+        """Test that a ValueError exception is raised for the wrong
+        number of cards, invalid indices, and unrankable hands.
+
+        """
+
+        self.assertRaises(ValueError, evaluate, [0, 1, 2, 3])
+        self.assertRaises(ValueError, evaluate, [0, 1, 2, 3, 4, 5, 6, 7])
+        self.assertRaises(ValueError, evaluate, [0, 1, 2, 3, 52])
+        self.assertRaises(ValueError, evaluate, [0, 0, 0, 0, 0])
+        self.assertRaises(ValueError, rank_category, 0)
+        self.assertRaises(ValueError, rank_category, 7463)
+
+    def poker_hand(self, indices):
+
+        """Returns a PokerHand of cards with the given indices."""
+
+        return PokerHand(namelist=[Card(index=idx).name_string(True)
+                                   for idx in indices])
+
+    def test_repeated_flush_cards(self):
+
+        """Test that a hand whose best five cards are a flush
+        containing the same card twice, from multiple packs, is
+        unrankable for every hand size, and that PokerHand scores it
+        by that flush for every hand size.
+
+        """
+
+        for hand, subset in [([8, 6, 8, 0, 8], [8, 6, 8, 0, 8]),
+                             ([8, 6, 29, 8, 0, 44, 8], [8, 6, 8, 0, 8]),
+                             ([0, 0, 15, 1, 9, 3, 5], [0, 0, 9, 5, 3]),
+                             ([0, 1, 2, 3, 5, 5], [0, 5, 5, 3, 2])]:
+            self.assertRaises(ValueError, evaluate, hand)
+            self.assertEqual(self.poker_hand(hand).score_int(),
+                             self.poker_hand(subset).score_int())
+        self.assertEqual(self.poker_hand([0, 0, 9, 5, 3]).show_value(),
+                         "Flush")
+
+        # Flushes of different cards are ranked if they are the best
+        # flush, and hands which beat any flush are always ranked.
+
+        self.assertEqual(evaluate([0, 12, 11, 10, 8, 1, 1]),
+                         evaluate([0, 12, 11, 10, 8]))
+        self.assertEqual(evaluate([0, 12, 11, 10, 9, 0]), 1)
+        self.assertEqual(evaluate([0, 0, 0, 0, 1, 2]),
+                         evaluate([0, 13, 26, 39, 2]))
+        self.assertEqual(evaluate([0, 0, 0, 12, 12]),
+                         evaluate([0, 13, 26, 12, 25]))
+
+    def test_multiple_pack_consistency(self):
+
+        """Test that evaluate() and PokerHand agree with the best
+        five card hand of six and seven card multiple pack hands.
+
+        """
+
+        rng = random.Random(3)
+        for _ in range(300):
+            hand = [rng.choice([0, 0, 0, 13]) + rng.randrange(13)
+                    for _ in range(rng.choice([6, 7]))]
+            best = None
+            for cmb in combinations(hand, 5):
+                try:
+                    subset = self.poker_hand(cmb)
+                except NotImplementedError:
+                    continue
+                if best is None or subset.score_int() > best.score_int():
+                    best = subset
+            if best is None:
+                continue
+            self.assertEqual(self.poker_hand(hand).score_int(),
+                             best.score_int())
+            try:
+                rank = evaluate(hand)
+            except ValueError:
+                self.assertEqual(best.show_value(short=True), "FL")
+                self.assertRaises(ValueError, evaluate, best.index_list())
+            else:
+                self.assertEqual(rank, evaluate(best.index_list()))
+
+if __name__ == "__main__":
+    unittest.main()
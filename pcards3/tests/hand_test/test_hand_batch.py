@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+"""Test module for batched changes to Hand instances."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+
+from pcards import Card, Deck, Hand, PokerHand
+
+
+class CountingPokerHand(PokerHand):
+
+    """PokerHand subclass which counts evaluations."""
+
+    evaluations = 0
+
+    def _evaluate(self):
+
+        """Counts and performs an evaluation."""
+
+        CountingPokerHand.evaluations += 1
+        PokerHand._evaluate(self)
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Test sequence class for batched changes to Hand instances."""
+
+    def setUp(self):
+        self.notifications = 0
+        CountingPokerHand.evaluations = 0
+
+    def notify(self):
+
+        """Observer callback which counts notifications."""
+
+        self.notifications += 1
+
+    def test_construction_evaluates_once(self):
+
+        """Test that constructing a hand evaluates it only once."""
+
+        CountingPokerHand(namelist=["AS", "KS", "QS", "JS", "TS", "2C"])
+        self.assertEqual(CountingPokerHand.evaluations, 1)
+
+        CountingPokerHand(Deck(), 5)
+        self.assertEqual(CountingPokerHand.evaluations, 2)
+
+        hand = CountingPokerHand(namelist=["AS", "KS", "QS", "JS", "TS"])
+        hand.copy()
+        self.assertEqual(CountingPokerHand.evaluations, 4)
+
+    def test_batch_coalesces_changes(self):
+
+        """Test that changes in a batch cause one evaluation and
+        one notification.
+
+        """
+
+        hand = CountingPokerHand(namelist=["AS", "KS", "QS", "JS", "2D"])
+        hand.observe(self, self.notify)
+        CountingPokerHand.evaluations = 0
+
+        with hand.batch():
+            hand[4] = Card(name="TS")
+            hand.append(Card(name="9S"))
+            hand.pop()
+            self.assertEqual(self.notifications, 0)
+
+        self.assertEqual(self.notifications, 1)
+        self.assertEqual(CountingPokerHand.evaluations, 1)
+        self.assertEqual(hand.show_value(short=True), "RF")
+
+    def test_nested_batches(self):
+
+        """Test that nested batches defer to the outermost."""
+
+        hand = Hand(namelist=["AS", "KS"])
+        hand.observe(self, self.notify)
+
+        with hand.batch():
+            with hand.batch():
+                hand.append(Card(name="QS"))
+            self.assertEqual(self.notifications, 0)
+            hand.append(Card(name="JS"))
+
+        self.assertEqual(self.notifications, 1)
+
+    def test_empty_batch(self):
+
+        """Test that a batch without changes does not notify."""
+
+        hand = Hand(namelist=["AS", "KS"])
+        hand.observe(self, self.notify)
+        with hand.batch():
+            pass
+        self.assertEqual(self.notifications, 0)
+
+    def test_batch_exception(self):
+
+        """Test that the hand is evaluated if a batch raises
+        an exception.
+
+        """
+
+        hand = PokerHand(namelist=["AS", "KS", "QS", "JS", "2D"])
+        try:
+            with hand.batch():
+                hand[4] = Card(name="TS")
+                raise KeyError
+        except KeyError:
+            pass
+        self.assertEqual(hand.show_value(short=True), "RF")
+
+    def test_iadd_imul_notify_once(self):
+
+        """Test that += and *= notify observers once."""
+
+        hand = Hand(namelist=["AS", "KS"])
+        hand.observe(self, self.notify)
+        hand += Hand(namelist=["QS"])
+        self.assertEqual(self.notifications, 1)
+        hand *= 3
+        self.assertEqual(self.notifications, 2)
+        self.assertEqual(len(hand), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
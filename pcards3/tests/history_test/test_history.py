@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+"""Unit test module for hand history files."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import os
+import tempfile
+import unittest
+
+from pcards import Deck, PokerHand, evaluate
+from pcards.history import (HistoryWriter, iter_history, read_history,
+                            HEADER_SIZE, RECORD_SIZE)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for hand history files."""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tempdir.name, "hands.phh")
+        deck = Deck(seed=1)
+        deck.shuffle()
+        self.hands = [PokerHand(deck) for _ in range(10)]
+        self.hands.append(PokerHand(namelist=["AS", "KS", "QS", "JS", "TS"]))
+        self.hands.append(PokerHand(namelist=["AS", "AD", "7C", "7H",
+                                              "2S", "3D", "4C"]))
+        self.hands.append(PokerHand(namelist=["AS", "AD"]))
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def write_hands(self, **kwargs):
+
+        """Writes the test hands to the test file."""
+
+        with HistoryWriter(self.filename, buffer_records=4,
+                           **kwargs) as writer:
+            writer.write_many(self.hands)
+
+    def test_record_size(self):
+        self.write_hands()
+        self.assertEqual(os.path.getsize(self.filename),
+                         HEADER_SIZE + RECORD_SIZE * len(self.hands))
+
+    def test_iter_history(self):
+        self.write_hands(bet=2)
+        records = list(iter_history(self.filename))
+        self.assertEqual(len(records), len(self.hands))
+        for record, hand in zip(records, self.hands):
+            self.assertEqual(list(record.cards), hand.index_list())
+            self.assertEqual(record.score, hand.score_int())
+            self.assertEqual(record.category, hand.score_int() >> 20)
+            self.assertEqual(record.payout, hand.video_winnings(2))
+            if len(hand) >= 5:
+                self.assertEqual(record.rank, evaluate(hand.index_list()))
+        self.assertEqual(records[10].rank, 1)
+        self.assertEqual(records[10].payout, 1600)
+        self.assertEqual(records[12].cards, (26, 39))
+
+    def test_append(self):
+        self.write_hands()
+        with HistoryWriter(self.filename, append=True) as writer:
+            writer.write(self.hands[0])
+        records = list(iter_history(self.filename))
+        self.assertEqual(len(records), len(self.hands) + 1)
+        self.assertEqual(records[-1], records[0])
+
+    def test_easy_payouts(self):
+        self.write_hands(easy=True)
+        records = list(iter_history(self.filename))
+        self.assertEqual(records[10].payout, 2500)
+
+    def test_invalid_files(self):
+        with open(self.filename, "wb") as outfile:
+            outfile.write(b"not a history file")
+        self.assertRaises(ValueError, list, iter_history(self.filename))
+        self.assertRaises(ValueError, HistoryWriter, self.filename, True)
+        self.write_hands()
+        with open(self.filename, "ab") as outfile:
+            outfile.write(b"\x00" * 3)
+        self.assertRaises(ValueError, list, iter_history(self.filename))
+
+    def test_too_many_cards(self):
+        with HistoryWriter(self.filename) as writer:
+            self.assertRaises(ValueError, writer.write,
+                              PokerHand(namelist=["2C", "3C", "4C", "5C",
+                                                  "6C", "7C", "8C", "9C"]))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_read_history(self):
+        self.write_hands()
+        records = read_history(self.filename)
+        self.assertEqual(len(records), len(self.hands))
+        self.assertEqual(records.dtype.itemsize, RECORD_SIZE)
+        self.assertEqual(records["cards"][10][:5].tolist(),
+                         self.hands[10].index_list())
+        self.assertEqual(records["cards"][12].tolist(),
+                         [26, 39, 255, 255, 255, 255, 255])
+        self.assertEqual(records["size"].tolist(),
+                         [len(hand) for hand in self.hands])
+        self.assertEqual(records["score"].tolist(),
+                         [hand.score_int() for hand in self.hands])
+        self.assertEqual(records["payout"].tolist(),
+                         [hand.video_winnings(1) for hand in self.hands])
+        self.assertEqual(int((records["category"] == 9).sum()), 1)
+        del records
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_read_empty_history(self):
+        with HistoryWriter(self.filename):
+            pass
+        self.assertEqual(len(read_history(self.filename)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
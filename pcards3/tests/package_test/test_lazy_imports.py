@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+"""Test module for lazy imports of the pcards package."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import os
+import subprocess
+import sys
+import unittest
+
+import pcards
+
+try:
+    import tkinter
+except ImportError:
+    tkinter = None
+
+
+def _run(script):
+
+    """Runs a script in a fresh interpreter and returns its output."""
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    output = subprocess.check_output([sys.executable, "-c", script],
+                                     env=env)
+    return output.decode().strip()
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Test sequence class for lazy imports."""
+
+    def setUp(self):
+        pass
+
+    def test_import_does_not_load_tkinter(self):
+
+        """
+        Test that importing the package does not import tkinter.
+
+        """
+
+        output = _run("import sys, pcards\n" +
+                      "print('tkinter' in sys.modules)")
+        self.assertEqual(output, "False")
+
+    @unittest.skipIf(tkinter is None, "tkinter is not installed")
+    def test_lazy_attributes(self):
+
+        """
+        Test that the GUI classes are available from the package.
+
+        """
+
+        from pcards.cardimages.cardimages import CardImagesSmall
+        from pcards.widgets.cardhandwidget import CardHandWidget
+        self.assertTrue(pcards.CardImagesSmall is CardImagesSmall)
+        self.assertTrue(pcards.CardHandWidget is CardHandWidget)
+        self.assertTrue("CardImagesLarge" in dir(pcards))
+
+    def test_missing_attribute(self):
+
+        """
+        Test that an AttributeError is raised for unknown attributes.
+
+        """
+
+        self.assertRaises(AttributeError, getattr, pcards, "NoSuchClass")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""
+Test module for incremental PokerHand evaluation.
+"""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import random
+import unittest
+
+from pcards import Card, Deck, PokerHand
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """
+    Test sequence class for incremental poker hand evaluation.
+    """
+
+    def setUp(self):
+        self.rng = random.Random(20131)
+
+    def assert_fresh(self, hand):
+
+        """Asserts that a hand scores the same as a new hand made
+        from the same cards.
+
+        """
+
+        fresh = PokerHand(cardlist=hand.get_list())
+        self.assertEqual(hand.score_int(), fresh.score_int())
+        self.assertEqual(hand.show_value(), fresh.show_value())
+
+    def test_setitem_sequence(self):
+
+        """Test replacing single cards many times."""
+
+        hand = PokerHand(namelist=["AS", "KS", "QS", "JS", "2D"])
+        for _ in range(500):
+            hand[self.rng.randrange(5)] = Card(index=self.rng.randrange(52))
+            self.assert_fresh(hand)
+
+    def test_exchange_sequence(self):
+
+        """Test exchanging cards with a deck many times."""
+
+        deck = Deck()
+        deck.shuffle()
+        hand = PokerHand(deck)
+        for _ in range(200):
+            if len(deck) < 5:
+                deck.shuffle(return_discards=True)
+            hand.exchange(chg="".join(self.rng.sample("1234", 2)))
+            self.assert_fresh(hand)
+
+    def test_grow_and_shrink(self):
+
+        """Test appending and removing cards through six and seven
+        card hands.
+
+        """
+
+        hand = PokerHand(namelist=["9H", "8H", "2C", "3D", "KS"])
+        hand.append(Card(name="7H"))
+        self.assert_fresh(hand)
+        hand.insert(0, Card(name="6H"))
+        self.assertEqual(hand.show_value(short=True), "HI")
+        hand.append(Card(name="5H"))
+        self.assertEqual(len(hand), 8)
+        hand.pop(3)
+        self.assertEqual(hand.show_value(short=True), "SF")
+        del hand[0]
+        self.assert_fresh(hand)
+        hand.remove(Card(name="KD"))
+        self.assert_fresh(hand)
+
+    def test_unnotified_change(self):
+
+        """Test that changes made through get_list() are picked up
+        by the next notified change.
+
+        """
+
+        hand = PokerHand(namelist=["AS", "KS", "QS", "JS", "TS"])
+        hand.get_list().append(Card(name="2C"))
+        hand[0] = Card(name="AD")
+        self.assertEqual(len(hand), 6)
+        self.assert_fresh(hand)
+        self.assertEqual(hand.show_value(short=True), "ST")
+
+    def test_unnotified_replacement(self):
+
+        """Test that cards replaced through get_list(), without
+        changing the number of cards, are picked up by the next
+        notified change.
+
+        """
+
+        hand = PokerHand(namelist=["AS", "KS", "QS", "JS", "2D"])
+        hand.get_list()[4] = Card(name="TS")
+        hand[0] = Card(name="AS")
+        self.assert_fresh(hand)
+        self.assertEqual(hand.show_value(short=True), "RF")
+
+        hand.get_list()[1] = Card(name="KD")
+        hand.append(Card(name="3C"))
+        self.assert_fresh(hand)
+        self.assertEqual(hand.show_value(short=True), "ST")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+"""
+Test module for PokerHand integer scores.
+"""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+
+from pcards import PokerHand
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """
+    Test sequence class for poker hand integer scores.
+    """
+
+    def setUp(self):
+        self.hands = [
+            PokerHand(namelist=["AS", "KS", "QS", "JS", "TS"]),
+            PokerHand(namelist=["9H", "KH", "QH", "JH", "TH"]),
+            PokerHand(namelist=["KC", "KH", "KS", "KD", "AC"]),
+            PokerHand(namelist=["KC", "KH", "KS", "KD", "TC"]),
+            PokerHand(namelist=["3C", "3H", "3S", "5D", "5C"]),
+            PokerHand(namelist=["AC", "KC", "JC", "9C", "TC"]),
+            PokerHand(namelist=["AC", "2H", "3S", "4D", "5C"]),
+            PokerHand(namelist=["7C", "7H", "7S", "2D", "TC"]),
+            PokerHand(namelist=["7C", "7H", "3S", "3D", "TC"]),
+            PokerHand(namelist=["7C", "7H", "3S", "3D", "9C"]),
+            PokerHand(namelist=["7C", "7H", "3S", "4D", "TC"]),
+            PokerHand(namelist=["7C", "5H", "3S", "4D", "9C"]),
+            PokerHand(namelist=["7C", "5H", "3S", "4D", "2C"])
+        ]
+
+    def test_score_is_int(self):
+
+        """
+        Test the score is returned as an integer.
+        """
+
+        for hand in self.hands:
+            self.assertTrue(isinstance(hand.score_int(), int))
+
+    def test_score_order(self):
+
+        """
+        Test better hands have higher scores.
+        """
+
+        for better, worse in zip(self.hands, self.hands[1:]):
+            self.assertTrue(better.score_int() > worse.score_int())
+            self.assertTrue(better > worse)
+
+    def test_score_category(self):
+
+        """
+        Test the category is stored in the top bits of the score.
+        """
+
+        self.assertEqual(self.hands[0].score_int() >> 20, 9)
+        self.assertEqual(self.hands[4].score_int() >> 20, 6)
+        self.assertEqual(self.hands[-1].score_int() >> 20, 0)
+
+    def test_equal_scores(self):
+
+        """
+        Test hands differing only by suit have equal scores.
+        """
+
+        other = PokerHand(namelist=["7D", "7S", "3H", "3C", "TH"])
+        self.assertEqual(other.score_int(), self.hands[8].score_int())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+"""
+Test module for six and seven card PokerHand objects.
+"""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import unittest
+
+from pcards import PokerHand
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """
+    Test sequence class for six and seven card poker hands.
+    """
+
+    def setUp(self):
+        self.flush = PokerHand(namelist=["AS", "KS", "2D", "QS",
+                                         "7C", "9S", "TS"])
+        self.full_house = PokerHand(namelist=["3C", "3H", "3S", "5D",
+                                              "5C", "5H", "KD"])
+        self.straight = PokerHand(namelist=["2C", "3H", "4S", "5D",
+                                            "9C", "AH"])
+
+    def test_seven_card_values(self):
+
+        """
+        Test seven card hands evaluate to their best five cards.
+        """
+
+        self.assertEqual(self.flush.show_value(short=True), "FL")
+        self.assertEqual(self.full_house.show_value(),
+                         "Full house, fives full of threes")
+
+    def test_six_card_value(self):
+
+        """
+        Test a six card hand evaluates to its best five cards.
+        """
+
+        self.assertEqual(self.straight.show_value(short=True), "ST")
+
+    def test_best_five(self):
+
+        """
+        Test best_five() returns the cards making up the best hand.
+        """
+
+        best = self.flush.best_five()
+        self.assertEqual(len(best), 5)
+        self.assertEqual(sorted(best.index_list()),
+                         sorted(PokerHand(namelist=["AS", "KS", "QS", "9S",
+                                                    "TS"]).index_list()))
+        self.assertEqual(best.show_value(short=True), "FL")
+
+    def test_comparisons(self):
+
+        """
+        Test seven card hands compare by their best five cards.
+        """
+
+        self.assertTrue(self.full_house > self.flush)
+        self.assertTrue(self.straight < self.flush)
+        self.assertTrue(self.flush == self.flush.best_five())
+
+    def test_change_to_seven_cards(self):
+
+        """
+        Test a hand is re-evaluated as cards are added.
+        """
+
+        hand = PokerHand(namelist=["2C", "3H", "4S", "5D", "9C"])
+        self.assertEqual(hand.show_value(short=True), "HI")
+        hand.extend(PokerHand(namelist=["AH", "KS"]))
+        self.assertEqual(hand.show_value(short=True), "ST")
+
+    def test_multiple_pack_best_five(self):
+
+        """
+        Test that five of a kind from multiple packs is passed over
+        for the best five cards which can be evaluated, and that
+        best_five() needs five to seven cards.
+        """
+
+        hand = PokerHand(namelist=["AC"] * 5 + ["2C", "3C"])
+        self.assertEqual(hand.show_value(short=True), "FK")
+        self.assertEqual(sorted(hand.best_five().index_list()),
+                         [0, 0, 0, 0, 2])
+        self.assertRaises(NotImplementedError, PokerHand,
+                          namelist=["AC"] * 7)
+
+        hand = PokerHand(namelist=["2C", "3H", "4S", "5D"])
+        self.assertRaises(ValueError, hand.best_five)
+        hand.extend(PokerHand(namelist=["9C", "AH", "KS", "QS"]))
+        self.assertRaises(ValueError, hand.best_five)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+"""Unit test module for the shared five card rank table."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import os
+import random
+import tempfile
+import unittest
+from math import comb
+
+from pcards import evaluate
+from pcards.base.ranktable import (build_rank_table, rank_table,
+                                   RANK_TABLE_SIZE)
+
+try:
+    import numpy
+    from pcards.batch import evaluate_many
+except ImportError:
+    numpy = None
+
+
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for the shared five card rank table."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tempdir = tempfile.TemporaryDirectory()
+        cls.filename = build_rank_table(os.path.join(cls.tempdir.name,
+                                                     "ranks5.tbl"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tempdir.cleanup()
+
+    def setUp(self):
+        self.rng = random.Random(1)
+
+    def colex_position(self, indices):
+
+        """Returns the position of a hand in the rank table."""
+
+        return sum(comb(index, pos) for pos, index in
+                   enumerate(sorted(indices), 1))
+
+    def test_mapped_table(self):
+        table = rank_table(self.filename)
+        self.assertIsInstance(table, memoryview)
+        self.assertEqual(len(table), RANK_TABLE_SIZE)
+        self.assertIs(rank_table(self.filename), table)
+        self.assertEqual(os.path.getsize(self.filename),
+                         16 + 2 * RANK_TABLE_SIZE)
+
+    def test_matches_evaluate(self):
+        table = rank_table(self.filename)
+        for _ in range(2000):
+            hand = self.rng.sample(range(52), 5)
+            self.assertEqual(table[self.colex_position(hand)],
+                             evaluate(hand))
+        self.assertEqual(table[self.colex_position([0, 9, 10, 11, 12])], 1)
+        self.assertEqual(table[0], evaluate([0, 1, 2, 3, 4]))
+        self.assertEqual(table[-1], evaluate([47, 48, 49, 50, 51]))
+
+    def test_missing_file(self):
+        filename = os.path.join(self.tempdir.name, "missing.tbl")
+        self.assertIsNone(rank_table(filename, build=False))
+        table = rank_table(filename)
+        self.assertEqual(len(table), RANK_TABLE_SIZE)
+        self.assertEqual(list(table[:1000]),
+                         list(rank_table(self.filename)[:1000]))
+
+    def test_corrupt_file(self):
+        filename = os.path.join(self.tempdir.name, "corrupt.tbl")
+        with open(self.filename, "rb") as infile:
+            data = bytearray(infile.read())
+        data[1000] ^= 0xFF
+        with open(filename, "wb") as outfile:
+            outfile.write(data)
+        self.assertIsNone(rank_table(filename, build=False))
+        with open(filename, "wb") as outfile:
+            outfile.write(data[:5000])
+        self.assertIsNone(rank_table(filename, build=False))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_batch_evaluation(self):
+        hands = numpy.array([self.rng.sample(range(52), 5)
+                             for _ in range(1000)] +
+                            [[0, 0, 13, 26, 39], [5, 18, 31, 5, 44]])
+        expected = evaluate_many(hands)
+        previous = os.environ.get("PCARDS_RANK_TABLE")
+        os.environ["PCARDS_RANK_TABLE"] = self.filename
+        try:
+            self.assertTrue((evaluate_many(hands) == expected).all())
+        finally:
+            if previous is None:
+                del os.environ["PCARDS_RANK_TABLE"]
+            else:
+                os.environ["PCARDS_RANK_TABLE"] = previous
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_batch_repeated_cards(self):
+        hands = numpy.array([[51, 51, 51, 51, 50], [51, 51, 51, 50, 50],
+                             [47, 48, 49, 50, 51], [12, 12, 12, 12, 12]] +
+                            [self.rng.choices(range(52), k=5)
+                             for _ in range(1000)])
+        expected = evaluate_many(hands)
+        previous = os.environ.get("PCARDS_RANK_TABLE")
+        os.environ["PCARDS_RANK_TABLE"] = self.filename
+        try:
+            self.assertIsNotNone(rank_table(build=False))
+            ranks = evaluate_many(hands)
+        finally:
+            if previous is None:
+                del os.environ["PCARDS_RANK_TABLE"]
+            else:
+                os.environ["PCARDS_RANK_TABLE"] = previous
+        self.assertEqual(ranks.tolist(), expected.tolist())
+        self.assertEqual(ranks[2], evaluate([47, 48, 49, 50, 51]))
+        self.assertEqual(ranks[0], evaluate([12, 25, 38, 51, 50]))
+        self.assertEqual(ranks[3], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
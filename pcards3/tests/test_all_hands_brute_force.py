@@ -2,89 +2,292 @@
 
 """Test to calculate every possible 5-card poker hand using a single
 standard deck with no wildcards, and to ensure that the PokerHand
-functionality from the cards2 module calculates the correct number
+functionality from the pcards module calculates the correct number
 of different hands when run over the entire population.
 
+Six and seven card hands, evaluated on the best five cards which
+can be made from them, can be enumerated in the same way, and the
+hands can be evaluated through PokerHand, through the lookup table
+evaluator, or through the NumPy batch evaluator, so that each can
+be cross-checked against the known counts and the others. The
+number of hands evaluated per second is reported for each.
+
+Usage:
+    test_all_hands_brute_force.py [--cards {5,6,7}]
+                                  [--backend {pokerhand,table,batch}]
+
+The --backend option may be given more than once to run several
+backends in turn. Exits with status 1 if any count is wrong.
+
 """
 
 
-import timeit
+import argparse
+import sys
+import time
+from itertools import chain, combinations
+from math import comb
 
-from pcards import Deck, PokerHand
+from pcards import Card, Deck, PokerHand, rank_category, WORST_RANK
+from pcards.base import evaluator
 
 
-def main():
+# Non-public constants
+
+_HAND_TYPES = ["RF", "SF", "FK", "FH", "FL", "ST", "TK", "TP", "PR", "HI"]
+
+# Category codes returned by rank_category(), indexed by short name.
+
+_CATEGORY_CODES = {
+    "HI": 0, "PR": 1, "TP": 2, "TK": 3, "ST": 4,
+    "FL": 5, "FH": 6, "FK": 7, "SF": 8, "RF": 9
+}
+
+_EXPECTED = {
+    5: {"RF": 4, "SF": 36, "FK": 624, "FH": 3744,
+        "FL": 5108, "ST": 10200, "TK": 54912, "TP": 123552,
+        "PR": 1098240, "HI": 1302540},
+    6: {"RF": 188, "SF": 1656, "FK": 14664, "FH": 165984,
+        "FL": 205792, "ST": 361620, "TK": 732160, "TP": 2532816,
+        "PR": 9730740, "HI": 6612900},
+    7: {"RF": 4324, "SF": 37260, "FK": 224848, "FH": 3473184,
+        "FL": 4047644, "ST": 6180020, "TK": 6461620, "TP": 31433400,
+        "PR": 58627800, "HI": 23294460}
+}
+
+
+# Non-public functions
+
+def _progress(done, total, reported):
+
+    """Prints a status indicator for each further ten percent of
+    hands evaluated, and returns the last percentage reported.
 
     """
-    main() function.
+
+    percent = done * 100 // total // 10 * 10
+    if percent > reported:
+        print("{0}%.....".format(percent), flush=True)
+        return percent
+    return reported
+
+
+def _prefixes(numcards):
+
+    """Yields a tuple of the first numcards - 5 card indices of
+    each hand, and the number of cards following the last of them,
+    from which the remaining five cards are chosen.
+
     """
 
-    hand_types = ["RF", "SF", "FK", "FH", "FL",
-                  "ST", "TK", "TP", "PR", "HI"]
-    types_found = {"RF": 0, "SF": 0, "FK": 0, "FH": 0,
-                   "FL": 0, "ST": 0, "TK": 0, "TP": 0,
-                   "PR": 0, "HI": 0}
-    expected = {"RF": 4, "SF": 36, "FK": 624, "FH": 3744,
-                "FL": 5108, "ST": 10200, "TK": 54912, "TP": 123552,
-                "PR": 1098240, "HI": 1302540}
-    total_expected = 2598960
-    total_hands = 0
-    percent = 0
+    for prefix in combinations(range(52), numcards - 5):
+        yield (prefix, 51 - prefix[-1] if prefix else 52)
 
-    deck = Deck()
-    cards = deck.draw(52)
+
+def _rank_type_counts(rank_counts):
+
+    """Returns a dictionary of hand type counts from a list of
+    counts of each equivalence class rank.
+
+    """
+
+    codes = {code: hand_type for hand_type, code in _CATEGORY_CODES.items()}
+    types_found = {hand_type: 0 for hand_type in _HAND_TYPES}
+    for rank in range(1, WORST_RANK + 1):
+        types_found[codes[rank_category(rank)]] += rank_counts[rank]
+    if rank_counts[0]:
+        types_found["??"] = rank_counts[0]
+    return types_found
+
+
+def _count_pokerhand(numcards):
+
+    """Returns a dictionary of hand type counts for every hand,
+    evaluated by creating a PokerHand instance for each.
+
+    """
+
+    cards = [Card(index=idx) for idx in range(52)]
+    types_found = {hand_type: 0 for hand_type in _HAND_TYPES}
+    total = comb(52, numcards)
+    chunk = total // 50 + 1
+    reported = 0
+
+    # Enumerate the hands lazily from a deck, in chunks, so that the
+    # progress can be reported without holding every hand in memory.
 
     deck = Deck()
-    hand = PokerHand(deck)
+    for start in range(0, total, chunk):
+        for combo in deck.combinations(numcards, start=start,
+                                       stop=start + chunk):
+            hand = PokerHand(cardlist=[cards[idx] for idx in combo])
+            types_found[hand.show_value(short=True)] += 1
+        reported = _progress(min(start + chunk, total), total, reported)
 
-    # Loop through all hands and store number of hand types
+    return types_found
 
-    for a in range(48):
-        for b in range(a + 1, 52):
-            for c in range(b + 1, 52):
-                for d in range(c + 1, 52):
-                    for e in range(d + 1, 52):
-                        cds = [cards[a], cards[b], cards[c],
-                               cards[d], cards[e]]
-                        hand._cards = cds
-                        hand.evaluate()
-                        types_found[hand.show_value(short=True)] += 1
-                        total_hands += 1
 
-                        # Print status indicator
+def _count_table(numcards):
 
-                        if total_hands % 25990 == 0:
-                            percent += 1
-                            print "{0}%.....".format(percent)
+    """Returns a dictionary of hand type counts for every hand,
+    evaluated directly by the lookup table evaluator.
 
-    # Output results
+    """
 
-    sumscores = 0
+    # Disable pylint message for access to protected members of
+    # the evaluator module, which are the functions being tested.
+    #
+    # pylint: disable=W0212
+
+    evaluate_five = evaluator._evaluate_indices
+    evaluate_best = evaluator._evaluate_best
+
+    # pylint: enable=W0212
+
+    rank_counts = [0] * (WORST_RANK + 1)
+    total = comb(52, numcards)
+    done = 0
+    reported = 0
+
+    for prefix, remaining in _prefixes(numcards):
+        start = 52 - remaining
+        if prefix:
+            for rest in combinations(range(start, 52), 5):
+                rank_counts[evaluate_best(prefix + rest)] += 1
+        else:
+            for ix1, ix2, ix3, ix4, ix5 in combinations(range(52), 5):
+                rank_counts[evaluate_five(ix1, ix2, ix3, ix4, ix5)] += 1
+        done += comb(remaining, 5)
+        reported = _progress(done, total, reported)
+
+    return _rank_type_counts(rank_counts)
+
+
+def _count_batch(numcards):
+
+    """Returns a dictionary of hand type counts for every hand,
+    evaluated in blocks by the NumPy batch evaluator.
+
+    """
+
+    import numpy as np
+    from pcards.batch import evaluate_many
+
+    # Every combination of five of the first n cards, in colex order,
+    # so that the combinations of five of the first m cards are the
+    # first comb(m, 5) rows for any m.
+
+    fives = np.fromiter(chain.from_iterable(combinations(range(52), 5)),
+                        dtype=np.int8, count=comb(52, 5) * 5)
+    fives = fives.reshape(-1, 5)
+    fives = fives[np.lexsort(fives.T)]
+
+    rank_counts = np.zeros(WORST_RANK + 1, dtype=np.int64)
+    total = comb(52, numcards)
+    done = 0
+    reported = 0
+
+    for prefix, remaining in _prefixes(numcards):
+        count = comb(remaining, 5)
+        hands = np.empty((count, numcards), dtype=np.int8)
+        hands[:, :len(prefix)] = prefix
+        hands[:, len(prefix):] = fives[:count] + (52 - remaining)
+        rank_counts += np.bincount(evaluate_many(hands),
+                                   minlength=WORST_RANK + 1)
+        done += count
+        reported = _progress(done, total, reported)
+
+    return _rank_type_counts(rank_counts.tolist())
+
+
+_BACKENDS = {
+    "pokerhand": _count_pokerhand,
+    "table": _count_table,
+    "batch": _count_batch
+}
+
+
+def _check(numcards, types_found):
+
+    """Prints the hand type counts against the expected counts, and
+    returns True if they all match.
+
+    """
+
+    expected = _EXPECTED[numcards]
     failed = False
-    for hand_type in hand_types:
+
+    sumscores = 0
+    for hand_type in _HAND_TYPES:
         if expected[hand_type] == types_found[hand_type]:
             result = "passed"
         else:
             result = "failed"
             failed = True
-        print "{0}: {1} expected, {2} found...{3}.".format(
-            hand_type, expected[hand_type], types_found[hand_type], result)
+        print("{0}: {1} expected, {2} found...{3}.".format(
+            hand_type, expected[hand_type], types_found[hand_type], result))
         sumscores += types_found[hand_type]
 
+    if types_found.get("??"):
+        print("Unrankable hands: {0} found...failed.".format(
+            types_found["??"]))
+        failed = True
+
+    total_expected = comb(52, numcards)
     if total_expected == sumscores:
         result = "passed"
     else:
         result = "failed"
         failed = True
-    print "Total hands: {0} expected, {1} found...{2}".format(
-        total_expected, sumscores, result)
+    print("Total hands: {0} expected, {1} found...{2}".format(
+        total_expected, sumscores, result))
+
+    return not failed
+
+
+def main():
+
+    """
+    main() function.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Evaluate and count every possible poker hand.")
+    parser.add_argument("--cards", type=int, choices=sorted(_EXPECTED),
+                        default=5, help="number of cards in each hand")
+    parser.add_argument("--backend", action="append",
+                        choices=sorted(_BACKENDS),
+                        help="evaluator to use, default pokerhand; " +
+                        "may be repeated to cross-check evaluators")
+    args = parser.parse_args()
+
+    passed = True
+    results = {}
+    for backend in args.backend or ["pokerhand"]:
+        print("Evaluating all {0} card hands with the {1} backend."
+              .format(args.cards, backend))
+        start = time.perf_counter()
+        types_found = _BACKENDS[backend](args.cards)
+        elapsed = time.perf_counter() - start
+
+        passed = _check(args.cards, types_found) and passed
+        print("Time taken: {0:.2f} seconds, {1:,.0f} hands per second.\n"
+              .format(elapsed, comb(52, args.cards) / elapsed))
+        results[backend] = types_found
+
+    if len(results) > 1:
+        first = list(results.values())[0]
+        if any(types_found != first for types_found in results.values()):
+            print("Backends disagree with each other.")
+            passed = False
 
-    if not failed:
+    if passed:
         print("All tests passed.")
+        return 0
     else:
         print("SOME TESTS FAILED!")
+        return 1
 
 
 if __name__ == "__main__":
-    print "Time taken: {0:.2} seconds.".format(timeit.timeit("main()",
-                            setup="from __main__ import main", number=1))
+    sys.exit(main())
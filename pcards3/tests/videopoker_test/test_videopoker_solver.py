@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+"""Unit test module for video poker hold solver functions."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import random
+import unittest
+from itertools import combinations
+
+from pcards import Card, PokerHand
+
+try:
+    import numpy
+    from pcards.videopoker import hold_values, best_hold
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for video poker hold solver functions."""
+
+    def brute_force_value(self, dealt, hold, easy=False):
+
+        """Returns the expected return of a hold calculated by
+        drawing every possible replacement into a PokerHand.
+
+        """
+
+        held = [dealt[pos] for pos in range(5) if hold & (1 << pos)]
+        remaining = [idx for idx in range(52) if idx not in dealt]
+        total = 0
+        count = 0
+        for draw in combinations(remaining, 5 - len(held)):
+            cards = [Card(index=idx) for idx in held + list(draw)]
+            total += PokerHand(cardlist=cards).video_winnings(1, easy)
+            count += 1
+        return total / count
+
+    def test_dealt_royal_flush(self):
+        result = best_hold(["AS", "KS", "QS", "JS", "TS"])
+        self.assertEqual(result.hold, 31)
+        self.assertEqual(result.positions, (0, 1, 2, 3, 4))
+        self.assertEqual(result.ev, 800)
+
+    def test_four_to_a_royal(self):
+        values = hold_values(["AS", "KS", "QS", "JS", "2D"])
+        self.assertAlmostEqual(values[15], 872 / 47)
+        result = best_hold(["2D", "AS", "KS", "QS", "JS"])
+        self.assertEqual(result.positions, (1, 2, 3, 4))
+        self.assertAlmostEqual(result.ev, 872 / 47)
+
+    def test_hold_small_pair(self):
+        result = best_hold(["7C", "7H", "2S", "9D", "KC"])
+        self.assertEqual(result.positions, (0, 1))
+
+    def test_hand_forms(self):
+        names = ["3C", "8H", "QS", "QD", "5C"]
+        hand = PokerHand(namelist=names)
+        indices = hand.index_list()
+        self.assertEqual(hold_values(names), hold_values(hand))
+        self.assertEqual(hold_values(names), hold_values(indices))
+
+    def test_matches_brute_force(self):
+        rng = random.Random(1)
+        for _ in range(4):
+            dealt = rng.sample(range(52), 5)
+            values = hold_values(dealt)
+            for hold in rng.sample(range(32), 6):
+                if bin(hold).count("1") < 2:
+                    continue
+                self.assertAlmostEqual(values[hold],
+                                       self.brute_force_value(dealt, hold))
+
+    def test_easy_winnings(self):
+        dealt = [Card(name=name).index() for name in
+                 ["4C", "4H", "9S", "JD", "2C"]]
+        values = hold_values(dealt, easy=True)
+        self.assertAlmostEqual(values[3],
+                               self.brute_force_value(dealt, 3, True))
+        self.assertAlmostEqual(values[31],
+                               self.brute_force_value(dealt, 31, True))
+
+    def test_custom_paytable(self):
+        paytable = [0, 1, 2, 3, 4, 6, 9, 25, 50, 4000]
+        normal = hold_values(["AS", "KS", "QS", "JS", "TS"])
+        custom = hold_values(["AS", "KS", "QS", "JS", "TS"],
+                             paytable=paytable)
+        self.assertEqual(normal[31], 800)
+        self.assertEqual(custom[31], 4000)
+        self.assertGreater(custom[0], normal[0])
+
+    def test_invalid_hands(self):
+        self.assertRaises(ValueError, hold_values, ["AS", "KS", "QS", "JS"])
+        self.assertRaises(ValueError, hold_values,
+                          ["AS", "AS", "QS", "JS", "TS"])
+        self.assertRaises(ValueError, hold_values,
+                          ["AS", "KS", "QS", "JS", "TS"], False, [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+"""Unit test module for video poker strategy files."""
+
+# Disable the following pylint warnings:
+#  - long identifier names, these are deliberate for unittests
+#  - too many public methods, supposed to be lots of tests here
+#
+# pylint: disable=C0103
+# pylint: disable=R0904
+
+
+import os
+import random
+import tempfile
+import unittest
+
+from pcards import PokerHand
+
+try:
+    import numpy
+    from pcards.videopoker import (hold_values, best_hold,
+                                   build_strategy, Strategy)
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestSequenceFunctions(unittest.TestCase):
+
+    """Unit test class for video poker strategy files."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tempdir = tempfile.TemporaryDirectory()
+        cls.filename = os.path.join(cls.tempdir.name, "normal.vps")
+        cls.strategy = build_strategy(cls.filename)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tempdir.cleanup()
+
+    def test_return_to_player(self):
+        self.assertAlmostEqual(self.strategy.return_to_player(),
+                               0.995439, places=6)
+
+    def test_paytable(self):
+
+        # pylint: disable=W0212
+
+        self.assertEqual(self.strategy.paytable(),
+                         tuple(PokerHand._vp_returns_normal))
+
+        # pylint: enable=W0212
+
+    def test_loaded_strategy(self):
+        strategy = Strategy(self.filename)
+        self.assertEqual(strategy.return_to_player(),
+                         self.strategy.return_to_player())
+        result = strategy.best_hold(["AS", "KS", "QS", "JS", "TS"])
+        self.assertEqual(result.hold, 31)
+        self.assertEqual(result.ev, 800)
+
+    def test_suit_permutations(self):
+        result = self.strategy.best_hold(["2D", "AS", "KS", "QS", "JS"])
+        self.assertEqual(result.positions, (1, 2, 3, 4))
+        result = self.strategy.best_hold(["JH", "2C", "QH", "AH", "KH"])
+        self.assertEqual(result.positions, (0, 2, 3, 4))
+        self.assertAlmostEqual(result.ev, 872 / 47, places=5)
+
+    def test_matches_solver(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            dealt = rng.sample(range(52), 5)
+            result = self.strategy.best_hold(dealt)
+            expected = best_hold(dealt)
+            values = hold_values(dealt)
+            self.assertAlmostEqual(result.ev, expected.ev, places=4)
+            self.assertAlmostEqual(values[result.hold], expected.ev)
+            self.assertEqual(result.positions,
+                             tuple(pos for pos in range(5)
+                                   if result.hold & (1 << pos)))
+
+    def test_invalid_file(self):
+        filename = os.path.join(self.tempdir.name, "invalid.vps")
+        with open(filename, "wb") as outfile:
+            outfile.write(b"PCVS")
+        self.assertRaises(ValueError, Strategy, filename)
+
+    def test_invalid_hand(self):
+        self.assertRaises(ValueError, self.strategy.best_hold,
+                          ["AS", "KS", "QS", "JS"])
+
+
+if __name__ == '__main__':
+    unittest.main()